@@ -73,6 +73,8 @@ _database_localmongodb = {
     'keyfile': None,
     'keyfile_passphrase': None,
     'crlfile': None,
+    # write concern of the writes committing a block, e.g. `majority`
+    'write_concern': None,
 }
 _database_localmongodb.update(_base_database_localmongodb)
 
@@ -1,5 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pymongo import WriteConcern
+
+import bigchaindb
 from bigchaindb.backend.mongodb.connection import MongoDBConnection
 
 
 class LocalMongoDBConnection(MongoDBConnection):
-    pass
+
+    def __init__(self, write_concern=None, **kwargs):
+        """Create a new Connection instance.
+
+        Args:
+            write_concern (dict|str|int, optional): the write concern of
+                the writes committing a block, either as the keyword
+                arguments of :class:`pymongo.write_concern.WriteConcern`
+                or as the value of its ``w`` option. Defaults to the
+                server's write concern.
+            **kwargs: arbitrary keyword arguments provided by the
+                configuration's ``database`` settings
+        """
+
+        super().__init__(**kwargs)
+        if write_concern is None:
+            write_concern = bigchaindb.config['database'].get('write_concern')
+        self.write_concern = make_write_concern(write_concern)
+        self._commit_executor = None
+
+    @property
+    def commit_executor(self):
+        """The threads running the independent writes of a block commit,
+        started on first use."""
+        if self._commit_executor is None:
+            self._commit_executor = ThreadPoolExecutor(max_workers=3)
+        return self._commit_executor
+
+    def close(self):
+        """Stop the commit threads and close the connection to the
+        server. The connection is opened again on its next use."""
+        if self._commit_executor is not None:
+            self._commit_executor.shutdown()
+            self._commit_executor = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def make_write_concern(value):
+    """Build a :class:`pymongo.write_concern.WriteConcern` from the
+    configuration value ``value``.
+    """
+    if value is None:
+        return WriteConcern()
+    if isinstance(value, dict):
+        return WriteConcern(**value)
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+    return WriteConcern(w=value)
@@ -1,6 +1,7 @@
 """Query implementation for MongoDB"""
 
-from pymongo import DESCENDING
+from bson.son import SON
+from pymongo import ASCENDING, DESCENDING, DeleteOne, InsertOne, WriteConcern
 
 from bigchaindb import backend
 from bigchaindb.backend.exceptions import DuplicateKeyError
@@ -8,7 +9,6 @@ from bigchaindb.common.exceptions import MultipleValidatorOperationError
 from bigchaindb.backend.utils import module_dispatch_registrar
 from bigchaindb.backend.localmongodb.connection import LocalMongoDBConnection
 from bigchaindb.common.transaction import Transaction
-from bigchaindb.backend import mongodb
 from bigchaindb.backend.query import VALIDATOR_UPDATE_ID
 
 register_query = module_dispatch_registrar(backend.query)
@@ -51,6 +51,38 @@ def get_transactions(conn, transaction_ids):
         pass
 
 
+@register_query(LocalMongoDBConnection)
+def get_full_transactions(conn, transaction_ids):
+    cursor = conn.run(
+        conn.collection('transactions').aggregate([
+            {'$match': {'id': {'$in': transaction_ids}}},
+            {'$lookup': {'from': 'assets', 'localField': 'id',
+                         'foreignField': 'id', 'as': '_assets'}},
+            {'$lookup': {'from': 'metadata', 'localField': 'id',
+                         'foreignField': 'id', 'as': '_metadata'}},
+            {'$project': {'_id': False,
+                          '_assets._id': False, '_assets.id': False,
+                          '_metadata._id': False, '_metadata.id': False}},
+        ]))
+    return (_join_transaction(tx) for tx in cursor)
+
+
+def _join_transaction(tx):
+    assets = tx.pop('_assets')
+    metadata = tx.pop('_metadata')
+    if tx['operation'] == 'CREATE':
+        tx['asset'] = assets[0] if assets else {'data': None}
+    tx['metadata'] = metadata[0]['metadata'] if metadata else None
+    return tx
+
+
+@register_query(LocalMongoDBConnection)
+def get_transaction_ids(conn):
+    return conn.run(
+        conn.collection('transactions')
+        .find({}, projection={'_id': False, 'id': True}))
+
+
 @register_query(LocalMongoDBConnection)
 def store_metadatas(conn, metadata):
     return conn.run(
@@ -109,6 +141,15 @@ def get_latest_block(conn):
         .find_one(sort=[('height', DESCENDING)]))
 
 
+@register_query(LocalMongoDBConnection)
+def get_blocks(conn, from_height, to_height):
+    return conn.run(
+        conn.collection('blocks')
+        .find({'height': {'$gte': from_height, '$lte': to_height}},
+              projection={'_id': False})
+        .sort('height', ASCENDING))
+
+
 @register_query(LocalMongoDBConnection)
 def store_block(conn, block):
     try:
@@ -119,8 +160,49 @@ def store_block(conn, block):
         pass
 
 
+def _committing(conn, name):
+    return conn.collection(name).with_options(
+        write_concern=conn.write_concern)
+
+
 @register_query(LocalMongoDBConnection)
-def get_txids_filtered(conn, asset_id, operation=None):
+def store_block_writes(conn, block, transactions, assets, metadata,
+                       spent_outputs, unspent_outputs):
+    # NOTE: the writes are issued in three steps, each depending on the
+    # previous one for crash recovery: the transactions must be stored
+    # before the UTXO set changes (which are rolled back from them), and
+    # the block must be stored last.
+    writes = [(_committing(conn, 'transactions')
+               .insert_many(transactions, ordered=False))]
+    if assets:
+        writes.append(_committing(conn, 'assets')
+                      .insert_many(assets, ordered=False))
+    if metadata:
+        writes.append(_committing(conn, 'metadata')
+                      .insert_many(metadata, ordered=False))
+    # NOTE: the connection is opened lazily, open it before the threads
+    # of `commit_executor` share it
+    conn.conn
+    futures = [conn.commit_executor.submit(conn.run, write)
+               for write in writes]
+    for future in futures:
+        future.result()
+
+    requests = [DeleteOne({'transaction_id': spent_output['transaction_id'],
+                           'output_index': spent_output['output_index']})
+                for spent_output in spent_outputs]
+    requests.extend(InsertOne(unspent_output)
+                    for unspent_output in unspent_outputs)
+    if requests:
+        conn.run(_committing(conn, 'utxos')
+                 .bulk_write(requests, ordered=False))
+
+    return conn.run(_committing(conn, 'blocks').insert_one(block))
+
+
+@register_query(LocalMongoDBConnection)
+def get_txids_filtered(conn, asset_id, operation=None, *, after=None,
+                       limit=0):
     match_create = {
         'operation': 'CREATE',
         'id': asset_id
@@ -137,9 +219,17 @@ def get_txids_filtered(conn, asset_id, operation=None):
     else:
         match = {'$or': [match_create, match_transfer]}
 
+    if after is not None:
+        match = {'$and': [match, {'id': {'$gt': after}}]}
+
     pipeline = [
-        {'$match': match}
+        {'$match': match},
+        {'$project': {'_id': False, 'id': True}},
     ]
+    if after is not None or limit:
+        pipeline.insert(1, {'$sort': {'id': ASCENDING}})
+    if limit:
+        pipeline.insert(2, {'$limit': limit})
     cursor = conn.run(
         conn.collection('transactions')
         .aggregate(pipeline))
@@ -147,17 +237,44 @@ def get_txids_filtered(conn, asset_id, operation=None):
 
 
 @register_query(LocalMongoDBConnection)
-def text_search(*args, **kwargs):
-    return mongodb.query.text_search(*args, **kwargs)
+def text_search(conn, search, *, language='english', case_sensitive=False,
+                diacritic_sensitive=False, text_score=False, limit=0,
+                table='assets', after=None):
+    pipeline = [
+        {'$match': {'$text': {
+            '$search': search,
+            '$language': language,
+            '$caseSensitive': case_sensitive,
+            '$diacriticSensitive': diacritic_sensitive}}},
+        {'$addFields': {'score': {'$meta': 'textScore'}}},
+        {'$sort': SON([('score', DESCENDING), ('id', ASCENDING)])},
+        {'$project': {'_id': False}},
+    ]
+    if after is not None:
+        score, id_ = after
+        pipeline.insert(2, {'$match': {'$or': [
+            {'score': {'$lt': score}},
+            {'score': score, 'id': {'$gt': id_}},
+        ]}})
+    if limit:
+        pipeline.append({'$limit': limit})
+    if not text_score:
+        pipeline.append({'$project': {'score': False}})
+    return conn.run(conn.collection(table).aggregate(pipeline))
 
 
 @register_query(LocalMongoDBConnection)
-def get_owned_ids(conn, owner):
+def get_owned_ids(conn, owner, *, from_id=None):
+    match = {'outputs.public_keys': owner}
+    pipeline = [
+        {'$match': match},
+        {'$project': {'_id': False}},
+    ]
+    if from_id is not None:
+        match['id'] = {'$gte': from_id}
+        pipeline.insert(1, {'$sort': {'id': ASCENDING}})
     cursor = conn.run(
-        conn.collection('transactions').aggregate([
-            {'$match': {'outputs.public_keys': owner}},
-            {'$project': {'_id': False}}
-        ]))
+        conn.collection('transactions').aggregate(pipeline))
     return cursor
 
 
@@ -175,6 +292,25 @@ def get_spending_transactions(conn, inputs):
     return cursor
 
 
+@register_query(LocalMongoDBConnection)
+def get_spending_transaction_inputs(conn, inputs):
+    return conn.run(
+        conn.collection('transactions')
+        .find({'inputs.fulfills': {'$in': inputs}},
+              projection={'_id': False, 'id': True,
+                          'inputs.fulfills': True}))
+
+
+@register_query(LocalMongoDBConnection)
+def get_transaction_outputs(conn, transaction_ids):
+    return conn.run(
+        conn.collection('transactions')
+        .find({'id': {'$in': transaction_ids}},
+              projection={'_id': False, 'id': True, 'operation': True,
+                          'asset.id': True, 'outputs.amount': True,
+                          'outputs.condition.uri': True}))
+
+
 @register_query(LocalMongoDBConnection)
 def get_block(conn, block_id):
     return conn.run(
@@ -275,3 +411,25 @@ def delete_validator_update(conn, update_id=VALIDATOR_UPDATE_ID):
         conn.collection('validators')
         .delete_one({'update_id': update_id})
     )
+
+
+# The traces are written without waiting for an acknowledgement, to keep
+# them off the critical path of the commit.
+ABCI_TRACE_WRITE_CONCERN = WriteConcern(w=0)
+
+
+@register_query(LocalMongoDBConnection)
+def store_abci_trace(conn, trace):
+    return conn.run(
+        conn.collection('abci_traces')
+        .with_options(write_concern=ABCI_TRACE_WRITE_CONCERN)
+        .insert_one(trace))
+
+
+@register_query(LocalMongoDBConnection)
+def get_abci_traces(conn, limit):
+    return conn.run(
+        conn.collection('abci_traces')
+        .find(projection={'_id': False})
+        .sort('$natural', DESCENDING)
+        .limit(limit))
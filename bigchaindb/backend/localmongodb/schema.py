@@ -13,6 +13,9 @@ from bigchaindb.backend.localmongodb.connection import LocalMongoDBConnection
 logger = logging.getLogger(__name__)
 register_schema = module_dispatch_registrar(backend.schema)
 
+# Size, in bytes, of the capped collection holding the block traces
+ABCI_TRACES_SIZE = 16 * 1024 * 1024
+
 
 @register_schema(LocalMongoDBConnection)
 def create_database(conn, dbname):
@@ -34,6 +37,19 @@ def create_tables(conn, dbname):
         # TODO: read and write concerns can be declared here
         conn.conn[dbname].create_collection(table_name)
 
+    create_abci_traces_table(conn, dbname)
+
+
+@register_schema(LocalMongoDBConnection)
+def create_abci_traces_table(conn, dbname):
+    # NOTE: inserting into a missing collection would create it uncapped
+    if 'abci_traces' in conn.conn[dbname].collection_names():
+        return
+
+    logger.info('Create `abci_traces` table.')
+    conn.conn[dbname].create_collection('abci_traces', capped=True,
+                                        size=ABCI_TRACES_SIZE)
+
 
 @register_schema(LocalMongoDBConnection)
 def create_indexes(conn, dbname):
@@ -55,17 +71,25 @@ def create_transactions_secondary_index(conn, dbname):
     logger.info('Create `transactions` secondary index.')
 
     # to query the transactions for a transaction id, this field is unique
-    conn.conn[dbname]['transactions'].create_index('transactions.id',
-                                                   name='transaction_id')
+    conn.conn[dbname]['transactions'].create_index('id',
+                                                   name='transaction_id',
+                                                   unique=True)
 
-    # secondary index for asset uuid, this field is unique
+    # secondary index for asset uuid, with the transaction id to page
+    # through the transactions of an asset
     conn.conn[dbname]['transactions']\
-        .create_index('asset.id', name='asset_id')
+        .create_index([
+            ('asset.id', ASCENDING),
+            ('id', ASCENDING),
+        ], name='asset_id')
 
-    # secondary index on the public keys of outputs
+    # secondary index on the public keys of outputs, with the transaction
+    # id to page through the outputs of a public key
     conn.conn[dbname]['transactions']\
-        .create_index('outputs.public_keys',
-                      name='outputs')
+        .create_index([
+            ('outputs.public_keys', ASCENDING),
+            ('id', ASCENDING),
+        ], name='outputs')
 
     # secondary index on inputs/transaction links (transaction_id, output)
     conn.conn[dbname]['transactions']\
@@ -74,6 +98,11 @@ def create_transactions_secondary_index(conn, dbname):
             ('inputs.fulfills.output_index', ASCENDING),
         ], name='inputs')
 
+    # secondary index on the links themselves, to look up the transactions
+    # spending any of a list of outputs
+    conn.conn[dbname]['transactions']\
+        .create_index('inputs.fulfills', name='fulfills')
+
 
 def create_assets_secondary_index(conn, dbname):
     logger.info('Create `assets` secondary index.')
@@ -89,9 +118,15 @@ def create_assets_secondary_index(conn, dbname):
 
 
 def create_blocks_secondary_index(conn, dbname):
+    logger.info('Create `blocks` secondary index.')
+
     conn.conn[dbname]['blocks']\
         .create_index([('height', DESCENDING)], name='height')
 
+    # to find the block a transaction is in
+    conn.conn[dbname]['blocks']\
+        .create_index('transactions', name='transactions')
+
 
 def create_metadata_secondary_index(conn, dbname):
     logger.info('Create `assets` secondary index.')
@@ -129,3 +164,81 @@ def create_validators_secondary_index(conn, dbname):
     conn.conn[dbname]['validators'].create_index('update_id',
                                                  name='update_id',
                                                  unique=True,)
+
+
+# The queries of :mod:`bigchaindb.backend.localmongodb.query`, as
+# (name, collection, filter, sort), with placeholder values. Aggregations are
+# given by their leading ``$match``, which is planned like a ``find``.
+# Full scans by design and text searches are left out, see
+# ``UNINDEXED_QUERIES``.
+INDEXED_QUERIES = (
+    ('get_transaction', 'transactions', {'id': ''}, None),
+    ('get_transactions', 'transactions', {'id': {'$in': ['']}}, None),
+    ('get_full_transactions', 'transactions', {'id': {'$in': ['']}}, None),
+    ('get_spent', 'transactions',
+     {'inputs.fulfills.transaction_id': '',
+      'inputs.fulfills.output_index': 0}, None),
+    ('get_txids_filtered', 'transactions',
+     {'$or': [{'operation': 'CREATE', 'id': ''},
+              {'operation': 'TRANSFER', 'asset.id': ''}]}, None),
+    ('get_txids_filtered', 'transactions',
+     {'$and': [{'$or': [{'operation': 'CREATE', 'id': ''},
+                        {'operation': 'TRANSFER', 'asset.id': ''}]},
+               {'id': {'$gt': ''}}]}, [('id', ASCENDING)]),
+    ('get_owned_ids', 'transactions', {'outputs.public_keys': ''}, None),
+    ('get_owned_ids', 'transactions',
+     {'outputs.public_keys': '', 'id': {'$gte': ''}}, [('id', ASCENDING)]),
+    ('get_spending_transactions', 'transactions',
+     {'inputs.fulfills': {'$in': [{'transaction_id': '',
+                                   'output_index': 0}]}}, None),
+    ('get_spending_transaction_inputs', 'transactions',
+     {'inputs.fulfills': {'$in': [{'transaction_id': '',
+                                   'output_index': 0}]}}, None),
+    ('get_transaction_outputs', 'transactions', {'id': {'$in': ['']}}, None),
+    ('delete_transactions', 'transactions', {'id': {'$in': ['']}}, None),
+    ('delete_transactions', 'assets', {'id': {'$in': ['']}}, None),
+    ('delete_transactions', 'metadata', {'id': {'$in': ['']}}, None),
+    ('get_metadata', 'metadata', {'id': {'$in': ['']}}, None),
+    ('get_asset', 'assets', {'id': ''}, None),
+    ('get_latest_block', 'blocks', {}, [('height', DESCENDING)]),
+    ('get_blocks', 'blocks', {'height': {'$gte': 0, '$lte': 0}},
+     [('height', ASCENDING)]),
+    ('get_block', 'blocks', {'height': 0}, None),
+    ('get_block_with_transaction', 'blocks', {'transactions': ''}, None),
+    ('store_block_writes', 'utxos',
+     {'transaction_id': '', 'output_index': 0}, None),
+    ('get_unspent_outputs', 'utxos',
+     {'transaction_id': '', 'output_index': 0}, None),
+    ('delete_unspent_outputs', 'utxos',
+     {'$or': [{'$and': [{'transaction_id': ''}, {'output_index': 0}]}]},
+     None),
+    ('store_pre_commit_state', 'pre_commit', {'commit_id': ''}, None),
+    ('get_pre_commit_state', 'pre_commit', {'commit_id': ''}, None),
+    ('get_validator_update', 'validators', {'update_id': ''}, None),
+    ('delete_validator_update', 'validators', {'update_id': ''}, None),
+)
+
+# The queries of :mod:`bigchaindb.backend.localmongodb.query` scanning
+# their collection by design, or using a text index.
+UNINDEXED_QUERIES = ('get_transaction_ids', 'get_abci_traces', 'text_search')
+
+
+def _plan_stages(plan):
+    yield plan['stage']
+    if 'inputStage' in plan:
+        yield from _plan_stages(plan['inputStage'])
+    for stage in plan.get('inputStages', ()):
+        yield from _plan_stages(stage)
+
+
+@register_schema(LocalMongoDBConnection)
+def check_indexes(conn, dbname):
+    collscans = []
+    for name, collection, filter_, sort in INDEXED_QUERIES:
+        cursor = conn.conn[dbname][collection].find(filter_)
+        if sort:
+            cursor = cursor.sort(sort)
+        plan = cursor.explain()['queryPlanner']['winningPlan']
+        if 'COLLSCAN' in _plan_stages(plan):
+            collscans.append((name, collection))
+    return collscans
@@ -1,5 +1,6 @@
 import time
 import logging
+import threading
 from ssl import CERT_REQUIRED
 
 import pymongo
@@ -39,6 +40,10 @@ class MongoDBConnection(Connection):
         self.keyfile = keyfile or bigchaindb.config['database'].get('keyfile', None)
         self.keyfile_passphrase = keyfile_passphrase or bigchaindb.config['database'].get('keyfile_passphrase', None)
         self.crlfile = crlfile or bigchaindb.config['database'].get('crlfile', None)
+        # total time, in seconds, spent running queries, possibly from
+        # several threads
+        self.query_time = 0.0
+        self._query_time_lock = threading.Lock()
 
     @property
     def db(self):
@@ -56,6 +61,7 @@ class MongoDBConnection(Connection):
         return self.query()[self.dbname][name]
 
     def run(self, query):
+        start = time.perf_counter()
         try:
             try:
                 return query.run(self.conn)
@@ -69,6 +75,10 @@ class MongoDBConnection(Connection):
             raise DuplicateKeyError from exc
         except pymongo.errors.OperationFailure as exc:
             raise OperationError from exc
+        finally:
+            duration = time.perf_counter() - start
+            with self._query_time_lock:
+                self.query_time += duration
 
     def _connect(self):
         """Try to connect to the database.
@@ -2,7 +2,7 @@
 
 from time import time
 
-from pymongo import ReturnDocument
+from pymongo import ASCENDING, ReturnDocument
 
 from bigchaindb import backend
 from bigchaindb.backend.mongodb.changefeed import run_changefeed
@@ -99,7 +99,8 @@ def get_blocks_status_from_transaction(conn, transaction_id):
 
 
 @register_query(MongoDBConnection)
-def get_txids_filtered(conn, asset_id, operation=None):
+def get_txids_filtered(conn, asset_id, operation=None, *, after=None,
+                       limit=0):
     match_create = {
         'block.transactions.operation': 'CREATE',
         'block.transactions.id': asset_id
@@ -122,6 +123,12 @@ def get_txids_filtered(conn, asset_id, operation=None):
         {'$match': match},
         {'$project': {'block.transactions.id': True}}
     ]
+    if after is not None:
+        pipeline.append({'$match': {'block.transactions.id': {'$gt': after}}})
+    if after is not None or limit:
+        pipeline.append({'$sort': {'block.transactions.id': ASCENDING}})
+    if limit:
+        pipeline.append({'$limit': limit})
     cursor = conn.run(
         conn.collection('bigchain')
         .aggregate(pipeline))
@@ -375,7 +382,7 @@ def text_search(conn, search, *, language='english', case_sensitive=False,
                 '$caseSensitive': case_sensitive,
                 '$diacriticSensitive': diacritic_sensitive}},
               {'score': {'$meta': 'textScore'}, '_id': False})
-        .sort([('score', {'$meta': 'textScore'})])
+        .sort([('score', {'$meta': 'textScore'}), ('id', ASCENDING)])
         .limit(limit))
 
     if text_score:
@@ -106,6 +106,32 @@ def get_transactions(connection, transaction_ids):
     raise NotImplementedError
 
 
+@singledispatch
+def get_full_transactions(connection, transaction_ids):
+    """Get transactions along with their asset and metadata, as they were
+    before being stored.
+
+    Args:
+        transaction_ids (list): list of transaction ids to fetch
+
+    Returns:
+        Iterator of transaction dicts, in no particular order.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_transaction_ids(connection):
+    """Get the ids of all the stored transactions.
+
+    Returns:
+        An iterable of documents holding only the transaction ``id``.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def get_asset(connection, asset_id):
     """Get a transaction from the transactions table.
@@ -258,11 +284,46 @@ def get_spending_transactions(connection, inputs):
 
 
 @singledispatch
-def get_owned_ids(connection, owner):
+def get_spending_transaction_inputs(connection, inputs):
+    """Get the inputs of the transactions spending any of the given
+    outputs.
+
+    Args:
+        inputs (list): list of {transaction_id, output_index}
+
+    Returns:
+        Iterator of ``{'id': ..., 'inputs': [{'fulfills': ...}, ...]}``
+        for the transactions spending any of the outputs.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_transaction_outputs(connection, transaction_ids):
+    """Get what the validation of an input needs to know about the
+    outputs of the given transactions.
+
+    Args:
+        transaction_ids (list): list of transaction ids to fetch
+
+    Returns:
+        Iterator of ``{'id': ..., 'operation': ..., 'outputs': [{'amount':
+        ..., 'condition': {'uri': ...}}, ...]}``, with ``asset.id`` for
+        ``TRANSFER`` transactions.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_owned_ids(connection, owner, *, from_id=None):
     """Retrieve a list of `txids` that can we used has inputs.
 
     Args:
         owner (str): base58 encoded public key.
+        from_id (str) (optional): only return the transactions with an id
+            greater than or equal to this one, sorted by id.
 
     Returns:
         Iterator of (block_id, transaction) for transactions
@@ -473,12 +534,17 @@ def get_last_voted_block_id(connection, node_pubkey):
 
 
 @singledispatch
-def get_txids_filtered(connection, asset_id, operation=None):
+def get_txids_filtered(connection, asset_id, operation=None, *, after=None,
+                       limit=0):
     """Return all transactions for a particular asset id and optional operation.
 
     Args:
         asset_id (str): ID of transaction that defined the asset
         operation (str) (optional): Operation to filter on
+        after (str) (optional): only return the ids greater than this one.
+        limit (int) (optional): Limit the number of returned ids.
+
+    If ``after`` or ``limit`` is given, the ids are sorted.
     """
 
     raise NotImplementedError
@@ -500,10 +566,11 @@ def get_new_blocks_feed(connection, start_block_id):
 
 @singledispatch
 def text_search(conn, search, *, language='english', case_sensitive=False,
-                diacritic_sensitive=False, text_score=False, limit=0, table=None):
+                diacritic_sensitive=False, text_score=False, limit=0, table=None,
+                after=None):
     """Return all the assets that match the text search.
 
-    The results are sorted by text score.
+    The results are sorted by text score, then by id.
     For more information about the behavior of text search on MongoDB see
     https://docs.mongodb.com/manual/reference/operator/query/text/#behavior
 
@@ -519,6 +586,8 @@ def text_search(conn, search, *, language='english', case_sensitive=False,
         text_score (bool, optional): If ``True`` returns the text score with
             each document.
         limit (int, optional): Limit the number of returned documents.
+        after (tuple, optional): only return the documents after the one
+            with this ``(score, id)``, in the order of the results.
 
     Returns:
         :obj:`list` of :obj:`dict`: a list of assets
@@ -538,6 +607,18 @@ def get_latest_block(conn):
     raise NotImplementedError
 
 
+@singledispatch
+def get_blocks(conn, from_height, to_height):
+    """Get the committed blocks with a height between ``from_height`` and
+    ``to_height`` (both included), ordered by height.
+
+    Returns:
+        An iterator of blocks.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def store_block(conn, block):
     """Write a new block to the `blocks` table
@@ -552,6 +633,32 @@ def store_block(conn, block):
     raise NotImplementedError
 
 
+@singledispatch
+def store_block_writes(conn, block, transactions, assets, metadata,
+                       spent_outputs, unspent_outputs):
+    """Store a committed block together with everything it changes.
+
+    The writes are grouped and issued in as few round trips as the
+    backend allows. The block is always written last, so that a block
+    is only visible once all its data is stored (see ``run_recover``).
+
+    Args:
+        block (dict): block with current height and block hash.
+        transactions (list): the transactions of the block, without
+            asset and metadata.
+        assets (list): the assets created by the block.
+        metadata (list): the metadata of the transactions.
+        spent_outputs (list): the outputs to remove from the UTXO set,
+            as ``transaction_id``/``output_index`` dictionaries.
+        unspent_outputs (list): the outputs to add to the UTXO set.
+
+    Returns:
+        The result of the operation.
+    """
+
+    raise NotImplementedError
+
+
 @singledispatch
 def store_unspent_outputs(connection, unspent_outputs):
     """Store unspent outputs in ``utxo_set`` table."""
@@ -645,3 +752,30 @@ def delete_validator_update(conn, id):
     """Set the sync status for validator update documents"""
 
     raise NotImplementedError
+
+
+@singledispatch
+def store_abci_trace(conn, trace):
+    """Store the performance trace of a block.
+
+    The traces are kept in a bounded collection, the oldest ones being
+    dropped. Storing a trace does not wait for the acknowledgement of
+    the database.
+
+    Args:
+        trace (dict): the trace, as built by
+            :class:`~bigchaindb.tendermint.trace.BlockTrace`.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def get_abci_traces(conn, limit):
+    """Get the most recent performance traces, newest first.
+
+    Args:
+        limit (int): the maximum number of traces to return.
+    """
+
+    raise NotImplementedError
@@ -81,6 +81,34 @@ def drop_database(connection, dbname):
     raise NotImplementedError
 
 
+@singledispatch
+def check_indexes(connection, dbname):
+    """Explain the queries BigchainDB runs, and find those that would scan
+    a whole collection.
+
+    Args:
+        dbname (str): the name of the database to check.
+
+    Returns:
+        list: the ``(query name, collection)`` pairs of the queries not
+        served by an index.
+    """
+
+    raise NotImplementedError
+
+
+@singledispatch
+def create_abci_traces_table(connection, dbname):
+    """Create the capped table holding the block traces, unless it already
+    exists.
+
+    Args:
+        dbname (str): the name of the database to create the table in.
+    """
+
+    raise NotImplementedError
+
+
 def init_database(connection=None, dbname=None):
     """Initialize the configured backend for use with BigchainDB.
 
@@ -21,7 +21,8 @@ from bigchaindb.commands.utils import (
     configure_bigchaindb, start_logging_process, input_on_stderr)
 from bigchaindb.backend.query import VALIDATOR_UPDATE_ID, PRE_COMMIT_ID
 from bigchaindb.tendermint.lib import BigchainDB
-from bigchaindb.tendermint.utils import public_key_from_base64
+from bigchaindb.tendermint.utils import (public_key_from_base64,
+                                         signal_validator_update)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -112,6 +113,12 @@ def run_upsert_validator(args):
         logger.error('A validator update is pending to be applied. '
                      'Please re-try after the current update has '
                      'been processed.')
+        return
+
+    if not signal_validator_update():
+        print('Could not signal BigchainDB, is it running on this host? '
+              'The validator update will be applied when it (re)starts.',
+              file=sys.stderr)
 
 
 def _run_init():
@@ -151,6 +158,22 @@ def run_drop(args):
         print("Cannot drop '{name}'. The database does not exist.".format(name=dbname), file=sys.stderr)
 
 
+@configure_bigchaindb
+def run_index_check(args):
+    """Check that the queries of the node are served by indexes"""
+    conn = backend.connect()
+    dbname = bigchaindb.config['database']['name']
+
+    collscans = schema.check_indexes(conn, dbname)
+    for name, collection in collscans:
+        print('{}: collection scan on `{}`'.format(name, collection))
+    if collscans:
+        print('Some queries are not served by an index, you may need to '
+              'create the missing indexes.', file=sys.stderr)
+        sys.exit(1)
+    print('All the queries are served by an index.', file=sys.stderr)
+
+
 def run_recover(b):
     pre_commit = query.get_pre_commit_state(b.connection, PRE_COMMIT_ID)
 
@@ -161,6 +184,7 @@ def run_recover(b):
         # NOTE: the pre-commit state can only be ahead of the commited state
         # by 1 block
         if latest_block and (latest_block['height'] < pre_commit['height']):
+            b.rollback_utxoset(pre_commit['transactions'])
             query.delete_transactions(b.connection, pre_commit['transactions'])
 
 
@@ -230,6 +254,9 @@ def create_parser():
     subparsers.add_parser('drop',
                           help='Drop the database')
 
+    subparsers.add_parser('index-check',
+                          help='Check that the database queries use indexes')
+
     # parser for starting BigchainDB
     start_parser = subparsers.add_parser('start',
                                          help='Start BigchainDB')
@@ -9,7 +9,7 @@ import bigchaindb
 
 from bigchaindb import backend, config_utils, fastquery
 from bigchaindb.consensus import BaseConsensusRules
-from bigchaindb.models import Block, Transaction
+from bigchaindb.models import Block, BlockTransactions, Transaction
 
 
 class Bigchain(object):
@@ -277,6 +277,20 @@ class Bigchain(object):
         else:
             return response
 
+    def get_raw_transaction(self, txid):
+        """Get a transaction in a valid block, as a dict.
+
+        Args:
+            txid (str): transaction id of the transaction to get
+
+        Returns:
+            dict: the transaction, or ``None`` if it was not found in a
+            valid block.
+        """
+        transaction, status = self.get_transaction(txid, include_status=True)
+        if transaction and status == self.TX_VALID:
+            return transaction.to_dict()
+
     def get_status(self, txid):
         """Retrieve the status of a transaction with `txid` from bigchain.
 
@@ -400,6 +414,90 @@ class Bigchain(object):
         # Either no transaction was returned spending the `(txid, output)` as
         # input or the returned transactions are not valid.
 
+    def transaction_exists(self, txid):
+        """Check whether a transaction with id ``txid`` exists.
+
+        Args:
+            txid (str): the id of the transaction.
+
+        Returns:
+            bool: ``True`` if the transaction is known.
+        """
+        return bool(self.get_transaction(txid))
+
+    def get_unspent_output(self, txid, output):
+        """Look up an output in the in-memory UTXO index.
+
+        This implementation does not keep a UTXO index, so the caller
+        always has to resolve the output from the database.
+
+        Returns:
+            None
+        """
+        return None
+
+    def resolve_inputs(self, links, current_transactions=[],
+                       spender_id=None):
+        """Look up the outputs spent by the given inputs.
+
+        Each input is resolved with its own queries, and the transaction
+        it spends has to be in a valid block.
+
+        Args:
+            links (list): the :class:`~bigchaindb.common.transaction.
+                TransactionLink` of the inputs.
+            current_transactions (list|:class:`~bigchaindb.models.
+                BlockTransactions`): transactions of the block being built,
+                which are not yet stored in the database.
+            spender_id (str): the id of the spending transaction, which
+                may already be stored.
+
+        Returns:
+            dict: the :class:`~bigchaindb.common.transaction.UnspentOutput`
+            of each ``(txid, output)`` pair.
+
+        Raises:
+            InputDoesNotExist: if an output does not exist.
+            TransactionNotInValidBlock: if an output is not in a valid
+                block.
+            DoubleSpend: if an output was already spent.
+        """
+        current_transactions = BlockTransactions.of(current_transactions)
+        outputs = {}
+        for link in links:
+            input_tx, status = self.get_transaction(link.txid,
+                                                    include_status=True)
+
+            if input_tx is None:
+                # assume that the status as valid for previously validated
+                # transactions in current round
+                input_tx = current_transactions.get(link.txid)
+                if input_tx is not None:
+                    status = self.TX_VALID
+
+            if input_tx is None or link.output >= len(input_tx.outputs):
+                raise exceptions.InputDoesNotExist("input `{}` doesn't exist"
+                                                   .format(link.txid))
+
+            if status != self.TX_VALID:
+                raise exceptions.TransactionNotInValidBlock(
+                    'input `{}` does not exist in a valid block'.format(
+                        link.txid))
+
+            spent = self.get_spent(link.txid, link.output)
+            spenders = [spender.id for spender in
+                        current_transactions.get_spenders(link.txid,
+                                                          link.output)]
+            if spent:
+                spenders.append(spent.id)
+            if any(spender != spender_id for spender in spenders):
+                raise exceptions.DoubleSpend('input `{}` was already spent'
+                                             .format(link.txid))
+
+            outputs[(link.txid, link.output)] = \
+                list(input_tx.unspent_outputs)[link.output]
+        return outputs
+
     def get_owned_ids(self, owner):
         """Retrieve a list of ``txid`` s that can be used as inputs.
 
@@ -416,7 +514,8 @@ class Bigchain(object):
     def fastquery(self):
         return fastquery.FastQuery(self.connection, self.me)
 
-    def get_outputs_filtered(self, owner, spent=None):
+    def get_outputs_filtered(self, owner, spent=None, *, after=None,
+                             limit=0):
         """Get a list of output links filtered on some criteria
 
         Args:
@@ -424,27 +523,52 @@ class Bigchain(object):
             spent (bool): If ``True`` return only the spent outputs. If
                           ``False`` return only unspent outputs. If spent is
                           not specified (``None``) return all outputs.
+            after (tuple): if given, only the outputs sorted after this
+                ``(txid, output)`` pair are returned.
+            limit (int): the maximum number of outputs to return, or ``0``
+                for all of them.
 
         Returns:
             :obj:`list` of TransactionLink: list of ``txid`` s and ``output`` s
-            pointing to another transaction's condition
+            pointing to another transaction's condition, sorted by
+            ``(txid, output)`` if ``after`` or ``limit`` is given.
         """
         outputs = self.fastquery.get_outputs_by_public_key(owner)
-        if spent is None:
-            return outputs
-        elif spent is True:
-            return self.fastquery.filter_unspent_outputs(outputs)
+        if spent is True:
+            outputs = self.fastquery.filter_unspent_outputs(outputs)
         elif spent is False:
-            return self.fastquery.filter_spent_outputs(outputs)
+            outputs = self.fastquery.filter_spent_outputs(outputs)
 
-    def get_transactions_filtered(self, asset_id, operation=None):
+        if after is None and not limit:
+            return outputs
+        outputs = sorted(outputs, key=lambda link: (link.txid, link.output))
+        if after is not None:
+            outputs = [link for link in outputs
+                       if (link.txid, link.output) > tuple(after)]
+        return outputs[:limit or None]
+
+    def get_transactions_filtered(self, asset_id, operation=None, *,
+                                  after=None, limit=0):
         """Get a list of transactions filtered on some criteria
+
+        If ``after`` (a transaction id) or ``limit`` is given, the
+        transactions are sorted by id, starting after ``after``, and at
+        most ``limit`` of them are returned.
         """
+        if limit and after is None:
+            # sort the ids, from the first one
+            after = ''
+        # NOTE: the limit is not applied by the query, as the transactions
+        # not in a valid block are skipped
         txids = backend.query.get_txids_filtered(self.connection, asset_id,
-                                                 operation)
+                                                 operation, after=after)
+        count = 0
         for txid in txids:
+            if limit and count == limit:
+                return
             tx, status = self.get_transaction(txid, True)
             if status == self.TX_VALID:
+                count += 1
                 yield tx
 
     def create_block(self, validated_transactions):
@@ -657,18 +781,21 @@ class Bigchain(object):
         """
         return backend.query.write_metadata(self.connection, metadata)
 
-    def text_search(self, search, *, limit=0, table='assets'):
+    def text_search(self, search, *, limit=0, table='assets',
+                    text_score=False):
         """Return an iterator of assets that match the text search
 
         Args:
             search (str): Text search string to query the text index
             limit (int, optional): Limit the number of returned documents.
+            text_score (bool, optional): If ``True`` returns the text score
+                with each document.
 
         Returns:
             iter: An iterator of assets that match the text search.
         """
         objects = backend.query.text_search(self.connection, search, limit=limit,
-                                            table=table)
+                                            table=table, text_score=text_score)
 
         # TODO: This is not efficient. There may be a more efficient way to
         #       query by storing block ids with the assets and using fastquery.
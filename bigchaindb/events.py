@@ -1,8 +1,14 @@
-from queue import Empty
+import logging
+import pickle
+import time
+from queue import Empty, Full
 from collections import defaultdict
 from multiprocessing import Queue
 
 
+logger = logging.getLogger(__name__)
+
+
 POISON_PILL = 'POISON_PILL'
 
 
@@ -12,7 +18,7 @@ class EventTypes:
     """
 
     # If you add a new Event Type, make sure to add it
-    # to the docs in docs/server/source/event-plugin-api.rst
+    # to the docs in docs/server/source/events/event-plugin-api.rst
     ALL = ~0
     BLOCK_VALID = 1
     BLOCK_INVALID = 2
@@ -37,14 +43,138 @@ class Event:
         self.data = event_data
 
 
+class PickledEvent:
+    """An event serialized once, to be put in several queues.
+
+    A :class:`multiprocessing.Queue` pickles every object put in it, so
+    an event dispatched to N subscribers would be serialized N times.
+    Pickling a :class:`PickledEvent` only copies its bytes, and
+    unpickling it gives back the original :class:`Event`, so the
+    subscribers get the event as usual.
+    """
+
+    __slots__ = ('frame',)
+
+    def __init__(self, event):
+        self.frame = pickle.dumps(event, pickle.HIGHEST_PROTOCOL)
+
+    def __reduce__(self):
+        return (pickle.loads, (self.frame,))
+
+
+class Subscription:
+    """The queue of a subscriber, and how events are delivered to it.
+
+    By default every event is put in the queue as it comes, and the queue
+    is unbounded. A subscriber can instead ask for:
+
+    - batches: lists of up to ``batch_size`` events, delivered at the
+      latest ``batch_latency`` seconds after their first event, so that
+      it wakes up (and pays an IPC round) once per batch;
+    - a bounded queue of ``queue_size`` items (events or batches), with an
+      ``overflow_policy`` telling what to do when it is full: ``block``
+      the exchange (and so every subscriber) until there is room,
+      ``drop_newest`` or ``drop_oldest``.
+    """
+
+    OVERFLOW_POLICIES = ('block', 'drop_newest', 'drop_oldest')
+
+    def __init__(self, name=None, queue_size=0, overflow_policy='block',
+                 batch_size=None, batch_latency=1.0):
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError('Overflow policy must be one of {}'.format(
+                ', '.join(self.OVERFLOW_POLICIES)))
+        self.name = name
+        self.queue = Queue(queue_size)
+        self.overflow_policy = overflow_policy
+        self.batch_size = batch_size
+        self.batch_latency = batch_latency
+        self.batch = []
+        self.batch_deadline = None
+        self.delivered = 0
+        self.dropped = 0
+
+    def put(self, event):
+        """Deliver ``event``, or add it to the current batch."""
+
+        if not self.batch_size:
+            self._deliver(event, 1)
+            return
+
+        if not self.batch:
+            self.batch_deadline = time.monotonic() + self.batch_latency
+        self.batch.append(event)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Deliver the current batch, if any."""
+
+        if self.batch:
+            batch, self.batch = self.batch, []
+            self.batch_deadline = None
+            self._deliver(batch, len(batch))
+
+    def _deliver(self, item, count):
+        if self.overflow_policy == 'block':
+            self.queue.put(item)
+            self.delivered += count
+            return
+
+        try:
+            self.queue.put_nowait(item)
+        except Full:
+            if self.overflow_policy == 'drop_oldest':
+                # NOTE: the oldest item may not be available yet, as the
+                # queue writes to its pipe from a thread; the new one is
+                # dropped instead
+                try:
+                    oldest = self.queue.get_nowait()
+                    evicted = len(oldest) if self.batch_size else 1
+                    self.delivered -= evicted
+                    self.dropped += evicted
+                    self.queue.put_nowait(item)
+                    self.delivered += count
+                    return
+                except (Empty, Full):
+                    pass
+            self.dropped += count
+        else:
+            self.delivered += count
+
+    def metrics(self):
+        """Return the number of events put in the queue and dropped so
+        far, the number of items (events or batches) waiting in the queue,
+        and the number of events waiting for their batch to be full."""
+
+        try:
+            queued = self.queue.qsize()
+        except NotImplementedError:
+            # not available on macOS
+            queued = None
+        return {'delivered': self.delivered,
+                'dropped': self.dropped,
+                'queued': queued,
+                'pending': len(self.batch)}
+
+
 class Exchange:
     """Dispatch events to subscribers."""
 
-    def __init__(self):
+    def __init__(self, metrics_interval=60):
+        """Create a new exchange.
+
+        Args:
+            metrics_interval (float): seconds between two logs of the
+                subscriber metrics, or ``None`` not to log them.
+        """
+
         self.publisher_queue = Queue()
         self.started_queue = Queue()
+        self.metrics_interval = metrics_interval
+        self.metrics_logged = None
 
-        # Map <event_types -> queues>
+        # Map <event_types -> subscriptions>
         self.queues = defaultdict(list)
 
     def get_publisher_queue(self):
@@ -56,10 +186,15 @@ class Exchange:
 
         return self.publisher_queue
 
-    def get_subscriber_queue(self, event_types=None):
+    def get_subscriber_queue(self, event_types=None, **options):
         """Create a new queue for a specific combination of event types
         and return it.
 
+        Args:
+            event_types (int): the types of the events to receive.
+            **options: how to deliver the events, see
+                :class:`Subscription`.
+
         Returns:
             a :class:`multiprocessing.Queue`.
         Raises:
@@ -75,9 +210,14 @@ class Exchange:
         if event_types is None:
             event_types = EventTypes.ALL
 
-        queue = Queue()
-        self.queues[event_types].append(queue)
-        return queue
+        subscription = Subscription(**options)
+        self.queues[event_types].append(subscription)
+        return subscription.queue
+
+    def subscriptions(self):
+        return [subscription
+                for subscriptions in self.queues.values()
+                for subscription in subscriptions]
 
     def dispatch(self, event):
         """Given an event, send it to all the subscribers.
@@ -87,18 +227,66 @@ class Exchange:
                 dispatch to all the subscribers.
         """
 
-        for event_types, queues in self.queues.items():
-            if event.type & event_types:
-                for queue in queues:
-                    queue.put(event)
+        subscriptions = [subscription
+                         for event_types, subscriptions in self.queues.items()
+                         if event.type & event_types
+                         for subscription in subscriptions]
+
+        # serialize the event once for all the subscribers
+        if len(subscriptions) > 1:
+            event = PickledEvent(event)
+
+        for subscription in subscriptions:
+            subscription.put(event)
+
+    def flush(self, force=False):
+        """Deliver the batches that are full or late (or all of them,
+        with ``force``), and return the time to wait for the next one to
+        be late, or ``None`` if there is none."""
+
+        now = time.monotonic()
+        timeout = None
+        for subscription in self.subscriptions():
+            if subscription.batch_deadline is None:
+                continue
+            if force or subscription.batch_deadline <= now:
+                subscription.flush()
+            else:
+                remaining = subscription.batch_deadline - now
+                timeout = remaining if timeout is None else min(timeout,
+                                                                remaining)
+        return timeout
+
+    def log_metrics(self):
+        for index, subscription in enumerate(self.subscriptions()):
+            logger.info('Events subscriber %s: %s',
+                        subscription.name or index, subscription.metrics())
 
     def run(self):
         """Start the exchange"""
         self.started_queue.put('STARTED')
+        timeout = None
+        self.metrics_logged = time.monotonic()
 
         while True:
-            event = self.publisher_queue.get()
+            try:
+                event = self.publisher_queue.get(timeout=timeout)
+            except Empty:
+                event = None
+
             if event == POISON_PILL:
+                self.flush(force=True)
                 return
-            else:
+            elif event is not None:
                 self.dispatch(event)
+            timeout = self.flush()
+
+            if self.metrics_interval is not None:
+                next_log = (self.metrics_logged + self.metrics_interval -
+                            time.monotonic())
+                if next_log <= 0:
+                    self.log_metrics()
+                    self.metrics_logged = time.monotonic()
+                    next_log = self.metrics_interval
+                timeout = next_log if timeout is None else min(timeout,
+                                                               next_log)
@@ -2,10 +2,9 @@ from copy import deepcopy
 
 from bigchaindb.common.crypto import hash_data, PublicKey, PrivateKey
 from bigchaindb.common.exceptions import (InvalidHash, InvalidSignature,
-                                          DoubleSpend, InputDoesNotExist,
-                                          TransactionNotInValidBlock,
-                                          AssetIdMismatch, AmountError,
-                                          SybilError, DuplicateTransaction)
+                                          DoubleSpend, AssetIdMismatch,
+                                          AmountError, SybilError,
+                                          DuplicateTransaction)
 from bigchaindb.common.transaction import Transaction
 from bigchaindb.common.utils import (gen_timestamp, serialize,
                                      validate_txn_obj, validate_key)
@@ -14,11 +13,21 @@ from bigchaindb.backend.schema import validate_language_key
 
 
 class Transaction(Transaction):
-    def validate(self, bigchain, current_transactions=[]):
+    def validate(self, bigchain, current_transactions=[],
+                 verify_signatures=True, signature_batch=None):
         """Validate transaction spend
 
         Args:
             bigchain (Bigchain): an instantiated bigchaindb.Bigchain object.
+            current_transactions (list|:class:`BlockTransactions`):
+                transactions of the block being built, which are not yet
+                stored in the database.
+            verify_signatures (bool): whether to verify the fulfillments of
+                the inputs. Set it to ``False`` only when the same payload
+                is already known to carry valid fulfillments.
+            signature_batch (:class:`~bigchaindb.tendermint.verification.
+                SignatureBatch`, optional): if given, the fulfillments are
+                queued in the batch instead of being verified right away.
 
         Returns:
             The transaction (Transaction) if the transaction is valid else it
@@ -28,47 +37,53 @@ class Transaction(Transaction):
         Raises:
             ValidationError: If the transaction is invalid
         """
-        input_conditions = []
+        current_transactions = BlockTransactions.of(current_transactions)
 
         if self.operation == Transaction.CREATE:
-            duplicates = any(txn for txn in current_transactions if txn.id == self.id)
-            if bigchain.get_transaction(self.to_dict()['id']) or duplicates:
+            duplicates = current_transactions.get(self.id) is not None
+            if duplicates or bigchain.transaction_exists(self.id):
                 raise DuplicateTransaction('transaction `{}` already exists'
                                            .format(self.id))
+
+            # NOTE: the inputs of a `CREATE` transaction do not spend any
+            # output, so there is no condition to check them against.
+            condition_uris = [None for _ in self.inputs]
         elif self.operation == Transaction.TRANSFER:
-            # store the inputs so that we can check if the asset ids match
-            input_txs = []
+            # the outputs committed and unspent are looked up in the UTXO
+            # index, the others are resolved from the database at once
+            outputs = {}
+            unresolved = []
             for input_ in self.inputs:
                 input_txid = input_.fulfills.txid
-                input_tx, status = bigchain.\
-                    get_transaction(input_txid, include_status=True)
-
-                if input_tx is None:
-                    for ctxn in current_transactions:
-                        # assume that the status as valid for previously validated
-                        # transactions in current round
-                        if ctxn.id == input_txid:
-                            input_tx = ctxn
-                            status = bigchain.TX_VALID
-
-                if input_tx is None:
-                    raise InputDoesNotExist("input `{}` doesn't exist"
-                                            .format(input_txid))
-
-                if status != bigchain.TX_VALID:
-                    raise TransactionNotInValidBlock(
-                        'input `{}` does not exist in a valid block'.format(
-                            input_txid))
-
-                spent = bigchain.get_spent(input_txid, input_.fulfills.output,
-                                           current_transactions)
-                if spent and spent.id != self.id:
+                output_index = input_.fulfills.output
+
+                unspent_output = bigchain.get_unspent_output(input_txid,
+                                                             output_index)
+                if unspent_output is None:
+                    unresolved.append(input_.fulfills)
+                    continue
+
+                # NOTE: the output is committed and unspent, so only a
+                # transaction of the current block can spend it.
+                if current_transactions.get_spenders(input_txid,
+                                                     output_index):
                     raise DoubleSpend('input `{}` was already spent'
                                       .format(input_txid))
-
-                output = input_tx.outputs[input_.fulfills.output]
-                input_conditions.append(output)
-                input_txs.append(input_tx)
+                outputs[(input_txid, output_index)] = unspent_output
+
+            if unresolved:
+                outputs.update(bigchain.resolve_inputs(
+                    unresolved, current_transactions, spender_id=self.id))
+
+            spent_outputs = [outputs[(input_.fulfills.txid,
+                                      input_.fulfills.output)]
+                             for input_ in self.inputs]
+            # store the asset ids of the inputs so that we can check if
+            # they match
+            asset_ids = {output.asset_id for output in spent_outputs}
+            input_amount = sum(output.amount for output in spent_outputs)
+            condition_uris = [output.condition_uri
+                              for output in spent_outputs]
 
             # Validate that all inputs are distinct
             links = [i.fulfills.to_uri() for i in self.inputs]
@@ -76,13 +91,14 @@ class Transaction(Transaction):
                 raise DoubleSpend('tx "{}" spends inputs twice'.format(self.id))
 
             # validate asset id
-            asset_id = Transaction.get_asset_id(input_txs)
-            if asset_id != self.asset['id']:
+            if len(asset_ids) > 1:
+                raise AssetIdMismatch(('All inputs of all transactions passed'
+                                       ' need to have the same asset id'))
+            if asset_ids.pop() != self.asset['id']:
                 raise AssetIdMismatch(('The asset id of the input does not'
                                        ' match the asset id of the'
                                        ' transaction'))
 
-            input_amount = sum([input_condition.amount for input_condition in input_conditions])
             output_amount = sum([output_condition.amount for output_condition in self.outputs])
 
             if output_amount != input_amount:
@@ -91,7 +107,9 @@ class Transaction(Transaction):
                                    ' in the outputs `{}`')
                                   .format(input_amount, output_amount))
 
-        if not self.inputs_valid(input_conditions):
+        if signature_batch is not None:
+            signature_batch.add(self, condition_uris)
+        elif verify_signatures and not self._inputs_valid(condition_uris):
             raise InvalidSignature('Transaction signature is invalid.')
 
         return self
@@ -105,6 +123,20 @@ class Transaction(Transaction):
         validate_language_key(tx_body['asset'], 'data')
         return super().from_dict(tx_body)
 
+    @classmethod
+    def from_trusted_dict(cls, tx_body):
+        """Build a transaction from a dict this node already validated,
+        e.g. one read from its own database.
+
+        Unlike :meth:`from_dict`, the id, the schema and the keys of
+        ``tx_body`` are not checked again. It is only meant for the
+        committed transactions read by
+        :class:`~bigchaindb.tendermint.lib.BigchainDB`: :meth:`from_db`
+        also reads the undecided transactions of other nodes, and checks
+        them.
+        """
+        return super().from_dict(tx_body)
+
     @classmethod
     def from_db(cls, bigchain, tx_dict_list):
         """Helper method that reconstructs a transaction dict that was returned
@@ -548,3 +580,50 @@ class FastTransaction:
 
     def to_dict(self):
         return self.data
+
+
+class BlockTransactions:
+    """The transactions of the block being built, indexed by id and by
+    the outputs they spend.
+
+    Validating a transaction against the rest of its block (duplicate
+    ``CREATE``, inputs created or spent earlier in the block) is then a
+    dictionary lookup rather than a scan of the whole block.
+    """
+
+    def __init__(self, transactions=()):
+        self.transactions = []
+        self.by_id = {}
+        self.spenders = {}
+        for transaction in transactions:
+            self.append(transaction)
+
+    @classmethod
+    def of(cls, transactions):
+        """Return ``transactions`` as a :class:`BlockTransactions`,
+        indexing them if they are a plain list."""
+        if isinstance(transactions, cls):
+            return transactions
+        return cls(transactions)
+
+    def append(self, transaction):
+        self.transactions.append(transaction)
+        self.by_id[transaction.id] = transaction
+        for input_ in transaction.inputs:
+            if input_.fulfills:
+                key = (input_.fulfills.txid, input_.fulfills.output)
+                self.spenders.setdefault(key, []).append(transaction)
+
+    def get(self, txid):
+        """Return the transaction with id ``txid``, or ``None``."""
+        return self.by_id.get(txid)
+
+    def get_spenders(self, txid, output):
+        """Return the transactions spending the given output."""
+        return self.spenders.get((txid, output), [])
+
+    def __iter__(self):
+        return iter(self.transactions)
+
+    def __len__(self):
+        return len(self.transactions)
@@ -24,6 +24,12 @@ BANNER = """
 """
 
 
+# Optional attributes of an events plugin setting how the events are
+# delivered to it, see `bigchaindb.events.Subscription`.
+EVENTS_PLUGIN_OPTIONS = ('queue_size', 'overflow_policy', 'batch_size',
+                         'batch_latency')
+
+
 def start_events_plugins(exchange):
     plugins = config_utils.load_events_plugins(
         bigchaindb.config.get('events_plugins'))
@@ -32,7 +38,11 @@ def start_events_plugins(exchange):
         logger.info('Loading events plugin %s', name)
 
         event_types = getattr(plugin, 'event_types', None)
-        queue = exchange.get_subscriber_queue(event_types)
+        options = {option: getattr(plugin, option)
+                   for option in EVENTS_PLUGIN_OPTIONS
+                   if hasattr(plugin, option)}
+        queue = exchange.get_subscriber_queue(event_types, name=name,
+                                              **options)
 
         mp.Process(name='events_plugin_{}'.format(name),
                    target=plugin.run,
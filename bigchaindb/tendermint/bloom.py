@@ -0,0 +1,87 @@
+"""Bloom filters, used to tell quickly whether a transaction id is new."""
+import math
+
+try:
+    from hashlib import sha3_256
+except ImportError:
+    from sha3 import sha3_256
+
+
+class BloomFilter:
+    """Fixed size Bloom filter over strings.
+
+    A negative answer is definite; a positive answer is wrong with a
+    probability of about ``error_rate`` as long as no more than
+    ``capacity`` items were added.
+    """
+
+    def __init__(self, capacity, error_rate):
+        """Create an empty filter.
+
+        Args:
+            capacity (int): number of items the filter is sized for.
+            error_rate (float): false positive probability at capacity.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2)))
+        # NOTE: the probes are taken from a single sha3_256 digest, which
+        # provides eight 32 bit words
+        self.num_hashes = min(8, max(1, int(round(
+            self.num_bits / capacity * math.log(2)))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _probes(self, item):
+        digest = sha3_256(item.encode()).digest()
+        for i in range(self.num_hashes):
+            word = int.from_bytes(digest[i * 4:(i + 1) * 4], 'big')
+            yield word % self.num_bits
+
+    def add(self, item):
+        for bit in self._probes(item):
+            self.bits[bit >> 3] |= 1 << (bit & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[bit >> 3] & (1 << (bit & 7))
+                   for bit in self._probes(item))
+
+
+class ScalableBloomFilter:
+    """Bloom filter that grows with the number of items.
+
+    When the current filter reaches its capacity a new one, twice as
+    large and with a tighter error rate, is added, so that the overall
+    false positive probability stays below ``error_rate``.
+    """
+
+    def __init__(self, items=(), initial_capacity=100000, error_rate=0.001):
+        """Create a new filter.
+
+        Args:
+            items (iterable): the items to start with.
+            initial_capacity (int): capacity of the first filter.
+            error_rate (float): overall false positive probability.
+        """
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.filters = []
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        if not self.filters or \
+                self.filters[-1].count >= self.filters[-1].capacity:
+            position = len(self.filters)
+            self.filters.append(BloomFilter(
+                self.initial_capacity * 2 ** position,
+                self.error_rate * 0.5 ** (position + 1)))
+        self.filters[-1].add(item)
+
+    def __contains__(self, item):
+        return any(item in bloom_filter for bloom_filter in self.filters)
+
+    def __len__(self):
+        return sum(bloom_filter.count for bloom_filter in self.filters)
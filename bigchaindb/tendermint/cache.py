@@ -0,0 +1,81 @@
+"""In-memory caches used by the ABCI application.
+
+They live in the process running the :class:`~bigchaindb.tendermint.App`,
+and are not shared with the web workers.
+"""
+from collections import OrderedDict
+
+try:
+    from hashlib import sha3_256
+except ImportError:
+    from sha3 import sha3_256
+
+
+class ValidationCache:
+    """Bounded LRU cache of transactions that passed validation.
+
+    The same transaction is validated by ``check_tx`` when it enters
+    the mempool (and again on every mempool recheck) and by
+    ``deliver_tx`` when it is included in a block. The checks that do
+    not depend on the state of the chain (schema, id and signatures)
+    give the same answer every time, so their outcome is remembered
+    here.
+
+    Entries are keyed by the digest of the raw transaction bytes, not
+    by the transaction id: trusting a claimed id would require checking
+    it, i.e. re-serializing and hashing the payload, which is part of
+    the work the cache is meant to save.
+
+    Note:
+        Only state independent checks are cached. The checks depending
+        on the inputs a transaction spends (existence of the inputs,
+        double spends, duplicates) must be run again by the caller.
+    """
+
+    def __init__(self, size):
+        """Create a new cache.
+
+        Args:
+            size (int): maximum number of transactions to keep.
+        """
+        self.size = size
+        self.transactions = OrderedDict()
+
+    @staticmethod
+    def digest(raw_transaction):
+        """Compute the cache key of a raw transaction.
+
+        Args:
+            raw_transaction (bytes): the transaction as received from
+                Tendermint.
+        """
+        return sha3_256(raw_transaction).hexdigest()
+
+    def get(self, digest):
+        """Return the validated transaction for ``digest``, or ``None``."""
+        transaction = self.transactions.get(digest)
+        if transaction is not None:
+            self.transactions.move_to_end(digest)
+        return transaction
+
+    def add(self, digest, transaction):
+        """Remember that ``transaction`` passed validation.
+
+        Args:
+            digest (str): the key, as returned by :meth:`digest`.
+            transaction (:class:`~bigchaindb.models.Transaction`): the
+                validated transaction.
+        """
+        if self.size <= 0:
+            return
+        self.transactions[digest] = transaction
+        self.transactions.move_to_end(digest)
+        while len(self.transactions) > self.size:
+            self.transactions.popitem(last=False)
+
+    def discard(self, digest):
+        """Forget the transaction stored under ``digest``, if any."""
+        self.transactions.pop(digest, None)
+
+    def __len__(self):
+        return len(self.transactions)
@@ -1,12 +1,13 @@
 import logging
+import signal
 
 import setproctitle
 
 import bigchaindb
 from bigchaindb.tendermint.lib import BigchainDB
 from bigchaindb.tendermint.core import App
+from bigchaindb.tendermint.utils import write_pid_file, remove_pid_file
 from bigchaindb.web import server, websocket_server
-from bigchaindb.tendermint import event_stream
 from bigchaindb.events import Exchange, EventTypes
 from bigchaindb.utils import Process
 
@@ -53,12 +54,6 @@ def start():
                                  args=(exchange.get_subscriber_queue(EventTypes.BLOCK_VALID),))
     p_websocket_server.start()
 
-    # connect to tendermint event stream
-    p_websocket_client = Process(name='ws_to_tendermint',
-                                 target=event_stream.start,
-                                 args=(exchange.get_publisher_queue(),))
-    p_websocket_client.start()
-
     p_exchange = Process(name='exchange', target=exchange.run)
     p_exchange.start()
 
@@ -69,8 +64,21 @@ def start():
 
     setproctitle.setproctitle('bigchaindb')
 
-    app = ABCIServer(app=App())
-    app.run()
+    # the app publishes the committed blocks to the event stream
+    app = App(events_queue=exchange.get_publisher_queue())
+    # `bigchaindb upsert-validator` stores the update in the database and
+    # sends SIGUSR1, which tells the app to pick it up at the end of the
+    # next block.
+    signal.signal(signal.SIGUSR1,
+                  lambda signum, frame: app.refresh_validator_update())
+    write_pid_file()
+
+    abci_server = ABCIServer(app=app)
+    try:
+        abci_server.run()
+    finally:
+        remove_pid_file()
+        app.bigchaindb.connection.close()
 
 
 if __name__ == '__main__':
@@ -1,6 +1,8 @@
 """This module contains all the goodness to integrate BigchainDB
 with Tendermint."""
 import logging
+import time
+from os import getenv
 
 from abci.application import BaseApplication, Result
 from abci.types_pb2 import ResponseEndBlock, ResponseInfo, Validator
@@ -10,10 +12,23 @@ from bigchaindb.tendermint.utils import (decode_transaction,
                                          calculate_hash,
                                          amino_encoded_public_key)
 from bigchaindb.tendermint.lib import Block, PreCommitState
+from bigchaindb.models import BlockTransactions
+from bigchaindb.tendermint.cache import ValidationCache
+from bigchaindb.tendermint.trace import BlockTrace
 from bigchaindb.backend.query import PRE_COMMIT_ID
+from bigchaindb.events import Event, EventTypes
 
 logger = logging.getLogger(__name__)
 
+# Number of validated transactions remembered by the ABCI application
+# between `check_tx` and `deliver_tx` (see `ValidationCache`). The cache is
+# kept in the process running the application: the transactions posted to
+# the HTTP API are still fully validated by the web workers.
+VALIDATION_CACHE_SIZE = int(getenv('BIGCHAINDB_VALIDATION_CACHE_SIZE',
+                                   10000))
+# Whether to store a performance trace of every block.
+ABCI_TRACE = getenv('BIGCHAINDB_ABCI_TRACE', 'true').lower() in ('true', '1')
+
 
 class App(BaseApplication):
     """Bridge between BigchainDB and Tendermint.
@@ -22,25 +37,47 @@ class App(BaseApplication):
     transactional logic to the Tendermint Consensus
     State Machine."""
 
-    def __init__(self, bigchaindb=None):
+    def __init__(self, bigchaindb=None, events_queue=None):
+        """Create the application.
+
+        Args:
+            bigchaindb (:class:`~bigchaindb.tendermint.lib.BigchainDB`,
+                optional): the connection to BigchainDB.
+            events_queue (:class:`multiprocessing.Queue`, optional): the
+                queue to publish the committed blocks to, usually the
+                publisher queue of the :class:`~bigchaindb.events.Exchange`.
+        """
         self.bigchaindb = bigchaindb or BigchainDB()
+        self.events_queue = events_queue
+        self.bigchaindb.load_utxo_index()
+        self.bigchaindb.load_known_transaction_ids()
+        if ABCI_TRACE:
+            self.bigchaindb.create_abci_traces_table()
         self.block_txn_ids = []
         self.block_txn_hash = ''
-        self.block_transactions = []
+        self.block_transactions = BlockTransactions()
         self.validators = None
         self.new_height = None
+        # `height` and `app_hash` of the latest committed block
+        self.chain_tip = None
+        # whether a validator update may be pending, set on start and by
+        # `bigchaindb upsert-validator` (see `refresh_validator_update`)
+        self.validator_update_pending = True
+        self.trace = None
+        self.validation_cache = ValidationCache(VALIDATION_CACHE_SIZE)
 
     def init_chain(self, validators):
         """Initialize chain with block of height 0"""
 
         block = Block(app_hash='', height=0, transactions=[])
         self.bigchaindb.store_block(block._asdict())
+        self.chain_tip = {'height': block.height, 'app_hash': block.app_hash}
 
     def info(self):
         """Return height of the latest committed block."""
 
         r = ResponseInfo()
-        block = self.bigchaindb.get_latest_block()
+        block = self.get_chain_tip()
         if block:
             r.last_block_height = block['height']
             r.last_block_app_hash = block['app_hash'].encode('utf-8')
@@ -56,8 +93,7 @@ class App(BaseApplication):
         Args:
             raw_tx: a raw string (in bytes) transaction."""
         logger.debug('check_tx: %s', raw_transaction)
-        transaction = decode_transaction(raw_transaction)
-        if self.bigchaindb.is_valid_transaction(transaction):
+        if self.validate_raw_transaction(raw_transaction):
             logger.debug('check_tx: VALID')
             return Result.ok()
         else:
@@ -70,27 +106,102 @@ class App(BaseApplication):
             req_begin_block: block object which contains block header
             and block hash.
         """
+        start = time.perf_counter()
+        self.trace = BlockTrace(self.bigchaindb.connection)
 
         self.block_txn_ids = []
-        self.block_transactions = []
+        self.block_transactions = BlockTransactions()
+        self.trace.record('begin_block', start)
 
     def deliver_tx(self, raw_transaction):
         """Validate the transaction before mutating the state.
 
+        The fulfillments are verified before answering, as Tendermint
+        indexes and reports the transactions accepted here; only the ones
+        already validated by ``check_tx`` skip the verification.
+
         Args:
             raw_tx: a raw string (in bytes) transaction."""
         logger.debug('deliver_tx: %s', raw_transaction)
-        transaction = self.bigchaindb.is_valid_transaction(
-            decode_transaction(raw_transaction), self.block_transactions)
+        start = time.perf_counter()
+        transaction = self.validate_raw_transaction(
+            raw_transaction, self.block_transactions)
 
         if not transaction:
             logger.debug('deliver_tx: INVALID')
-            return Result.error(log='Invalid transaction')
+            result = Result.error(log='Invalid transaction')
+            if self.trace:
+                self.trace.reject()
         else:
             logger.debug('storing tx')
             self.block_txn_ids.append(transaction.id)
             self.block_transactions.append(transaction)
-            return Result.ok()
+            result = Result.ok()
+            if self.trace:
+                self.trace.accept(transaction.id, len(raw_transaction))
+
+        if self.trace:
+            self.trace.record('deliver_tx', start)
+        return result
+
+    def validate_raw_transaction(self, raw_transaction,
+                                 current_transactions=[]):
+        """Validate a raw transaction, reusing the outcome of a previous
+        validation of the same payload when available.
+
+        A transaction found in :attr:`validation_cache` already passed
+        the schema, id and signature checks, so only the checks that
+        depend on the state of the chain are run again.
+
+        Args:
+            raw_transaction (bytes): a raw transaction.
+            current_transactions (:class:`~bigchaindb.models.
+                BlockTransactions`): transactions of the block being built.
+
+        Returns:
+            The :class:`~bigchaindb.models.Transaction` if valid,
+            ``False`` otherwise.
+        """
+        digest = self.validation_cache.digest(raw_transaction)
+        transaction = self.validation_cache.get(digest)
+
+        if transaction:
+            return self.bigchaindb.is_valid_transaction(
+                transaction, current_transactions, verify_signatures=False)
+
+        transaction = self.bigchaindb.is_valid_transaction(
+            decode_transaction(raw_transaction), current_transactions)
+
+        if transaction:
+            self.validation_cache.add(digest, transaction)
+        return transaction
+
+    def get_chain_tip(self):
+        """Return the ``height`` and ``app_hash`` of the latest committed
+        block, reading them from the database only the first time."""
+        if self.chain_tip is None:
+            block = self.bigchaindb.get_latest_block()
+            if block:
+                self.chain_tip = {'height': block['height'],
+                                  'app_hash': block['app_hash']}
+        return self.chain_tip
+
+    def refresh_validator_update(self):
+        """Signal that a validator update may have been stored, so that
+        it is looked up at the end of the next block."""
+        self.validator_update_pending = True
+
+    def get_validator_update(self):
+        """Return the pending validator updates, if any.
+
+        The database is only queried on start and when signaled (see
+        :meth:`refresh_validator_update`).
+        """
+        if not self.validator_update_pending:
+            return []
+
+        self.validator_update_pending = False
+        return self.bigchaindb.get_validator_update()
 
     def end_block(self, height):
         """Calculate block hash using transaction ids and previous block
@@ -99,20 +210,22 @@ class App(BaseApplication):
         Args:
             height (int): new height of the chain."""
 
+        start = time.perf_counter()
         self.new_height = height
         block_txn_hash = calculate_hash(self.block_txn_ids)
-        block = self.bigchaindb.get_latest_block()
+        block = self.get_chain_tip()
 
         if self.block_txn_ids:
             self.block_txn_hash = calculate_hash([block['app_hash'], block_txn_hash])
         else:
             self.block_txn_hash = block['app_hash']
 
-        validator_updates = self.bigchaindb.get_validator_update()
+        validator_updates = self.get_validator_update()
         validator_updates = [encode_validator(v) for v in validator_updates]
 
         # set sync status to true
-        self.bigchaindb.delete_validator_update()
+        if validator_updates:
+            self.bigchaindb.delete_validator_update()
 
         # Store pre-commit state to recover in case there is a crash
         # during `commit`
@@ -122,6 +235,9 @@ class App(BaseApplication):
         logger.debug('Updating PreCommitState: %s', self.new_height)
         self.bigchaindb.store_pre_commit_state(pre_commit_state._asdict())
 
+        if self.trace:
+            self.trace.record('end_block', start)
+
         # NOTE: interface for `ResponseEndBlock` has be changed in the latest
         # version of py-abci i.e. the validator updates should be return
         # as follows:
@@ -131,24 +247,61 @@ class App(BaseApplication):
     def commit(self):
         """Store the new height and along with block hash."""
 
+        start = time.perf_counter()
         data = self.block_txn_hash.encode('utf-8')
 
         # register a new block only when new transactions are received
         if self.block_txn_ids:
-            self.bigchaindb.store_bulk_transactions(self.block_transactions)
             block = Block(app_hash=self.block_txn_hash,
                           height=self.new_height,
                           transactions=self.block_txn_ids)
-            # NOTE: storing the block should be the last operation during commit
-            # this effects crash recovery. Refer BEP#8 for details
-            self.bigchaindb.store_block(block._asdict())
+            # NOTE: the block is stored after its transactions, as the last
+            # operation during commit. This effects crash recovery. Refer
+            # BEP#8 for details
+            self.bigchaindb.store_block_with_transactions(
+                block._asdict(), self.block_transactions)
+            self.chain_tip = {'height': block.height,
+                              'app_hash': block.app_hash}
+
+            if self.events_queue is not None:
+                self.events_queue.put(Event(EventTypes.BLOCK_VALID, {
+                    'height': block.height,
+                    'transactions': [summarize_transaction(tx)
+                                     for tx in self.block_transactions],
+                }))
 
         logger.debug('Commit-ing new block with hash: apphash=%s ,'
                      'height=%s, txn ids=%s', data, self.new_height,
                      self.block_txn_ids)
+
+        if self.trace:
+            self.trace.record('commit', start)
+            if ABCI_TRACE:
+                self.bigchaindb.store_abci_trace(
+                    self.trace.to_dict(self.new_height))
+            self.trace = None
         return data
 
 
+def summarize_transaction(transaction):
+    """Return the part of ``transaction`` published with the block events.
+
+    The summary has the shape of a transaction dictionary, reduced to the
+    fields the event consumers need: ``id``, ``operation``, the asset id
+    of a ``TRANSFER`` and the public keys of the outputs. It is part of
+    the events plugin API, see
+    ``docs/server/source/events/event-plugin-api.rst``.
+    """
+
+    summary = {'id': transaction.id,
+               'operation': transaction.operation,
+               'outputs': [{'public_keys': output.public_keys}
+                           for output in transaction.outputs]}
+    if transaction.operation == transaction.TRANSFER:
+        summary['asset'] = {'id': transaction.asset['id']}
+    return summary
+
+
 def encode_validator(v):
     ed25519_public_key = v['pub_key']['data']
     # NOTE: tendermint expects public to be encoded in go-amino format
@@ -3,58 +3,54 @@ MongoDB.
 
 """
 import logging
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from copy import deepcopy
-from os import getenv
-from uuid import uuid4
-
-try:
-    from hashlib import sha3_256
-except ImportError:
-    # NOTE: neeeded for Python < 3.6
-    from sha3 import sha3_256
+from itertools import islice
 
 import requests
 
 from bigchaindb import backend
 from bigchaindb import Bigchain
-from bigchaindb.models import Transaction
+from bigchaindb.models import BlockTransactions, Transaction
 from bigchaindb.common.exceptions import (SchemaValidationError,
                                           ValidationError,
-                                          DoubleSpend)
-from bigchaindb.tendermint.utils import encode_transaction, merkleroot
+                                          DoubleSpend,
+                                          InputDoesNotExist,
+                                          InvalidSignature)
+from bigchaindb.common.transaction import TransactionLink, UnspentOutput
+from bigchaindb.tendermint.utils import encode_transaction
+from bigchaindb.tendermint.bloom import ScalableBloomFilter
+from bigchaindb.tendermint.merkle import MerkleTree
+from bigchaindb.tendermint.utxo import UTXOIndex, utxo_hash
+from bigchaindb.tendermint.verification import SignatureBatch
 from bigchaindb.tendermint import fastquery
+from bigchaindb.tendermint import rpc
 from bigchaindb import exceptions as core_exceptions
+from bigchaindb.utils import condition_details_has_owner
 
 logger = logging.getLogger(__name__)
 
-BIGCHAINDB_TENDERMINT_HOST = getenv('BIGCHAINDB_TENDERMINT_HOST',
-                                    'localhost')
-BIGCHAINDB_TENDERMINT_PORT = getenv('BIGCHAINDB_TENDERMINT_PORT',
-                                    '46657')
-ENDPOINT = 'http://{}:{}/'.format(BIGCHAINDB_TENDERMINT_HOST,
-                                  BIGCHAINDB_TENDERMINT_PORT)
 MODE_LIST = ('broadcast_tx_async',
              'broadcast_tx_sync',
              'broadcast_tx_commit')
 
+# Number of transactions fetched per query when listing transactions.
+FETCH_BATCH_SIZE = 1000
+
 
 class BigchainDB(Bigchain):
 
+    utxo_index = None
+    known_transaction_ids = None
+
     def post_transaction(self, transaction, mode):
         """Submit a valid transaction to the mempool."""
         if not mode or mode not in MODE_LIST:
             raise ValidationError(('Mode must be one of the following {}.')
                                   .format(', '.join(MODE_LIST)))
 
-        payload = {
-            'method': mode,
-            'jsonrpc': '2.0',
-            'params': [encode_transaction(transaction.to_dict())],
-            'id': str(uuid4())
-        }
-        # TODO: handle connection errors!
-        return requests.post(ENDPOINT, json=payload)
+        return rpc.get_client().call(
+            mode, encode_transaction(transaction.to_dict()))
 
     def write_transaction(self, transaction, mode):
         # This method offers backward compatibility with the Web API.
@@ -62,6 +58,34 @@ class BigchainDB(Bigchain):
         response = self.post_transaction(transaction, mode)
         return self._process_post_response(response.json(), mode)
 
+    def post_transactions(self, transactions, mode):
+        """Submit valid transactions to the mempool, in a single batch
+        request.
+
+        Returns:
+            list: the responses of Tendermint, one per transaction.
+        """
+        if not mode or mode not in MODE_LIST:
+            raise ValidationError(('Mode must be one of the following {}.')
+                                  .format(', '.join(MODE_LIST)))
+
+        return rpc.get_client().call_batch(
+            [(mode, [encode_transaction(transaction.to_dict())])
+             for transaction in transactions])
+
+    def write_transactions(self, transactions, mode):
+        """Submit valid transactions to the mempool.
+
+        Returns:
+            list: a ``(status_code, message)`` tuple per transaction.
+        """
+        if not transactions:
+            return []
+        responses = self.post_transactions(transactions, mode)
+        return [self._process_post_response(response, mode)
+                if response is not None else (500, 'Internal error')
+                for response in responses]
+
     def _process_post_response(self, response, mode):
         logger.debug(response)
         if response.get('error') is not None:
@@ -89,13 +113,13 @@ class BigchainDB(Bigchain):
         return (202, '') if status_code == 0 else (500, failure_msg)
 
     def get_latest_block_height_from_tendermint(self):
-        r = requests.get(ENDPOINT + 'status')
+        r = rpc.get_client().get('status')
         return r.json()['result']['latest_block_height']
 
     def store_transaction(self, transaction):
         """Store a valid transaction to the transactions collection."""
 
-        # self.update_utxoset(transaction)
+        tx = transaction
         transaction = deepcopy(transaction.to_dict())
         if transaction['operation'] == 'CREATE':
             asset = transaction.pop('asset')
@@ -109,14 +133,49 @@ class BigchainDB(Bigchain):
 
         backend.query.store_metadatas(self.connection, [transaction_metadata])
 
-        return backend.query.store_transaction(self.connection, transaction)
+        result = backend.query.store_transaction(self.connection, transaction)
+        self._add_known_transaction_ids([tx])
+        self.update_utxoset(tx)
+        return result
 
     def store_bulk_transactions(self, transactions):
+        txns, assets, txn_metadatas = self._split_transactions(transactions)
+
+        backend.query.store_metadatas(self.connection, txn_metadatas)
+        if assets:
+            backend.query.store_assets(self.connection, assets)
+        result = backend.query.store_transactions(self.connection, txns)
+        self._add_known_transaction_ids(transactions)
+        self.update_utxoset(*transactions)
+        return result
+
+    def store_block_with_transactions(self, block, transactions):
+        """Store a committed block along with its transactions and the
+        changes they make to the UTXO set, batching the writes.
+
+        Args:
+            block (dict): the block.
+            transactions (:obj:`list` of :obj:`~bigchaindb.models.
+                Transaction`): the transactions of the block.
+        """
+        txns, assets, txn_metadatas = self._split_transactions(transactions)
+        spent_outputs, unspent_outputs = self._utxoset_changes(transactions)
+
+        result = backend.query.store_block_writes(
+            self.connection, block, txns, assets, txn_metadatas,
+            spent_outputs, [utxo._asdict() for utxo in unspent_outputs])
+        self._add_known_transaction_ids(transactions)
+        self._update_utxo_index(spent_outputs, unspent_outputs)
+        return result
+
+    @staticmethod
+    def _split_transactions(transactions):
+        """Split transactions into the documents stored in the
+        ``transactions``, ``assets`` and ``metadata`` collections."""
         txns = []
         assets = []
         txn_metadatas = []
         for transaction in transactions:
-            # self.update_utxoset(transaction)
             transaction = transaction.to_dict()
             if transaction['operation'] == 'CREATE':
                 asset = transaction.pop('asset')
@@ -127,30 +186,175 @@ class BigchainDB(Bigchain):
             txn_metadatas.append({'id': transaction['id'],
                                   'metadata': metadata})
             txns.append(transaction)
+        return txns, assets, txn_metadatas
 
-        backend.query.store_metadatas(self.connection, txn_metadatas)
-        if assets:
-            backend.query.store_assets(self.connection, assets)
-        return backend.query.store_transactions(self.connection, txns)
+    def update_utxoset(self, *transactions):
+        """Update the UTXO set given ``transactions``. That is, remove
+        the outputs that the given ``transactions`` spend, and add the
+        outputs that the given ``transactions`` create.
 
-    def update_utxoset(self, transaction):
-        """Update the UTXO set given ``transaction``. That is, remove
-        the outputs that the given ``transaction`` spends, and add the
-        outputs that the given ``transaction`` creates.
+        Outputs both created and spent by ``transactions`` (e.g. within
+        the same block) never enter the UTXO set.
 
         Args:
-            transaction (:obj:`~bigchaindb.models.Transaction`): A new
-                transaction incoming into the system for which the UTXO
-                set needs to be updated.
+            *transactions (:obj:`~bigchaindb.models.Transaction`): New
+                transactions incoming into the system for which the UTXO
+                set needs to be updated, in the order they were applied.
         """
-        spent_outputs = [
-            spent_output for spent_output in transaction.spent_outputs
-        ]
+        spent_outputs, unspent_outputs = self._utxoset_changes(transactions)
+
         if spent_outputs:
             self.delete_unspent_outputs(*spent_outputs)
         self.store_unspent_outputs(
-            *[utxo._asdict() for utxo in transaction.unspent_outputs]
+            *[utxo._asdict() for utxo in unspent_outputs]
         )
+        self._update_utxo_index(spent_outputs, unspent_outputs)
+
+    @staticmethod
+    def _utxoset_changes(transactions):
+        """Return the outputs spent (as dictionaries) and created (as
+        :class:`~bigchaindb.common.transaction.UnspentOutput`) by
+        ``transactions``, leaving out those both created and spent."""
+        spent_outputs = {}
+        unspent_outputs = []
+        for transaction in transactions:
+            for spent_output in transaction.spent_outputs:
+                key = (spent_output['transaction_id'],
+                       spent_output['output_index'])
+                spent_outputs[key] = spent_output
+            unspent_outputs.extend(transaction.unspent_outputs)
+
+        created = {(utxo.transaction_id, utxo.output_index)
+                   for utxo in unspent_outputs}
+        unspent_outputs = [utxo for utxo in unspent_outputs
+                           if (utxo.transaction_id, utxo.output_index)
+                           not in spent_outputs]
+        spent_outputs = [spent_output
+                         for key, spent_output in spent_outputs.items()
+                         if key not in created]
+        return spent_outputs, unspent_outputs
+
+    def _update_utxo_index(self, spent_outputs, unspent_outputs):
+        # NOTE: the index is only updated once the database is, so that it
+        # never holds outputs that a crash could lose.
+        if self.utxo_index is not None:
+            for spent_output in spent_outputs:
+                self.utxo_index.remove(spent_output['transaction_id'],
+                                       spent_output['output_index'])
+            for utxo in unspent_outputs:
+                self.utxo_index.add(utxo)
+
+    def rollback_utxoset(self, transaction_ids):
+        """Undo the changes that the given stored transactions made to
+        the UTXO set: remove the outputs they create and restore the
+        outputs they spend.
+
+        Used during crash recovery, before the transactions of a block
+        that was not committed are deleted.
+
+        Args:
+            transaction_ids (list): ids of the transactions to roll back.
+        """
+        transactions = list(backend.query.get_transactions(
+            self.connection, transaction_ids) or [])
+        pending = set(transaction_ids)
+
+        self.delete_unspent_outputs(*[
+            {'transaction_id': transaction['id'], 'output_index': index}
+            for transaction in transactions
+            for index in range(len(transaction['outputs']))
+        ])
+
+        spent_outputs = [
+            input_['fulfills'] for transaction in transactions
+            for input_ in transaction['inputs']
+            if input_['fulfills'] and
+            input_['fulfills']['transaction_id'] not in pending
+        ]
+        if not spent_outputs:
+            return
+
+        input_txids = list({spent_output['transaction_id']
+                            for spent_output in spent_outputs})
+        input_txs = {transaction['id']: transaction
+                     for transaction in backend.query.get_transactions(
+                         self.connection, input_txids)}
+
+        restored = []
+        for spent_output in spent_outputs:
+            input_tx = input_txs[spent_output['transaction_id']]
+            output_index = spent_output['output_index']
+            output = input_tx['outputs'][output_index]
+            if input_tx['operation'] == Transaction.CREATE:
+                asset_id = input_tx['id']
+            else:
+                asset_id = input_tx['asset']['id']
+            restored.append({
+                'transaction_id': input_tx['id'],
+                'output_index': output_index,
+                'amount': int(output['amount']),
+                'asset_id': asset_id,
+                'condition_uri': output['condition']['uri'],
+            })
+
+        # NOTE: the rolled back transactions may not have reached the UTXO
+        # set yet, so the restored outputs may still be there.
+        self.delete_unspent_outputs(*restored)
+        self.store_unspent_outputs(*restored)
+
+    def load_known_transaction_ids(self):
+        """Load the ids of the stored transactions in a Bloom filter, to
+        tell new transactions apart without querying the database.
+        """
+        self.known_transaction_ids = ScalableBloomFilter(
+            record['id'] for record in
+            backend.query.get_transaction_ids(self.connection))
+
+    def _add_known_transaction_ids(self, transactions):
+        if self.known_transaction_ids is not None:
+            for transaction in transactions:
+                self.known_transaction_ids.add(transaction.id)
+
+    def transaction_exists(self, txid):
+        """Check whether a transaction with id ``txid`` is stored.
+
+        When the Bloom filter of the known ids is loaded, the database is
+        only queried if the filter reports the id as (possibly) known.
+
+        Args:
+            txid (str): the id of the transaction.
+
+        Returns:
+            bool: ``True`` if the transaction is stored.
+        """
+        if self.known_transaction_ids is not None and \
+                txid not in self.known_transaction_ids:
+            return False
+        return backend.query.get_transaction(self.connection,
+                                             txid) is not None
+
+    def load_utxo_index(self):
+        """Load the UTXO set in memory, to resolve the inputs of new
+        transactions without querying the database.
+        """
+        self.utxo_index = UTXOIndex(self.get_unspent_outputs())
+
+    def get_unspent_output(self, txid, output):
+        """Look up an output in the in-memory UTXO index.
+
+        Args:
+            txid (str): id of the transaction that created the output.
+            output (int): index of the output.
+
+        Returns:
+            :class:`~bigchaindb.common.transaction.UnspentOutput` if the
+            output is committed and unspent, ``None`` if it is not in the
+            index (or the index is not loaded), in which case the caller
+            has to resolve it from the database.
+        """
+        if self.utxo_index is None:
+            return None
+        return self.utxo_index.get(txid, output)
 
     def store_unspent_outputs(self, *unspent_outputs):
         """Store the given ``unspent_outputs`` (utxos).
@@ -164,38 +368,29 @@ class BigchainDB(Bigchain):
                                             self.connection, *unspent_outputs)
 
     def get_utxoset_merkle_root(self):
-        """Returns the merkle root of the utxoset. This implies that
-        the utxoset is first put into a merkle tree.
+        """Returns the merkle root of the utxoset.
 
-        For now, the merkle tree and its root will be computed each
-        time. This obviously is not efficient and a better approach
-        that limits the repetition of the same computation when
-        unnecesary should be sought. For instance, future optimizations
-        could simply re-compute the branches of the tree that were
-        affected by a change.
+        The transaction hash (id) and output index are sufficient to
+        uniquely identify a utxo, hence each leaf of the merkle tree is
+        the hash of the tuple (txid, output_index). See
+        :class:`~bigchaindb.tendermint.merkle.MerkleTree` for the shape
+        of the tree.
 
-        The transaction hash (id) and output index should be sufficient
-        to uniquely identify a utxo, and consequently only that
-        information from a utxo record is needed to compute the merkle
-        root. Hence, each node of the merkle tree should contain the
-        tuple (txid, output_index).
-
-        .. important:: The leaves of the tree will need to be sorted in
-            some kind of lexicographical order.
+        When the UTXO index is loaded, its tree is kept up to date as
+        blocks are committed and the root is readily available.
+        Otherwise the tree is built from the ``utxos`` collection.
 
         Returns:
             str: Merkle root in hexadecimal form.
         """
+        if self.utxo_index is not None:
+            return self.utxo_index.merkle_root()
+
         utxoset = backend.query.get_unspent_outputs(self.connection)
-        # TODO Once ready, use the already pre-computed utxo_hash field.
-        # See common/transactions.py for details.
-        hashes = [
-            sha3_256(
-                '{}{}'.format(utxo['transaction_id'], utxo['output_index']).encode()
-            ).digest() for utxo in utxoset
-        ]
-        # TODO Notice the sorted call!
-        return merkleroot(sorted(hashes))
+        return MerkleTree(
+            utxo_hash(utxo['transaction_id'], utxo['output_index'])
+            for utxo in utxoset
+        ).merkle_root()
 
     def get_unspent_outputs(self):
         """Get the utxoset.
@@ -218,27 +413,147 @@ class BigchainDB(Bigchain):
                                         self.connection, *unspent_outputs)
 
     def get_transaction(self, transaction_id, include_status=False):
-        transaction = backend.query.get_transaction(self.connection, transaction_id)
-        asset = backend.query.get_asset(self.connection, transaction_id)
-        metadata = backend.query.get_metadata(self.connection, [transaction_id])
+        transactions = self.get_transactions([transaction_id])
+        transaction = transactions[0] if transactions else None
 
-        if transaction:
-            if asset:
-                transaction['asset'] = asset
+        if include_status:
+            return transaction, self.TX_VALID if transaction else None
+        else:
+            return transaction
 
-            if 'metadata' not in transaction:
-                metadata = metadata[0] if metadata else None
-                if metadata:
-                    metadata = metadata.get('metadata')
+    def get_transactions(self, transaction_ids):
+        """Get the transactions with the given ids.
 
-                transaction.update({'metadata': metadata})
+        The transactions are joined with their asset and metadata by the
+        database, in a single query.
 
-            transaction = Transaction.from_dict(transaction)
+        Args:
+            transaction_ids (list): the ids of the transactions.
 
-        if include_status:
-            return transaction, self.TX_VALID if transaction else None
+        Returns:
+            list: the :class:`~bigchaindb.models.Transaction` of the
+            stored transactions, in the order of ``transaction_ids``.
+        """
+        return [Transaction.from_trusted_dict(transaction)
+                for transaction in self.get_raw_transactions(transaction_ids)]
+
+    def get_raw_transaction(self, transaction_id):
+        """Get a transaction as a dict, without building a
+        :class:`~bigchaindb.models.Transaction` from it.
+
+        Args:
+            transaction_id (str): the id of the transaction.
+
+        Returns:
+            dict: the transaction, with its asset and metadata, or
+            ``None`` if it is not stored.
+        """
+        transactions = self.get_raw_transactions([transaction_id])
+        return transactions[0] if transactions else None
+
+    def get_raw_transactions(self, transaction_ids):
+        """Same as :meth:`get_transactions`, with the transactions as
+        dicts."""
+        transactions = {
+            transaction['id']: transaction for transaction in
+            backend.query.get_full_transactions(self.connection,
+                                                list(transaction_ids))
+        }
+        return [transactions[transaction_id]
+                for transaction_id in transaction_ids
+                if transaction_id in transactions]
+
+    def get_transactions_filtered(self, asset_id, operation=None, *,
+                                  after=None, limit=0):
+        """Get the transactions of an asset, optionally filtered by
+        operation.
+
+        All the stored transactions are committed, so they are fetched by
+        batches of :data:`FETCH_BATCH_SIZE` rather than checked one by one.
+
+        Args:
+            asset_id (str): the id of the asset.
+            operation (str): ``CREATE`` or ``TRANSFER``.
+            after (str): if given, only the transactions with a greater id
+                are returned.
+            limit (int): the maximum number of transactions to return, or
+                ``0`` for all of them.
+
+        If ``after`` or ``limit`` is given, the transactions are sorted by
+        id.
+        """
+        txids = backend.query.get_txids_filtered(self.connection, asset_id,
+                                                 operation, after=after,
+                                                 limit=limit)
+        while True:
+            batch = list(islice(txids, FETCH_BATCH_SIZE))
+            if not batch:
+                return
+            yield from self.get_transactions(batch)
+
+    def get_outputs_filtered(self, owner, spent=None, *, after=None,
+                             limit=0):
+        """Get the links to the outputs of a public key, sorted by
+        transaction id and output index.
+
+        Args:
+            owner (str): base58 encoded public key.
+            spent (bool): If ``True`` return only the spent outputs. If
+                ``False`` return only unspent outputs. If spent is not
+                specified (``None``) return all outputs.
+            after (tuple): if given, only the outputs after the one with
+                this ``(transaction id, output index)`` are returned.
+            limit (int): the maximum number of outputs to return, or ``0``
+                for all of them.
+
+        Returns:
+            iterator of :class:`~bigchaindb.common.transaction.
+            TransactionLink`, read from the database as they are consumed.
+        """
+        txs = backend.query.get_owned_ids(self.connection, owner,
+                                          from_id=after[0] if after else '')
+        outputs = (TransactionLink(tx['id'], index)
+                   for tx in txs
+                   for index, output in enumerate(tx['outputs'])
+                   if condition_details_has_owner(
+                       output['condition']['details'], owner))
+        if after:
+            after = tuple(after)
+            outputs = (output for output in outputs
+                       if (output.txid, output.output) > after)
+        if spent is not None:
+            outputs = self._filter_outputs_by_spent(outputs, spent)
+        return islice(outputs, limit or None)
+
+    def _filter_outputs_by_spent(self, outputs, spent):
+        if spent:
+            filter_outputs = self.fastquery.filter_unspent_outputs
         else:
-            return transaction
+            filter_outputs = self.fastquery.filter_spent_outputs
+        while True:
+            batch = list(islice(outputs, FETCH_BATCH_SIZE))
+            if not batch:
+                return
+            yield from filter_outputs(batch)
+
+    def text_search(self, search, *, limit=0, table='assets', after=None,
+                    text_score=False):
+        """Return an iterator of the assets (or metadata, given the
+        ``table``) matching the text search, sorted by text score then
+        id.
+
+        All the stored assets and metadata belong to committed
+        transactions, so the hits are returned as they are.
+
+        Args:
+            after (tuple): if given, only the hits after the one with this
+                ``(score, id)`` are returned.
+            text_score (bool): whether to return the text score (as
+                ``score``) with each hit.
+        """
+        return backend.query.text_search(self.connection, search,
+                                         limit=limit, table=table,
+                                         after=after, text_score=text_score)
 
     def get_spent(self, txid, output, current_transactions=[]):
         transactions = backend.query.get_spent(self.connection, txid,
@@ -249,19 +564,107 @@ class BigchainDB(Bigchain):
                 '`{}` was spent more than once. There is a problem'
                 ' with the chain'.format(txid))
 
-        for ctxn in current_transactions:
-            for ctxn_input in ctxn.inputs:
-                if ctxn_input.fulfills.txid == txid and\
-                   ctxn_input.fulfills.output == output:
-                    transactions.append(ctxn.to_dict())
+        current_transactions = BlockTransactions.of(current_transactions)
+        spenders = current_transactions.get_spenders(txid, output)
 
-        transaction = None
-        if len(transactions) > 1:
+        if len(transactions) + len(spenders) > 1:
             raise DoubleSpend('tx "{}" spends inputs twice'.format(txid))
         elif transactions:
-            transaction = Transaction.from_db(self, transactions[0])
+            return self.get_transaction(transactions[0]['id'])
+        elif spenders:
+            return spenders[0]
+
+    def resolve_inputs(self, links, current_transactions=[],
+                       spender_id=None):
+        """Look up the outputs spent by the given inputs.
+
+        The outputs and the transactions spending them are fetched in one
+        query each, whatever the number of inputs, and only the fields
+        needed to validate the inputs are read.
+
+        Args:
+            links (list): the :class:`~bigchaindb.common.transaction.
+                TransactionLink` of the inputs.
+            current_transactions (list|:class:`~bigchaindb.models.
+                BlockTransactions`): transactions of the block being built,
+                which are not yet stored in the database.
+            spender_id (str): the id of the spending transaction, which
+                may already be stored.
 
-        return transaction
+        Returns:
+            dict: the :class:`~bigchaindb.common.transaction.UnspentOutput`
+            of each ``(txid, output)`` pair.
+
+        Raises:
+            InputDoesNotExist: if an output does not exist.
+            DoubleSpend: if an output was already spent.
+            CriticalDoubleSpend: if an output was spent more than once in
+                the chain.
+        """
+        current_transactions = BlockTransactions.of(current_transactions)
+        txids = list({link.txid for link in links})
+        stored = {
+            tx['id']: tx for tx in
+            backend.query.get_transaction_outputs(self.connection, txids)
+        }
+
+        spenders = defaultdict(list)
+        for tx in backend.query.get_spending_transaction_inputs(
+                self.connection, [link.to_dict() for link in links]):
+            for input_ in tx['inputs']:
+                fulfills = input_['fulfills']
+                if fulfills:
+                    spenders[(fulfills['transaction_id'],
+                              fulfills['output_index'])].append(tx['id'])
+
+        outputs = {}
+        for link in links:
+            key = (link.txid, link.output)
+            if key in outputs:
+                continue
+
+            if link.txid in stored:
+                tx = stored[link.txid]
+                if link.output >= len(tx['outputs']):
+                    raise InputDoesNotExist("input `{}` doesn't exist"
+                                            .format(link.txid))
+                output = tx['outputs'][link.output]
+                asset_id = (tx['id'] if tx['operation'] == Transaction.CREATE
+                            else tx['asset']['id'])
+                amount = int(output['amount'])
+                condition_uri = output['condition']['uri']
+            else:
+                tx = current_transactions.get(link.txid)
+                if tx is None or link.output >= len(tx.outputs):
+                    raise InputDoesNotExist("input `{}` doesn't exist"
+                                            .format(link.txid))
+                output = tx.outputs[link.output]
+                asset_id = Transaction.get_asset_id(tx)
+                amount = output.amount
+                condition_uri = output.fulfillment.condition_uri
+
+            if len(spenders[key]) > 1:
+                raise core_exceptions.CriticalDoubleSpend(
+                    '`{}` was spent more than once. There is a problem'
+                    ' with the chain'.format(link.txid))
+            spent_by = spenders[key] + [
+                spender.id for spender in
+                current_transactions.get_spenders(link.txid, link.output)]
+            if len(spent_by) > 1:
+                raise DoubleSpend('tx "{}" spends inputs twice'
+                                  .format(link.txid))
+            if spent_by and spent_by[0] != spender_id:
+                raise DoubleSpend('input `{}` was already spent'
+                                  .format(link.txid))
+
+            outputs[key] = UnspentOutput(
+                transaction_id=link.txid,
+                output_index=link.output,
+                amount=amount,
+                asset_id=asset_id,
+                condition_uri=condition_uri,
+            )
+        return outputs
 
     def store_block(self, block):
         """Create a new block."""
@@ -290,14 +693,9 @@ class BigchainDB(Bigchain):
 
         block = backend.query.get_block(self.connection, block_id)
         if block:
-            transactions = backend.query.get_transactions(self.connection, block['transactions'])
-            transactions = Transaction.from_db(self, transactions)
-
             block = {'height': block['height'],
-                     'transactions': []}
-            block_txns = block['transactions']
-            for txn in transactions:
-                block_txns.append(txn.to_dict())
+                     'transactions': self.get_raw_transactions(
+                         block['transactions'])}
 
         status = None
         if include_status:
@@ -309,6 +707,33 @@ class BigchainDB(Bigchain):
         else:
             return block
 
+    def get_blocks(self, from_height, to_height):
+        """Get the non empty blocks with a height between ``from_height``
+        and ``to_height`` (both included), ordered by height.
+
+        The transactions of the blocks are returned as stored, i.e.
+        without the asset of ``CREATE`` transactions nor the metadata.
+
+        Returns:
+            list: the blocks, as ``{'height', 'transactions'}``
+            dictionaries.
+        """
+
+        blocks = backend.query.get_blocks(self.connection, from_height,
+                                          to_height)
+        blocks = [block for block in blocks if block['transactions']]
+        transaction_ids = [txid for block in blocks
+                           for txid in block['transactions']]
+        transactions = {}
+        if transaction_ids:
+            stored = backend.query.get_transactions(self.connection,
+                                                    transaction_ids)
+            transactions = {tx['id']: tx for tx in stored}
+        return [{'height': block['height'],
+                 'transactions': [transactions[txid]
+                                  for txid in block['transactions']]}
+                for block in blocks]
+
     def get_block_containing_tx(self, txid):
         """Retrieve the list of blocks (block ids) containing a
            transaction with transaction id `txid`
@@ -325,7 +750,8 @@ class BigchainDB(Bigchain):
 
         return [block['height'] for block in blocks]
 
-    def validate_transaction(self, tx, current_transactions=[]):
+    def validate_transaction(self, tx, current_transactions=[],
+                             verify_signatures=True):
         """Validate a transaction against the current status of the database."""
 
         transaction = tx
@@ -342,24 +768,84 @@ class BigchainDB(Bigchain):
             except ValidationError as e:
                 logger.warning('Invalid transaction (%s): %s', type(e).__name__, e)
                 return False
-        return transaction.validate(self, current_transactions)
+        return transaction.validate(self, current_transactions,
+                                    verify_signatures)
 
-    def is_valid_transaction(self, tx, current_transactions=[]):
+    def is_valid_transaction(self, tx, current_transactions=[],
+                             verify_signatures=True):
         # NOTE: the function returns the Transaction object in case
         # the transaction is valid
         try:
-            return self.validate_transaction(tx, current_transactions)
+            return self.validate_transaction(tx, current_transactions,
+                                             verify_signatures)
         except ValidationError as e:
             logger.warning('Invalid transaction (%s): %s', type(e).__name__, e)
             return False
 
+    def validate_transactions(self, transactions):
+        """Validate transactions submitted together.
+
+        Each transaction is validated against the current status of the
+        database and the valid transactions preceding it, so duplicates
+        and double spends within the batch are rejected. The fulfillments
+        of all the transactions are verified at once, in parallel.
+
+        Args:
+            transactions (list): the transactions, as dictionaries.
+
+        Returns:
+            list: a ``(transaction, error)`` tuple per transaction, with
+            either the valid :class:`~bigchaindb.models.Transaction` or
+            the :class:`~bigchaindb.common.exceptions.ValidationError`
+            rejecting it.
+        """
+        signature_batch = SignatureBatch()
+        valid_transactions = BlockTransactions()
+        results = []
+        for tx in transactions:
+            try:
+                transaction = Transaction.from_dict(tx)
+                transaction.validate(self, valid_transactions,
+                                     signature_batch=signature_batch)
+            except ValidationError as e:
+                results.append((None, e))
+            else:
+                valid_transactions.append(transaction)
+                results.append((transaction, None))
+
+        invalid = signature_batch.verify()
+        if not invalid:
+            return results
+
+        # transactions spending an output of a rejected transaction are
+        # rejected too, since their inputs no longer exist
+        checked = []
+        for transaction, error in results:
+            if transaction is not None:
+                if transaction.id in invalid:
+                    error = InvalidSignature('Transaction signature is '
+                                             'invalid.')
+                else:
+                    spent = [input_.fulfills.txid
+                             for input_ in transaction.inputs
+                             if input_.fulfills and
+                             input_.fulfills.txid in invalid]
+                    if spent:
+                        invalid.add(transaction.id)
+                        error = InputDoesNotExist("input `{}` doesn't exist"
+                                                  .format(spent[0]))
+                if error is not None:
+                    transaction = None
+            checked.append((transaction, error))
+        return checked
+
     @property
     def fastquery(self):
         return fastquery.FastQuery(self.connection)
 
     def get_validators(self):
         try:
-            resp = requests.get('{}validators'.format(ENDPOINT))
+            resp = rpc.get_client().get('validators')
             validators = resp.json()['result']['validators']
             for v in validators:
                 v.pop('accum')
@@ -381,6 +867,20 @@ class BigchainDB(Bigchain):
     def store_pre_commit_state(self, state):
         return backend.query.store_pre_commit_state(self.connection, state)
 
+    def create_abci_traces_table(self):
+        """Create the capped table holding the block traces, if missing,
+        e.g. in a database initialized before it was introduced."""
+        return backend.schema.create_abci_traces_table(
+            self.connection, self.connection.dbname)
+
+    def store_abci_trace(self, trace):
+        return backend.query.store_abci_trace(self.connection, trace)
+
+    def get_abci_traces(self, limit=100):
+        """Return the performance traces of the latest blocks, newest
+        first."""
+        return list(backend.query.get_abci_traces(self.connection, limit))
+
 
 Block = namedtuple('Block', ('app_hash', 'height', 'transactions'))
 
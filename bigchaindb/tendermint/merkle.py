@@ -0,0 +1,112 @@
+"""Incrementally maintained Merkle tree over a set of hashes."""
+from binascii import hexlify
+
+try:
+    from hashlib import sha3_256
+except ImportError:
+    from sha3 import sha3_256
+
+
+# Prefix of the preimage of the inner nodes, to tell them apart from the
+# leaves.
+NODE_PREFIX = b'\x01'
+
+
+def _bit(leaf, depth):
+    return (leaf[depth >> 3] >> (7 - (depth & 7))) & 1
+
+
+class _Branch:
+    """Inner node of a :class:`MerkleTree`, covering two leaves or more."""
+
+    __slots__ = ('children', 'hash')
+
+    def __init__(self):
+        self.children = [None, None]
+        self.hash = None
+
+    def rehash(self):
+        left, right = (child.hash if isinstance(child, _Branch) else
+                       child or b'' for child in self.children)
+        self.hash = sha3_256(NODE_PREFIX + left + right).digest()
+
+
+class MerkleTree:
+    """Merkle tree over a set of leaves (hashes), positioned by their
+    bits.
+
+    The leaves are stored in a binary trie: at depth ``d`` a leaf goes
+    left or right depending on its ``d``-th bit, and a subtree holding
+    a single leaf is the leaf itself. The shape of the tree, and hence
+    its root, only depend on the set of leaves, not on the order in
+    which they were added.
+
+    Unlike :func:`~bigchaindb.tendermint.utils.merkleroot`, which
+    rebuilds the whole tree from the sorted leaves, adding or removing
+    a leaf only rehashes the nodes on its path, i.e. ``O(log n)``
+    hashes for uniformly distributed leaves.
+    """
+
+    def __init__(self, leaves=()):
+        """Create a new tree.
+
+        Args:
+            leaves (iterable): the leaves (:obj:`bytes`) to start with.
+        """
+        self.root = None
+        for leaf in leaves:
+            self.add(leaf)
+
+    def add(self, leaf):
+        """Add ``leaf`` to the tree. Adding a leaf twice is a no-op."""
+        self.root = self._add(self.root, leaf, 0)
+
+    def remove(self, leaf):
+        """Remove ``leaf`` from the tree, if present."""
+        self.root = self._remove(self.root, leaf, 0)
+
+    def merkle_root(self):
+        """Return the root of the tree in hexadecimal form.
+
+        The root of an empty tree is the hash of the empty string and
+        the root of a tree with a single leaf is the leaf, as for
+        :func:`~bigchaindb.tendermint.utils.merkleroot`.
+        """
+        if self.root is None:
+            return sha3_256(b'').hexdigest()
+        if isinstance(self.root, _Branch):
+            return hexlify(self.root.hash).decode()
+        return hexlify(self.root).decode()
+
+    def _add(self, node, leaf, depth):
+        if node is None:
+            return leaf
+        if not isinstance(node, _Branch):
+            if node == leaf:
+                return node
+            branch = _Branch()
+            branch.children[_bit(node, depth)] = node
+            node = branch
+
+        bit = _bit(leaf, depth)
+        node.children[bit] = self._add(node.children[bit], leaf, depth + 1)
+        node.rehash()
+        return node
+
+    def _remove(self, node, leaf, depth):
+        if node is None:
+            return None
+        if not isinstance(node, _Branch):
+            return None if node == leaf else node
+
+        bit = _bit(leaf, depth)
+        node.children[bit] = self._remove(node.children[bit], leaf, depth + 1)
+
+        # NOTE: a subtree left with a single leaf collapses into the leaf
+        left, right = node.children
+        if left is None and not isinstance(right, _Branch):
+            return right
+        if right is None and not isinstance(left, _Branch):
+            return left
+        node.rehash()
+        return node
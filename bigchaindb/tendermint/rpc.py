@@ -0,0 +1,225 @@
+"""Clients of the Tendermint RPC server.
+
+Each process uses a single client (see :func:`get_client`), holding a
+pool of keep-alive connections to Tendermint, instead of opening a new
+connection for every request.
+"""
+import asyncio
+import logging
+import os
+import time
+from os import getenv
+from uuid import uuid4
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+BIGCHAINDB_TENDERMINT_HOST = getenv('BIGCHAINDB_TENDERMINT_HOST',
+                                    'localhost')
+BIGCHAINDB_TENDERMINT_PORT = getenv('BIGCHAINDB_TENDERMINT_PORT',
+                                    '46657')
+ENDPOINT = 'http://{}:{}/'.format(BIGCHAINDB_TENDERMINT_HOST,
+                                  BIGCHAINDB_TENDERMINT_PORT)
+
+# Maximum number of connections kept open to Tendermint.
+RPC_POOL_SIZE = int(getenv('BIGCHAINDB_TENDERMINT_RPC_POOL_SIZE', 10))
+# Timeouts, in seconds. The read timeout has to cover the time needed to
+# commit a transaction, for `broadcast_tx_commit`.
+RPC_CONNECT_TIMEOUT = float(getenv('BIGCHAINDB_TENDERMINT_RPC_CONNECT_TIMEOUT',
+                                   5))
+RPC_READ_TIMEOUT = float(getenv('BIGCHAINDB_TENDERMINT_RPC_READ_TIMEOUT', 60))
+# Number of retries after a connection error, and delay before the first
+# retry, doubled for each of the next ones.
+RPC_RETRIES = int(getenv('BIGCHAINDB_TENDERMINT_RPC_RETRIES', 3))
+RPC_BACKOFF = float(getenv('BIGCHAINDB_TENDERMINT_RPC_BACKOFF', 0.1))
+
+
+def make_payload(method, params):
+    return {
+        'method': method,
+        'jsonrpc': '2.0',
+        'params': list(params),
+        'id': str(uuid4())
+    }
+
+
+class TendermintRPC:
+    """Client of the Tendermint RPC server, using a pool of keep-alive
+    connections.
+
+    Requests failing with a connection error are retried with an
+    exponential backoff; the broadcast methods are safe to retry, as
+    Tendermint ignores transactions already in its mempool cache.
+    """
+
+    def __init__(self, endpoint=ENDPOINT, pool_size=RPC_POOL_SIZE,
+                 timeout=(RPC_CONNECT_TIMEOUT, RPC_READ_TIMEOUT),
+                 retries=RPC_RETRIES, backoff=RPC_BACKOFF):
+        """Create a new client.
+
+        Args:
+            endpoint (str): the url of the RPC server.
+            pool_size (int): maximum number of connections to keep.
+            timeout (tuple): connect and read timeouts, in seconds.
+            retries (int): number of retries after a connection error.
+            backoff (float): delay before the first retry, in seconds.
+        """
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _request(self, send, url, **kwargs):
+        for attempt in range(self.retries + 1):
+            try:
+                return send(url, timeout=self.timeout, **kwargs)
+            except requests.exceptions.ConnectionError:
+                if attempt == self.retries:
+                    raise
+                delay = self.backoff * 2 ** attempt
+                logger.warning('Error while connecting to Tendermint, '
+                               'retrying in %ss', delay)
+                time.sleep(delay)
+
+    def call(self, method, *params):
+        """Call the JSON-RPC ``method``.
+
+        Returns:
+            :class:`requests.Response`: the response of the server.
+        """
+        return self._request(self.session.post, self.endpoint,
+                             json=make_payload(method, params))
+
+    def call_batch(self, calls):
+        """Send several JSON-RPC calls in a single batch request.
+
+        Args:
+            calls (list): a list of ``(method, params)`` tuples.
+
+        Returns:
+            list: the responses of the server, in the order of ``calls``
+            (``None`` for a call left unanswered).
+        """
+        payloads = [make_payload(method, params) for method, params in calls]
+        response = self._request(self.session.post, self.endpoint,
+                                 json=payloads).json()
+        if isinstance(response, dict):
+            # the whole batch was rejected, e.g. because it is malformed
+            return [response] * len(payloads)
+        responses = {item.get('id'): item for item in response}
+        return [responses.get(payload['id']) for payload in payloads]
+
+    def get(self, path):
+        """Send a GET request to the URI endpoint ``path``.
+
+        Returns:
+            :class:`requests.Response`: the response of the server.
+        """
+        return self._request(self.session.get, self.endpoint + path)
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncTendermintRPC:
+    """Asyncio variant of :class:`TendermintRPC`, to be used from the
+    aiohttp applications."""
+
+    def __init__(self, endpoint=ENDPOINT, pool_size=RPC_POOL_SIZE,
+                 timeout=RPC_READ_TIMEOUT, retries=RPC_RETRIES,
+                 backoff=RPC_BACKOFF, loop=None):
+        """Create a new client.
+
+        Args:
+            endpoint (str): the url of the RPC server.
+            pool_size (int): maximum number of connections to keep.
+            timeout (float): timeout of a request, in seconds.
+            retries (int): number of retries after a connection error.
+            backoff (float): delay before the first retry, in seconds.
+            loop: the event loop, defaults to the current one.
+        """
+        self.endpoint = endpoint
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.loop = loop or asyncio.get_event_loop()
+        self.session = None
+
+    def _get_session(self):
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.pool_size,
+                                             loop=self.loop)
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 loop=self.loop)
+        return self.session
+
+    @asyncio.coroutine
+    def _request(self, send, url, **kwargs):
+        for attempt in range(self.retries + 1):
+            try:
+                response = yield from send(url, timeout=self.timeout,
+                                           **kwargs)
+                try:
+                    return (yield from response.json())
+                finally:
+                    response.release()
+            except aiohttp.ClientConnectionError:
+                if attempt == self.retries:
+                    raise
+                delay = self.backoff * 2 ** attempt
+                logger.warning('Error while connecting to Tendermint, '
+                               'retrying in %ss', delay)
+                yield from asyncio.sleep(delay, loop=self.loop)
+
+    @asyncio.coroutine
+    def call(self, method, *params):
+        """Call the JSON-RPC ``method``.
+
+        Returns:
+            dict: the decoded response of the server.
+        """
+        session = self._get_session()
+        return (yield from self._request(session.post, self.endpoint,
+                                         json=make_payload(method, params)))
+
+    @asyncio.coroutine
+    def get(self, path):
+        """Send a GET request to the URI endpoint ``path``.
+
+        Returns:
+            dict: the decoded response of the server.
+        """
+        session = self._get_session()
+        return (yield from self._request(session.get, self.endpoint + path))
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+
+_client = None
+_client_pid = None
+
+
+def get_client():
+    """Return the :class:`TendermintRPC` client of the current process.
+
+    Connections cannot be shared across a fork, so a process forked after
+    creating the client gets a new one.
+    """
+    global _client, _client_pid
+
+    if _client is None or _client_pid != os.getpid():
+        _client = TendermintRPC()
+        _client_pid = os.getpid()
+    return _client
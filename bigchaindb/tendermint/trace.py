@@ -0,0 +1,74 @@
+"""Performance traces of the blocks processed by the ABCI application."""
+from time import perf_counter, process_time, time
+
+
+class BlockTrace:
+    """Record where the time goes while processing a block.
+
+    A trace is started in ``begin_block`` and completed in ``commit``.
+    It records the wall time spent in each ABCI call, the number of
+    accepted and rejected transactions, the time spent waiting for the
+    database and the CPU time used by the process.
+    """
+
+    PHASES = ('begin_block', 'deliver_tx', 'end_block', 'commit')
+
+    def __init__(self, connection):
+        """Start a new trace.
+
+        Args:
+            connection (:class:`~bigchaindb.backend.connection.Connection`):
+                the connection whose query time is measured.
+        """
+        self.connection = connection
+        self.timestamp = time()
+        self.wall_start = perf_counter()
+        self.cpu_start = process_time()
+        self.db_start = self._query_time()
+        self.durations = {phase: 0.0 for phase in self.PHASES}
+        self.deliver_tx_max = 0.0
+        self.accepted = {}
+        self.rejected = 0
+
+    def _query_time(self):
+        return getattr(self.connection, 'query_time', 0.0)
+
+    def record(self, phase, start):
+        """Record a call to ``phase`` started at ``start`` (as given by
+        :func:`time.perf_counter`)."""
+        duration = perf_counter() - start
+        self.durations[phase] += duration
+        if phase == 'deliver_tx':
+            self.deliver_tx_max = max(self.deliver_tx_max, duration)
+
+    def accept(self, transaction_id, size):
+        """Count a transaction accepted in the block, of ``size`` bytes."""
+        self.accepted[transaction_id] = size
+
+    def reject(self):
+        """Count a rejected transaction."""
+        self.rejected += 1
+
+    def to_dict(self, height):
+        """Complete the trace and return it as a dictionary.
+
+        Times are in seconds. ``bytes_written`` is the size of the raw
+        transactions stored by the block.
+        """
+        wall_time = perf_counter() - self.wall_start
+        db_time = self._query_time() - self.db_start
+        return {
+            'height': height,
+            'timestamp': self.timestamp,
+            'begin_block': self.durations['begin_block'],
+            'deliver_tx': self.durations['deliver_tx'],
+            'deliver_tx_max': self.deliver_tx_max,
+            'end_block': self.durations['end_block'],
+            'commit': self.durations['commit'],
+            'wall_time': wall_time,
+            'db_time': db_time,
+            'cpu_time': process_time() - self.cpu_start,
+            'accepted': len(self.accepted),
+            'rejected': self.rejected,
+            'bytes_written': sum(self.accepted.values()),
+        }
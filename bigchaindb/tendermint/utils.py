@@ -1,6 +1,8 @@
 import base64
 import hashlib
 import json
+import os
+import signal
 from binascii import hexlify
 
 try:
@@ -8,6 +10,45 @@ try:
 except ImportError:
     from sha3 import sha3_256
 
+# File in which the node writes its process id, so that commands such as
+# `bigchaindb upsert-validator` can signal it.
+PID_FILE = os.getenv('BIGCHAINDB_PID_FILE',
+                     os.path.join(os.path.expanduser('~'), '.bigchaindb.pid'))
+
+
+def write_pid_file():
+    """Write the id of the current process to ``PID_FILE``."""
+
+    with open(PID_FILE, 'w') as pid_file:
+        pid_file.write(str(os.getpid()))
+
+
+def remove_pid_file():
+    """Remove ``PID_FILE`` if it was written by the current process."""
+
+    try:
+        with open(PID_FILE) as pid_file:
+            if int(pid_file.read()) == os.getpid():
+                os.remove(PID_FILE)
+    except (OSError, ValueError):
+        pass
+
+
+def signal_validator_update():
+    """Tell the node that a validator update was stored.
+
+    Returns:
+        bool: ``False`` if no node is running on this host.
+    """
+
+    try:
+        with open(PID_FILE) as pid_file:
+            pid = int(pid_file.read())
+        os.kill(pid, signal.SIGUSR1)
+    except (OSError, ValueError):
+        return False
+    return True
+
 
 def encode_transaction(value):
     """Encode a transaction (dict) to Base64."""
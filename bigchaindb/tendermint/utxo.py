@@ -0,0 +1,91 @@
+"""In-memory index of the unspent outputs (UTXO set)."""
+try:
+    from hashlib import sha3_256
+except ImportError:
+    from sha3 import sha3_256
+
+from bigchaindb.common.transaction import UnspentOutput
+from bigchaindb.tendermint.merkle import MerkleTree
+
+
+def utxo_hash(transaction_id, output_index):
+    """Hash identifying an unspent output in the UTXO Merkle tree."""
+    return sha3_256(
+        '{}{}'.format(transaction_id, output_index).encode()).digest()
+
+
+class UTXOIndex:
+    """Mirror of the ``utxos`` collection, keyed by output.
+
+    Resolving the inputs of a ``TRANSFER`` transaction requires, for
+    every input, fetching the spent transaction (with its asset and
+    metadata) and looking for a transaction spending the same output.
+    The index answers both questions with a single dictionary lookup:
+    an output found in it is committed and not spent by any committed
+    transaction.
+
+    The index also maintains the Merkle tree of the UTXO set, so that
+    its root can be obtained without reading the whole collection.
+
+    The index must only be updated once the corresponding change has
+    been written to the database, so that it never gets ahead of the
+    ``utxos`` collection it mirrors.
+    """
+
+    def __init__(self, unspent_outputs=()):
+        """Create a new index.
+
+        Args:
+            unspent_outputs (iterable): the unspent outputs to start
+                with, as dictionaries or
+                :class:`~bigchaindb.common.transaction.UnspentOutput`.
+        """
+        self.outputs = {}
+        self.merkle_tree = MerkleTree()
+        for unspent_output in unspent_outputs:
+            self.add(unspent_output)
+
+    def get(self, transaction_id, output_index):
+        """Return the :class:`~bigchaindb.common.transaction.UnspentOutput`
+        for the given output, or ``None`` if it is not in the index.
+        """
+        value = self.outputs.get((transaction_id, output_index))
+        if value is None:
+            return None
+        return UnspentOutput(transaction_id, output_index, *value)
+
+    def add(self, unspent_output):
+        """Add an unspent output to the index.
+
+        Args:
+            unspent_output (dict|:class:`~bigchaindb.common.transaction.
+                UnspentOutput`): the output to add.
+        """
+        if isinstance(unspent_output, dict):
+            unspent_output = UnspentOutput(
+                transaction_id=unspent_output['transaction_id'],
+                output_index=unspent_output['output_index'],
+                amount=unspent_output['amount'],
+                asset_id=unspent_output['asset_id'],
+                condition_uri=unspent_output['condition_uri'],
+            )
+        key = (unspent_output.transaction_id, unspent_output.output_index)
+        self.outputs[key] = (unspent_output.amount,
+                             unspent_output.asset_id,
+                             unspent_output.condition_uri)
+        self.merkle_tree.add(utxo_hash(*key))
+
+    def remove(self, transaction_id, output_index):
+        """Remove an output from the index, if present."""
+        if self.outputs.pop((transaction_id, output_index), None) is not None:
+            self.merkle_tree.remove(utxo_hash(transaction_id, output_index))
+
+    def merkle_root(self):
+        """Return the Merkle root of the UTXO set, in hexadecimal form."""
+        return self.merkle_tree.merkle_root()
+
+    def __contains__(self, output):
+        return output in self.outputs
+
+    def __len__(self):
+        return len(self.outputs)
@@ -0,0 +1,158 @@
+"""Batched verification of transaction fulfillments.
+
+Verifying the ed25519 signatures of the inputs is the most expensive
+part of validating a transaction, and the signatures of different
+transactions can be verified independently. Transactions submitted
+together are validated first, with their fulfillments queued in a
+:class:`SignatureBatch`, which then verifies them at once, spreading the
+work over a pool of processes.
+
+The ABCI application cannot defer the verification to the end of a
+block: Tendermint records the result of ``deliver_tx`` as soon as it is
+returned, so each transaction has to be fully validated by then.
+"""
+import logging
+import multiprocessing as mp
+import os
+import threading
+
+from bigchaindb.common.exceptions import InvalidSignature
+from bigchaindb.common.transaction import Input, Transaction
+
+
+logger = logging.getLogger(__name__)
+
+
+def verify_fulfillments(work_item):
+    """Verify the fulfillments of all the inputs of a transaction.
+
+    This function runs in the worker processes, so it only receives
+    plain (picklable) data.
+
+    Args:
+        work_item (tuple): a tuple ``(operation, message, inputs)``,
+            where ``message`` is the serialized transaction without
+            signatures and ``inputs`` is a list of
+            ``(input_dict, output_condition_uri)`` tuples, or ``None``
+            if the inputs do not match the spent outputs.
+
+    Returns:
+        bool: ``True`` if all the fulfillments are valid.
+    """
+    operation, message, inputs = work_item
+    if inputs is None:
+        return False
+
+    for input_dict, output_condition_uri in inputs:
+        try:
+            input_ = Input.from_dict(input_dict)
+        except InvalidSignature:
+            return False
+
+        if not Transaction._input_valid(input_, operation, message,
+                                        output_condition_uri):
+            return False
+    return True
+
+
+class SignatureBatch:
+    """Collect the fulfillments of transactions submitted together and
+    verify them at once."""
+
+    def __init__(self, processes=None, min_pool_size=64):
+        """Create a new batch.
+
+        Args:
+            processes (int): number of worker processes of the pool shared
+                by the process (see :func:`get_shared_pool`). Defaults to
+                the number of CPUs. Use ``0`` to always verify in process.
+            min_pool_size (int): batches smaller than this are verified
+                in process, as they are not worth the IPC overhead.
+        """
+        if processes is None:
+            processes = mp.cpu_count()
+        self.processes = processes
+        self.min_pool_size = min_pool_size
+        self.pool = None
+        self.transaction_ids = []
+        self.work_items = []
+
+    def add(self, transaction, condition_uris):
+        """Queue the fulfillments of ``transaction`` for verification.
+
+        Args:
+            transaction (:class:`~bigchaindb.models.Transaction`): a
+                transaction that passed all the other checks.
+            condition_uris (list): the condition uris of the outputs
+                spent by the transaction, one per input (``None`` for
+                the inputs of a ``CREATE`` transaction).
+        """
+        tx_dict = transaction.to_dict()
+
+        message = Transaction._remove_signatures(tx_dict)
+        message['id'] = None
+        message = Transaction._to_str(message)
+
+        if len(condition_uris) != len(tx_dict['inputs']):
+            # Mirrors the check done by `Transaction._inputs_valid`; such a
+            # transaction can never be valid.
+            inputs = None
+        else:
+            inputs = list(zip(tx_dict['inputs'], condition_uris))
+
+        self.transaction_ids.append(transaction.id)
+        self.work_items.append((transaction.operation, message, inputs))
+
+    def verify(self):
+        """Verify all the queued fulfillments and empty the batch.
+
+        Returns:
+            set: the ids of the transactions with at least one invalid
+            fulfillment.
+        """
+        transaction_ids, work_items = self.transaction_ids, self.work_items
+        self.clear()
+
+        if self.processes > 0 and len(work_items) >= self.min_pool_size:
+            if self.pool is None:
+                self.pool = get_shared_pool(self.processes)
+            chunksize = max(1, len(work_items) // (self.processes * 4))
+            results = self.pool.map(verify_fulfillments, work_items, chunksize)
+        else:
+            results = [verify_fulfillments(item) for item in work_items]
+
+        invalid = {txid for txid, valid in zip(transaction_ids, results)
+                   if not valid}
+        if invalid:
+            logger.warning('Rejecting %s transaction(s) with invalid '
+                           'fulfillments', len(invalid))
+        return invalid
+
+    def clear(self):
+        """Drop all the queued fulfillments."""
+        self.transaction_ids = []
+        self.work_items = []
+
+    def __len__(self):
+        return len(self.work_items)
+
+
+_shared_pool = None
+_shared_pool_pid = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_pool(processes):
+    """Return the pool of worker processes shared by the short-lived
+    batches of the current process (e.g. one per HTTP request).
+
+    The pool is created, with ``processes`` workers, on the first call;
+    a process forked afterwards gets its own.
+    """
+    global _shared_pool, _shared_pool_pid
+
+    with _shared_pool_lock:
+        if _shared_pool is None or _shared_pool_pid != os.getpid():
+            _shared_pool = mp.Pool(processes)
+            _shared_pool_pid = os.getpid()
+        return _shared_pool
@@ -7,6 +7,7 @@ from bigchaindb.web.views import (
     info,
     transactions as tx,
     outputs,
+    traces,
     votes,
     validators,
 )
@@ -31,9 +32,11 @@ ROUTES_API_V1 = [
     r('metadata/', metadata.MetadataApi),
     r('blocks/<string:block_id>', blocks.BlockApi),
     r('blocks/', blocks.BlockListApi),
+    r('transactions/batch', tx.TransactionBatchApi),
     r('transactions/<string:tx_id>', tx.TransactionApi),
     r('transactions', tx.TransactionListApi),
     r('outputs/', outputs.OutputListApi),
+    r('traces/', traces.TraceListApi),
     r('votes/', votes.VotesApi),
     r('validators/', validators.ValidatorsApi),
 ]
@@ -5,10 +5,10 @@ For more information please refer to the documentation: http://bigchaindb.com/ht
 import logging
 
 from flask_restful import reqparse, Resource
-from flask import current_app
 
 from bigchaindb.backend.exceptions import OperationError
-from bigchaindb.web.views.base import make_error
+from bigchaindb.web.views import parameters
+from bigchaindb.web.views.base import make_error, make_listing
 
 logger = logging.getLogger(__name__)
 
@@ -20,29 +20,38 @@ class AssetListApi(Resource):
         Args:
             search (str): Text search string to query the text index
             limit (int, optional): Limit the number of returned documents.
+            after (str, optional): cursor of the page to get, as given in
+                the ``Link`` header of the previous page.
 
         Return:
             A list of assets that match the query.
         """
         parser = reqparse.RequestParser()
         parser.add_argument('search', type=str, required=True)
-        parser.add_argument('limit', type=int)
+        parser.add_argument('limit', type=parameters.valid_limit)
+        parser.add_argument('after', type=parameters.valid_search_cursor)
         args = parser.parse_args()
 
         if not args['search']:
             return make_error(400, 'text_search cannot be empty')
-        if not args['limit']:
-            # if the limit is not specified do not pass None to `text_search`
-            del args['limit']
-
-        pool = current_app.config['bigchain_pool']
-
-        with pool() as bigchain:
-            assets = bigchain.text_search(**args)
+        limit = args['limit']
+        for name in ('limit', 'after'):
+            # if a pagination argument is not specified do not pass None
+            # to `text_search`
+            if not args[name]:
+                del args[name]
+        if limit:
+            # the cursor of the next page needs the score of the last hit
+            args['text_score'] = True
 
         try:
             # This only works with MongoDB as the backend
-            return list(assets)
+            return make_listing(
+                lambda bigchain: bigchain.text_search(**args),
+                limit=limit,
+                cursor_of=lambda hit: (hit['score'], hit['id']),
+                render=lambda hit: {key: value for key, value in hit.items()
+                                    if key != 'score'})
         except OperationError as e:
             return make_error(
                 400,
@@ -1,14 +1,20 @@
 """Common classes and methods for API handlers
 """
+import base64
 import logging
+from itertools import chain, islice
+from urllib.parse import urlencode
 
-from flask import jsonify, request
+import rapidjson
+from flask import current_app, jsonify, request, stream_with_context
 
 from bigchaindb import config
 
 
 logger = logging.getLogger(__name__)
 
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
 
 def make_error(status_code, message=None):
     if status_code == 404 and message is None:
@@ -36,3 +42,79 @@ def base_ws_uri():
     host = config['wsserver']['advertised_host']
     port = config['wsserver']['advertised_port']
     return '{}://{}:{}'.format(scheme, host, port)
+
+
+def base_ws_http_uri():
+    """Base HTTP URL of the WebSocket server, as advertised to external
+    clients (see :func:`base_ws_uri`), for its plain HTTP endpoints."""
+
+    scheme = 'https' if config['wsserver']['advertised_scheme'] == 'wss' \
+        else 'http'
+    host = config['wsserver']['advertised_host']
+    port = config['wsserver']['advertised_port']
+    return '{}://{}:{}'.format(scheme, host, port)
+
+
+def encode_cursor(key):
+    """Make the opaque cursor given as ``after`` to get the page following
+    an item, out of the key the item is sorted by."""
+    return base64.urlsafe_b64encode(rapidjson.dumps(key).encode()).decode()
+
+
+def make_listing(fetch, *, limit=0, cursor_of=None, render=None):
+    """Make the response to a listing request.
+
+    The items are sent as a JSON array or, if the client accepts it, as
+    newline delimited JSON (NDJSON). Pages (with a ``limit``) are read
+    before being sent, with a ``Link`` header to the next page if they are
+    full. Full listings in NDJSON are streamed as they are read from the
+    database, once the first item is read, so that the errors of the query
+    are still raised to the caller.
+
+    Args:
+        fetch (callable): given a ``bigchain`` instance, returns an
+            iterator of the items.
+        limit (int): the size of a page, or ``0`` for no pagination.
+        cursor_of (callable): gives the sort key of an item, for the
+            cursor of the next page.
+        render (callable): turns an item into the JSON serializable object
+            to send.
+    """
+    render = render or (lambda item: item)
+    pool = current_app.config['bigchain_pool']
+    ndjson = request.accept_mimetypes.best_match(
+        ['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+    if ndjson and not limit:
+        def generate():
+            with pool() as bigchain:
+                items = iter(fetch(bigchain))
+                first = list(islice(items, 1))
+                yield
+                for item in chain(first, items):
+                    yield rapidjson.dumps(render(item)) + '\n'
+
+        lines = generate()
+        # run the query before the response starts
+        next(lines)
+        return current_app.response_class(stream_with_context(lines),
+                                          mimetype=NDJSON_MIMETYPE)
+
+    with pool() as bigchain:
+        items = list(islice(fetch(bigchain), limit or None))
+
+    if ndjson:
+        response = current_app.response_class(
+            ''.join(rapidjson.dumps(render(item)) + '\n' for item in items),
+            mimetype=NDJSON_MIMETYPE)
+    else:
+        response = current_app.response_class(
+            rapidjson.dumps([render(item) for item in items]),
+            mimetype='application/json')
+
+    if limit and len(items) == limit:
+        args = request.args.copy()
+        args['after'] = encode_cursor(cursor_of(items[-1]))
+        response.headers['Link'] = '<{}?{}>; rel="next"'.format(
+            request.base_url, urlencode(list(args.items(multi=True))))
+    return response
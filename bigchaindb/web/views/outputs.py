@@ -1,7 +1,7 @@
-from flask import current_app
 from flask_restful import reqparse, Resource
 
 from bigchaindb.web.views import parameters
+from bigchaindb.web.views.base import make_listing
 
 
 class OutputListApi(Resource):
@@ -16,11 +16,18 @@ class OutputListApi(Resource):
         parser.add_argument('public_key', type=parameters.valid_ed25519,
                             required=True)
         parser.add_argument('spent', type=parameters.valid_bool)
+        parser.add_argument('limit', type=parameters.valid_limit)
+        parser.add_argument('after', type=parameters.valid_output_cursor)
         args = parser.parse_args(strict=True)
 
-        pool = current_app.config['bigchain_pool']
-        with pool() as bigchain:
-            outputs = bigchain.get_outputs_filtered(args['public_key'],
-                                                    args['spent'])
-            return [{'transaction_id': output.txid, 'output_index': output.output}
-                    for output in outputs]
+        # only pass the pagination arguments that are given
+        pagination = {name: args[name] for name in ('limit', 'after')
+                      if args[name]}
+
+        return make_listing(
+            lambda bigchain: bigchain.get_outputs_filtered(
+                args['public_key'], args['spent'], **pagination),
+            limit=args['limit'],
+            cursor_of=lambda output: (output.txid, output.output),
+            render=lambda output: {'transaction_id': output.txid,
+                                   'output_index': output.output})
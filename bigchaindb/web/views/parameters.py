@@ -1,5 +1,8 @@
+import base64
 import re
 
+import rapidjson
+
 
 def valid_txid(txid):
     if re.match('^[a-fA-F0-9]{64}$', txid):
@@ -40,3 +43,46 @@ def valid_mode(mode):
     if mode == 'commit':
         return 'broadcast_tx_commit'
     raise ValueError('Mode must be "async", "sync" or "commit"')
+
+
+def valid_limit(limit):
+    limit = int(limit)
+    if limit < 0:
+        raise ValueError('Limit must be a positive integer')
+    return limit
+
+
+def _decode_cursor(cursor):
+    try:
+        return rapidjson.loads(base64.urlsafe_b64decode(cursor).decode())
+    except (TypeError, ValueError):
+        raise ValueError('Invalid cursor')
+
+
+def valid_transaction_cursor(cursor):
+    txid = _decode_cursor(cursor)
+    if not isinstance(txid, str):
+        raise ValueError('Invalid cursor')
+    return valid_txid(txid)
+
+
+def valid_output_cursor(cursor):
+    key = _decode_cursor(cursor)
+    try:
+        txid, output = key
+        if isinstance(output, int) and not isinstance(output, bool):
+            return valid_txid(txid), output
+    except (TypeError, ValueError):
+        pass
+    raise ValueError('Invalid cursor')
+
+
+def valid_search_cursor(cursor):
+    key = _decode_cursor(cursor)
+    try:
+        score, id_ = key
+        if isinstance(score, (int, float)) and isinstance(id_, str):
+            return score, id_
+    except (TypeError, ValueError):
+        pass
+    raise ValueError('Invalid cursor')
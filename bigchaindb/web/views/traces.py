@@ -0,0 +1,23 @@
+"""This module provides the blueprint for the ABCI traces API endpoint."""
+from flask import current_app
+from flask_restful import Resource, reqparse
+
+
+class TraceListApi(Resource):
+    def get(self):
+        """API endpoint to get the performance traces of the latest
+        blocks processed by the node.
+
+        Return:
+            A ``list`` of traces, newest first.
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('limit', type=int, default=100)
+        args = parser.parse_args(strict=True)
+
+        pool = current_app.config['bigchain_pool']
+
+        with pool() as bigchain:
+            traces = bigchain.get_abci_traces(max(0, args['limit']))
+
+        return traces
@@ -4,16 +4,22 @@ For more information please refer to the documentation: http://bigchaindb.com/ht
 """
 import logging
 
-from flask import current_app, request, jsonify
+import rapidjson
+from flask import current_app, request, jsonify, redirect
 from flask_restful import Resource, reqparse
 
 from bigchaindb.common.exceptions import SchemaValidationError, ValidationError
 from bigchaindb.models import Transaction
-from bigchaindb.web.views.base import make_error
+from bigchaindb.web.views.base import (base_ws_http_uri, make_error,
+                                       make_listing)
 from bigchaindb.web.views import parameters
+from bigchaindb.web.websocket_server import COMMIT_ENDPOINT
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of transactions accepted by a batch request.
+MAX_BATCH_SIZE = 1000
+
 
 class TransactionApi(Resource):
     def get(self, tx_id):
@@ -28,12 +34,14 @@ class TransactionApi(Resource):
         pool = current_app.config['bigchain_pool']
 
         with pool() as bigchain:
-            tx, status = bigchain.get_transaction(tx_id, include_status=True)
+            tx = bigchain.get_raw_transaction(tx_id)
 
-        if not tx or status is not bigchain.TX_VALID:
+        if not tx:
             return make_error(404)
 
-        return tx.to_dict()
+        # the transaction is served as stored, without building a model
+        return current_app.response_class(rapidjson.dumps(tx),
+                                          mimetype='application/json')
 
 
 class TransactionListApi(Resource):
@@ -42,12 +50,22 @@ class TransactionListApi(Resource):
         parser.add_argument('operation', type=parameters.valid_operation)
         parser.add_argument('asset_id', type=parameters.valid_txid,
                             required=True)
+        parser.add_argument('limit', type=parameters.valid_limit)
+        parser.add_argument('after',
+                            type=parameters.valid_transaction_cursor)
         args = parser.parse_args()
 
-        with current_app.config['bigchain_pool']() as bigchain:
-            txs = bigchain.get_transactions_filtered(**args)
+        limit = args['limit']
+        for name in ('limit', 'after'):
+            # only pass the pagination arguments that are given
+            if not args[name]:
+                del args[name]
 
-        return [tx.to_dict() for tx in txs]
+        return make_listing(
+            lambda bigchain: bigchain.get_transactions_filtered(**args),
+            limit=limit,
+            cursor_of=lambda tx: tx.id,
+            render=lambda tx: tx.to_dict())
 
     def post(self):
         """API endpoint to push transactions to the Federation.
@@ -90,6 +108,11 @@ class TransactionListApi(Resource):
                     'Invalid transaction ({}): {}'.format(type(e).__name__, e)
                 )
             else:
+                if mode == 'broadcast_tx_commit':
+                    # the WebSocket server waits for the block committing
+                    # the transaction, without holding a worker
+                    return redirect(base_ws_http_uri() + COMMIT_ENDPOINT,
+                                    code=307)
                 status_code, message = bigchain.write_transaction(tx_obj, mode)
 
         if status_code == 202:
@@ -98,3 +121,69 @@ class TransactionListApi(Resource):
             return response
         else:
             return make_error(status_code, message)
+
+
+def _format_validation_error(error):
+    if isinstance(error, SchemaValidationError):
+        return 'Invalid transaction schema: {}'.format(error.__cause__.message)
+    return 'Invalid transaction ({}): {}'.format(type(error).__name__, error)
+
+
+class TransactionBatchApi(Resource):
+    def post(self):
+        """API endpoint to push several transactions to the Federation at
+        once.
+
+        The transactions are validated together and the valid ones are
+        forwarded to Tendermint in a single request.
+
+        Return:
+            A list with the outcome (``status`` and ``message``) for each
+            transaction, in the order they were given.
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('mode', type=parameters.valid_mode,
+                            default='broadcast_tx_async')
+        args = parser.parse_args()
+        mode = str(args['mode'])
+
+        pool = current_app.config['bigchain_pool']
+
+        txs = request.get_json(force=True)
+        if not isinstance(txs, list):
+            return make_error(400, 'The body must be a list of transactions')
+        if len(txs) > MAX_BATCH_SIZE:
+            return make_error(
+                400,
+                'Too many transactions, the maximum is {}'.format(
+                    MAX_BATCH_SIZE)
+            )
+
+        results = [None] * len(txs)
+        candidates = []
+        for i, tx in enumerate(txs):
+            if isinstance(tx, dict):
+                candidates.append((i, tx))
+            else:
+                results[i] = (400, 'Invalid transaction: not an object')
+
+        with pool() as bigchain:
+            validated = bigchain.validate_transactions(
+                [tx for _, tx in candidates])
+            valid = []
+            for (i, tx), (tx_obj, error) in zip(candidates, validated):
+                if error is not None:
+                    results[i] = (400, _format_validation_error(error))
+                else:
+                    valid.append((i, tx_obj))
+
+            written = bigchain.write_transactions(
+                [tx_obj for _, tx_obj in valid], mode)
+            for (i, _), result in zip(valid, written):
+                results[i] = result
+
+        return [{
+            'id': tx.get('id') if isinstance(tx, dict) else None,
+            'status': status_code,
+            'message': message,
+        } for tx, (status_code, message) in zip(txs, results)]
@@ -15,6 +15,8 @@ import json
 import asyncio
 import logging
 import threading
+from collections import defaultdict, deque
+from os import getenv
 from uuid import uuid4
 
 import aiohttp
@@ -22,11 +24,35 @@ from aiohttp import web
 
 from bigchaindb import config
 from bigchaindb.events import EventTypes
+from bigchaindb.tendermint.lib import BigchainDB
+from bigchaindb.tendermint.rpc import AsyncTendermintRPC
+from bigchaindb.tendermint.utils import encode_transaction
+from bigchaindb.web.views import parameters
 
 
 logger = logging.getLogger(__name__)
 POISON_PILL = 'POISON_PILL'
 EVENTS_ENDPOINT = '/api/v1/streams/valid_transactions'
+COMMIT_ENDPOINT = '/api/v1/transactions/commit'
+# Filters accepted by the event stream, as query parameters, with their
+# validators. The order is the one in which they are indexed, most
+# selective first.
+SUBSCRIPTION_FILTERS = (
+    ('asset_id', parameters.valid_txid),
+    ('public_key', parameters.valid_ed25519),
+    ('operation', parameters.valid_operation),
+)
+# Maximum number of events waiting to be sent to a subscriber, and what to
+# do when a subscriber falls that far behind (see `Subscriber`).
+SUBSCRIBER_QUEUE_SIZE = int(getenv('BIGCHAINDB_WSSERVER_QUEUE_SIZE', 1000))
+OVERFLOW_POLICY = getenv('BIGCHAINDB_WSSERVER_OVERFLOW_POLICY', 'drop_oldest')
+OVERFLOW_POLICIES = ('drop_oldest', 'disconnect', 'coalesce')
+METRICS_ENDPOINT = '/api/v1/streams/metrics'
+# Number of blocks read at once when replaying past events.
+REPLAY_BATCH_SIZE = 100
+# Time, in seconds, a commit mode request waits for its transaction to be
+# committed before giving up.
+COMMIT_TIMEOUT = float(getenv('BIGCHAINDB_COMMIT_TIMEOUT', 60))
 
 
 def _multiprocessing_to_asyncio(in_queue, out_queue, loop):
@@ -43,32 +69,319 @@ def _multiprocessing_to_asyncio(in_queue, out_queue, loop):
         loop.call_soon_threadsafe(out_queue.put_nowait, value)
 
 
+class CommitWaiters:
+    """Registry of the requests waiting for a transaction to be committed.
+
+    Waiting is done with futures, resolved when a block containing the
+    transaction is received, so any number of requests can wait at the
+    same time without holding a worker.
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        # Map <transaction id -> futures>
+        self.waiters = defaultdict(set)
+
+    def wait(self, transaction_id):
+        """Return a future resolved with the height of the block
+        committing the transaction ``transaction_id``.
+
+        The future has to be released with :meth:`discard` once done.
+        """
+
+        future = asyncio.Future(loop=self.loop)
+        self.waiters[transaction_id].add(future)
+        return future
+
+    def discard(self, transaction_id, future):
+        """Stop waiting for a transaction with ``future``."""
+
+        futures = self.waiters.get(transaction_id)
+        if futures is not None:
+            futures.discard(future)
+            if not futures:
+                del self.waiters[transaction_id]
+
+    def resolve(self, block):
+        """Resolve the futures waiting for the transactions of ``block``."""
+
+        for tx in block['transactions']:
+            for future in self.waiters.pop(tx['id'], ()):
+                if not future.done():
+                    future.set_result(block['height'])
+
+    def __len__(self):
+        return sum(len(futures) for futures in self.waiters.values())
+
+
+def parse_filters(query):
+    """Return the subscription filters given in ``query``.
+
+    A filter can be given several times, to match any of its values.
+
+    Args:
+        query (multidict): the query parameters of the request.
+
+    Return:
+        A dict ``<filter name -> frozenset of values>``.
+
+    Raises:
+        ValueError: if the value of a filter is not valid.
+    """
+
+    filters = {}
+    for name, validate in SUBSCRIPTION_FILTERS:
+        values = query.getall(name, [])
+        if values:
+            filters[name] = frozenset(validate(value) for value in values)
+    return filters
+
+
+def transaction_keys(tx):
+    """Return the values of ``tx`` subscriptions can be filtered on."""
+
+    asset_id = tx['id'] if tx['operation'] == 'CREATE' else tx['asset']['id']
+    public_keys = {public_key
+                   for output in tx['outputs']
+                   for public_key in output['public_keys']}
+    return {'asset_id': {asset_id},
+            'public_key': public_keys,
+            'operation': {tx['operation']}}
+
+
+def matches(filters, keys):
+    """Tell whether a transaction, given its ``keys`` (see
+    :func:`transaction_keys`), passes the subscription ``filters``."""
+
+    return all(values & keys[name] for name, values in filters.items())
+
+
+def transaction_event(height, tx, keys):
+    """Return the event sent to the subscribers for ``tx``."""
+
+    asset_id, = keys['asset_id']
+    return json.dumps({'height': height,
+                       'asset_id': asset_id,
+                       'transaction_id': tx['id']})
+
+
+@asyncio.coroutine
+def send_str(websocket, message):
+    """Send ``message`` to ``websocket``, waiting for it to drain."""
+
+    # `send_str` returns a future to wait on when the output buffer of the
+    # websocket is over its limit
+    drain = websocket.send_str(message)
+    if drain is not None:
+        yield from drain
+
+
+class Subscriber:
+    """A websocket subscribed to the events, with its own bounded queue.
+
+    Events are queued by the dispatcher without waiting and sent by a
+    dedicated task, waiting for the websocket to drain, so a slow client
+    only delays itself. When its queue is full, the ``policy`` decides
+    what happens to a new event:
+
+    ``drop_oldest``
+        the oldest queued event is dropped to make room for it.
+    ``disconnect``
+        the client is disconnected.
+    ``coalesce``
+        the queued events are dropped and replaced by a single notice
+        telling the client the range of heights it missed, so that it
+        can catch up using the HTTP API.
+
+    A subscriber created with ``start=False`` holds the events back
+    until :meth:`start` is called, e.g. while replaying past events. The
+    events held back are not bounded by the queue size, nor subject to
+    the policy, so that none is lost while the replay is sent.
+    """
+
+    def __init__(self, websocket, filters=None, *,
+                 queue_size=SUBSCRIBER_QUEUE_SIZE, policy=OVERFLOW_POLICY,
+                 start=True, loop=None):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError('Overflow policy must be one of {}'.format(
+                ', '.join(OVERFLOW_POLICIES)))
+        self.websocket = websocket
+        self.filters = filters or {}
+        self.policy = policy
+        self.loop = loop or asyncio.get_event_loop()
+        self.queue = asyncio.Queue(maxsize=queue_size, loop=self.loop)
+        self.dropped = 0
+        self.gap = None
+        self.closed = False
+        self.after_height = None
+        self.held = deque()
+        self.task = None
+        if start:
+            self.start()
+
+    def start(self, after_height=None):
+        """Start sending the queued events, skipping the events of the
+        blocks up to ``after_height``, if given."""
+
+        self.after_height = after_height
+        self.task = self.loop.create_task(self.send())
+
+    def put(self, message, height=None):
+        """Queue ``message``, about the block at ``height`` if any."""
+
+        if self.closed:
+            return
+        if self.task is None:
+            self.held.append((message, height))
+            return
+        if self.queue.full():
+            if self.policy == 'disconnect':
+                self.dropped += self.queue.qsize() + 1
+                self.close()
+                return
+            elif self.policy == 'drop_oldest':
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.dropped += 1
+            else:
+                self._coalesce()
+        self.queue.put_nowait((message, height))
+
+    def _coalesce(self):
+        if self.gap is None:
+            self.gap = {'type': 'gap', 'dropped': 0,
+                        'from_height': None, 'to_height': None}
+        heights = []
+        while not self.queue.empty():
+            _, height = self.queue.get_nowait()
+            self.queue.task_done()
+            self.dropped += 1
+            self.gap['dropped'] += 1
+            if height is not None:
+                heights.append(height)
+        if heights:
+            if self.gap['from_height'] is None:
+                self.gap['from_height'] = min(heights)
+            self.gap['to_height'] = max(heights)
+
+    @asyncio.coroutine
+    def send(self):
+        """Send the events held back, then the queued events, to the
+        websocket, as it drains."""
+
+        while self.held:
+            message, height = self.held.popleft()
+            sent = yield from self._send(message, height)
+            if not sent:
+                return
+
+        while True:
+            message, height = yield from self.queue.get()
+            try:
+                sent = yield from self._send(message, height)
+            finally:
+                self.queue.task_done()
+            if not sent:
+                return
+
+    @asyncio.coroutine
+    def _send(self, message, height):
+        if (height is not None and self.after_height is not None and
+                height <= self.after_height):
+            # already sent while replaying
+            return True
+        try:
+            if self.gap is not None:
+                gap, self.gap = self.gap, None
+                yield from send_str(self.websocket, json.dumps(gap))
+            yield from send_str(self.websocket, message)
+        except Exception as e:
+            logger.debug('Websocket exception: %s', str(e))
+            self.close()
+            return False
+        return True
+
+    def close(self):
+        """Stop sending events and close the websocket."""
+
+        if self.closed:
+            return
+        self.closed = True
+        if self.task is not None:
+            self.task.cancel()
+        close = getattr(self.websocket, 'close', None)
+        if close is not None:
+            self.loop.create_task(close())
+
+    def __len__(self):
+        return len(self.held) + self.queue.qsize()
+
+
 class Dispatcher:
     """Dispatch events to websockets.
 
-    This class implements a simple publish/subscribe pattern.
+    This class implements a simple publish/subscribe pattern. Subscribers
+    can filter the transactions they receive (see :func:`parse_filters`);
+    filtered subscribers are indexed by the values of their most
+    selective filter, so that each transaction is only matched against
+    the subscribers that could be interested in it.
     """
 
-    def __init__(self, event_source):
+    def __init__(self, event_source, commit_waiters=None, *,
+                 queue_size=SUBSCRIBER_QUEUE_SIZE, policy=OVERFLOW_POLICY,
+                 loop=None):
         """Create a new instance.
 
         Args:
             event_source: a source of events. Elements in the queue
             should be strings.
+            commit_waiters (:class:`CommitWaiters`, optional): the
+            requests to notify of the committed transactions.
+            queue_size (int): size of the queue of each subscriber.
+            policy (str): what to do when the queue of a subscriber is
+            full, see :class:`Subscriber`.
         """
 
         self.event_source = event_source
+        self.commit_waiters = commit_waiters
+        self.queue_size = queue_size
+        self.policy = policy
+        self.loop = loop or asyncio.get_event_loop()
         self.subscribers = {}
-
-    def subscribe(self, uuid, websocket):
+        # Events dropped for the subscribers already gone, and number of
+        # subscribers disconnected for falling behind
+        self.dropped = 0
+        self.disconnected = 0
+        # Map <filter name -> <value -> uuids>>
+        self.index = {name: defaultdict(set)
+                      for name, _ in SUBSCRIPTION_FILTERS}
+        self.unfiltered = set()
+
+    def subscribe(self, uuid, websocket, filters=None, start=True):
         """Add a websocket to the list of subscribers.
 
         Args:
             uuid (str): a unique identifier for the websocket.
             websocket: the websocket to publish information.
+            filters (dict, optional): the filters of the subscription,
+                as returned by :func:`parse_filters`.
+            start (bool): start sending the events right away, see
+                :class:`Subscriber`.
+
+        Return:
+            The :class:`Subscriber`.
         """
 
-        self.subscribers[uuid] = websocket
+        subscriber = self.subscribers[uuid] = Subscriber(
+            websocket, filters, queue_size=self.queue_size,
+            policy=self.policy, start=start, loop=self.loop)
+        indexed = self._indexed_filter(uuid)
+        if indexed is None:
+            self.unfiltered.add(uuid)
+        else:
+            for value in self.subscribers[uuid].filters[indexed]:
+                self.index[indexed][value].add(uuid)
+        return subscriber
 
     def unsubscribe(self, uuid):
         """Remove a websocket from the list of subscribers.
@@ -77,7 +390,67 @@ class Dispatcher:
             uuid (str): a unique identifier for the websocket.
         """
 
-        del self.subscribers[uuid]
+        if uuid not in self.subscribers:
+            # already disconnected for falling behind
+            return
+        indexed = self._indexed_filter(uuid)
+        if indexed is None:
+            self.unfiltered.discard(uuid)
+        else:
+            values = self.index[indexed]
+            for value in self.subscribers[uuid].filters[indexed]:
+                values[value].discard(uuid)
+                if not values[value]:
+                    del values[value]
+        subscriber = self.subscribers.pop(uuid)
+        subscriber.close()
+        self.dropped += subscriber.dropped
+
+    def _indexed_filter(self, uuid):
+        for name, _ in SUBSCRIPTION_FILTERS:
+            if name in self.subscribers[uuid].filters:
+                return name
+        return None
+
+    def _send(self, uuid, message, height=None):
+        subscriber = self.subscribers[uuid]
+        subscriber.put(message, height)
+        if subscriber.closed:
+            logger.info('Disconnecting websocket %s, falling behind', uuid)
+            self.disconnected += 1
+            self.unsubscribe(uuid)
+
+    def metrics(self):
+        """Return the state of the subscriber queues.
+
+        Return:
+            A dict with the number of subscribers, the total and largest
+            number of queued events, the number of events dropped and of
+            subscribers disconnected for falling behind.
+        """
+
+        depths = [len(subscriber) for subscriber in self.subscribers.values()]
+        return {
+            'subscribers': len(depths),
+            'queued': sum(depths),
+            'max_queued': max(depths, default=0),
+            'dropped': self.dropped + sum(subscriber.dropped for subscriber
+                                          in self.subscribers.values()),
+            'disconnected': self.disconnected,
+        }
+
+    def recipients(self, keys):
+        """Return the uuids of the subscribers interested in a
+        transaction, given its ``keys`` (see :func:`transaction_keys`).
+        """
+
+        candidates = set(self.unfiltered)
+        for name, index in self.index.items():
+            if index:
+                for value in keys[name]:
+                    candidates.update(index.get(value, ()))
+        return [uuid for uuid in candidates
+                if matches(self.subscribers[uuid].filters, keys)]
 
     @asyncio.coroutine
     def publish(self):
@@ -85,27 +458,28 @@ class Dispatcher:
 
         while True:
             event = yield from self.event_source.get()
-            str_buffer = []
 
             if event == POISON_PILL:
                 return
 
             if isinstance(event, str):
-                str_buffer.append(event)
+                for uuid in list(self.subscribers):
+                    self._send(uuid, event)
 
             elif event.type == EventTypes.BLOCK_VALID:
                 block = event.data
 
-                for tx in block['transactions']:
-                    asset_id = tx['id'] if tx['operation'] == 'CREATE' else tx['asset']['id']
-                    data = {'height': block['height'],
-                            'asset_id': asset_id,
-                            'transaction_id': tx['id']}
-                    str_buffer.append(json.dumps(data))
+                if self.commit_waiters is not None:
+                    self.commit_waiters.resolve(block)
 
-            for _, websocket in self.subscribers.items():
-                for str_item in str_buffer:
-                    websocket.send_str(str_item)
+                for tx in block['transactions']:
+                    keys = transaction_keys(tx)
+                    recipients = self.recipients(keys)
+                    if not recipients:
+                        continue
+                    data = transaction_event(block['height'], tx, keys)
+                    for uuid in recipients:
+                        self._send(uuid, data, block['height'])
 
 
 @asyncio.coroutine
@@ -113,10 +487,41 @@ def websocket_handler(request):
     """Handle a new socket connection."""
 
     logger.debug('New websocket connection.')
+    try:
+        filters = parse_filters(request.query)
+    except ValueError as e:
+        return _json_error(400, 'Invalid filter: {}'.format(e))
+    from_height = request.query.get('from_height')
+    if from_height is not None:
+        if not from_height.isdigit():
+            return _json_error(400, 'from_height must be a positive integer')
+        from_height = int(from_height)
+
     websocket = web.WebSocketResponse()
     yield from websocket.prepare(request)
     uuid = uuid4()
-    request.app['dispatcher'].subscribe(uuid, websocket)
+    dispatcher = request.app['dispatcher']
+
+    if from_height is None:
+        dispatcher.subscribe(uuid, websocket, filters)
+    else:
+        # Replay up to the latest block, then subscribe and replay what
+        # was committed meanwhile, while the live events are held back.
+        # The live events of the blocks replayed are then skipped, so the
+        # client gets every block once, in order.
+        try:
+            last_height = yield from replay(request.app, websocket, filters,
+                                            from_height)
+            subscriber = dispatcher.subscribe(uuid, websocket, filters,
+                                              start=False)
+            last_height = yield from replay(request.app, websocket, filters,
+                                            last_height + 1)
+        except Exception as e:
+            logger.debug('Websocket exception while replaying: %s', str(e))
+            dispatcher.unsubscribe(uuid)
+            yield from websocket.close()
+            return websocket
+        subscriber.start(after_height=last_height)
 
     while True:
         # Consume input buffer
@@ -136,21 +541,137 @@ def websocket_handler(request):
     return websocket
 
 
-def init_app(event_source, *, loop=None):
+@asyncio.coroutine
+def replay(app, websocket, filters, from_height):
+    """Send the events of the committed blocks from ``from_height`` up to
+    the latest one.
+
+    Return:
+        The height of the latest block replayed, i.e. ``from_height - 1``
+        if there was none.
+    """
+
+    loop = app.loop
+    bigchain = _get_bigchaindb(app)
+    latest_block = yield from loop.run_in_executor(
+        None, bigchain.get_latest_block)
+    to_height = latest_block['height'] if latest_block else 0
+
+    for start in range(from_height, to_height + 1, REPLAY_BATCH_SIZE):
+        end = min(start + REPLAY_BATCH_SIZE - 1, to_height)
+        blocks = yield from loop.run_in_executor(
+            None, bigchain.get_blocks, start, end)
+        for block in blocks:
+            for tx in block['transactions']:
+                keys = transaction_keys(tx)
+                if matches(filters, keys):
+                    yield from send_str(
+                        websocket, transaction_event(block['height'], tx, keys))
+
+    return max(to_height, from_height - 1)
+
+
+def _get_bigchaindb(app):
+    if app['bigchaindb'] is None:
+        app['bigchaindb'] = app['bigchaindb_factory']()
+    return app['bigchaindb']
+
+
+@asyncio.coroutine
+def metrics_handler(request):
+    """Return the metrics of the event stream."""
+
+    return web.json_response(request.app['dispatcher'].metrics())
+
+
+@asyncio.coroutine
+def commit_handler(request):
+    """Submit a transaction and respond once it is committed.
+
+    This is the non-blocking counterpart of posting a transaction to the
+    HTTP API with ``mode=commit``: the transaction is checked by
+    Tendermint with ``broadcast_tx_sync``, then the request waits for the
+    block committing it without holding a worker.
+    """
+
+    try:
+        tx = yield from request.json()
+    except ValueError:
+        return _json_error(400, 'The body must be a JSON transaction')
+    if not isinstance(tx, dict) or not isinstance(tx.get('id'), str):
+        return _json_error(400, 'The body must be a JSON transaction')
+
+    commit_waiters = request.app['commit_waiters']
+    # Wait before submitting, not to miss a block committed right away
+    committed = commit_waiters.wait(tx['id'])
+    try:
+        try:
+            response = yield from request.app['tendermint'].call(
+                'broadcast_tx_sync', encode_transaction(tx))
+        except aiohttp.ClientError as e:
+            logger.error('Error while connecting to Tendermint: %s', e)
+            return _json_error(503, 'Tendermint is not available')
+
+        if response.get('error') is not None:
+            return _json_error(500, 'Internal error')
+        result = response.get('result') or {}
+        if result.get('code', 0) != 0:
+            return _json_error(
+                400, 'Invalid transaction: {}'.format(result.get('log', '')))
+
+        yield from asyncio.wait_for(committed, COMMIT_TIMEOUT,
+                                    loop=request.app.loop)
+    except asyncio.TimeoutError:
+        return _json_error(504, 'Timed out waiting for the transaction to '
+                                'be committed')
+    finally:
+        commit_waiters.discard(tx['id'], committed)
+
+    return web.json_response(tx, status=202)
+
+
+def _json_error(status_code, message):
+    logger.debug('API error: %s - %s', status_code, message)
+    return web.json_response({'status': status_code, 'message': message},
+                             status=status_code)
+
+
+@asyncio.coroutine
+def _close_tendermint_client(app):
+    app['tendermint'].close()
+
+
+def init_app(event_source, *, bigchaindb_factory=None, loop=None):
     """Init the application server.
 
+    Args:
+        event_source: a source of events.
+        bigchaindb_factory: the class of the connection to BigchainDB,
+            used to replay past events.
+
     Return:
         An aiohttp application.
     """
 
-    dispatcher = Dispatcher(event_source)
+    if not bigchaindb_factory:
+        bigchaindb_factory = BigchainDB
+
+    commit_waiters = CommitWaiters(loop)
+    dispatcher = Dispatcher(event_source, commit_waiters, loop=loop)
 
     # Schedule the dispatcher
     loop.create_task(dispatcher.publish())
 
     app = web.Application(loop=loop)
     app['dispatcher'] = dispatcher
+    app['commit_waiters'] = commit_waiters
+    app['bigchaindb_factory'] = bigchaindb_factory
+    app['bigchaindb'] = None
+    app['tendermint'] = AsyncTendermintRPC(loop=loop)
+    app.on_cleanup.append(_close_tendermint_client)
     app.router.add_get(EVENTS_ENDPOINT, websocket_handler)
+    app.router.add_get(METRICS_ENDPOINT, metrics_handler)
+    app.router.add_post(COMMIT_ENDPOINT, commit_handler)
     return app
 
 
@@ -31,6 +31,18 @@ def test_get_txids_filtered(signed_create_tx, signed_transfer_tx):
     assert txids == {signed_transfer_tx.id}
 
 
+def test_get_full_transactions(b, signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend import connect, query
+    conn = connect()
+
+    b.store_bulk_transactions([signed_create_tx, signed_transfer_tx])
+
+    txs = list(query.get_full_transactions(
+        conn, [signed_create_tx.id, signed_transfer_tx.id, 'unknown']))
+    assert sorted(txs, key=lambda tx: tx['operation']) == [
+        signed_create_tx.to_dict(), signed_transfer_tx.to_dict()]
+
+
 def test_write_assets():
     from bigchaindb.backend import connect, query
     conn = connect()
@@ -167,6 +179,48 @@ def test_store_block():
     assert cursor.count() == 1
 
 
+def test_store_block_writes(signed_create_tx, signed_transfer_tx):
+    from bigchaindb.backend import connect, query
+    from bigchaindb.tendermint.lib import Block
+    conn = connect()
+
+    utxo = next(signed_create_tx.unspent_outputs)._asdict()
+    conn.db.utxos.insert_one(deepcopy(utxo))
+
+    tx = signed_transfer_tx.to_dict()
+    metadata = {'id': tx['id'], 'metadata': tx.pop('metadata')}
+    block = Block(app_hash='random_utxo',
+                  height=3,
+                  transactions=[tx['id']])
+    query.store_block_writes(
+        conn, block._asdict(), [tx], [], [metadata],
+        [{'transaction_id': utxo['transaction_id'],
+          'output_index': utxo['output_index']}],
+        [next(signed_transfer_tx.unspent_outputs)._asdict()])
+
+    assert conn.db.transactions.find_one({'id': tx['id']})
+    assert conn.db.metadata.find_one({'id': tx['id']})
+    assert conn.db.blocks.find_one({'height': 3})
+    utxos = list(conn.db.utxos.find({}, projection={'_id': False}))
+    assert utxos == [next(signed_transfer_tx.unspent_outputs)._asdict()]
+
+
+def test_commit_executor_is_owned_by_the_connection():
+    from bigchaindb.backend import connect
+    conn = connect()
+    assert conn._commit_executor is None
+
+    executor = conn.commit_executor
+    assert conn.commit_executor is executor
+    assert conn.conn is not None
+
+    conn.close()
+    assert conn._commit_executor is None
+    assert conn._conn is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
 def test_get_block():
     from bigchaindb.backend import connect, query
     from bigchaindb.tendermint.lib import Block
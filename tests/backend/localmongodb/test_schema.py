@@ -20,7 +20,7 @@ def test_init_creates_db_tables_and_indexes():
     collection_names = conn.conn[dbname].collection_names()
     assert set(collection_names) == {
         'transactions', 'assets', 'metadata', 'blocks', 'utxos', 'pre_commit',
-        'validators'
+        'validators', 'abci_traces'
     }
 
     indexes = conn.conn[dbname]['assets'].index_information().keys()
@@ -28,10 +28,11 @@ def test_init_creates_db_tables_and_indexes():
 
     indexes = conn.conn[dbname]['transactions'].index_information().keys()
     assert set(indexes) == {
-            '_id_', 'transaction_id', 'asset_id', 'outputs', 'inputs'}
+            '_id_', 'transaction_id', 'asset_id', 'outputs', 'inputs',
+            'fulfills'}
 
     indexes = conn.conn[dbname]['blocks'].index_information().keys()
-    assert set(indexes) == {'_id_', 'height'}
+    assert set(indexes) == {'_id_', 'height', 'transactions'}
 
     indexes = conn.conn[dbname]['utxos'].index_information().keys()
     assert set(indexes) == {'_id_', 'utxo'}
@@ -75,7 +76,24 @@ def test_create_tables():
     collection_names = conn.conn[dbname].collection_names()
     assert set(collection_names) == {
         'transactions', 'assets', 'metadata', 'blocks', 'utxos', 'validators',
-        'pre_commit'}
+        'pre_commit', 'abci_traces'}
+    assert conn.conn[dbname]['abci_traces'].options()['capped']
+
+
+def test_create_abci_traces_table_when_missing():
+    import bigchaindb
+    from bigchaindb import backend
+    from bigchaindb.backend import schema
+
+    conn = backend.connect()
+    dbname = bigchaindb.config['database']['name']
+
+    # e.g. a database initialized before the traces were introduced
+    conn.conn[dbname].drop_collection('abci_traces')
+    schema.create_abci_traces_table(conn, dbname)
+    schema.create_abci_traces_table(conn, dbname)
+
+    assert conn.conn[dbname]['abci_traces'].options()['capped']
 
 
 def test_create_secondary_indexes():
@@ -95,12 +113,15 @@ def test_create_secondary_indexes():
     indexes = conn.conn[dbname]['assets'].index_information().keys()
     assert set(indexes) == {'_id_', 'asset_id', 'text'}
 
-    indexes = conn.conn[dbname]['transactions'].index_information().keys()
-    assert set(indexes) == {
-            '_id_', 'transaction_id', 'asset_id', 'outputs', 'inputs'}
+    index_info = conn.conn[dbname]['transactions'].index_information()
+    assert set(index_info.keys()) == {
+            '_id_', 'transaction_id', 'asset_id', 'outputs', 'inputs',
+            'fulfills'}
+    assert index_info['transaction_id']['unique']
+    assert index_info['transaction_id']['key'] == [('id', 1)]
 
     indexes = conn.conn[dbname]['blocks'].index_information().keys()
-    assert set(indexes) == {'_id_', 'height'}
+    assert set(indexes) == {'_id_', 'height', 'transactions'}
 
     index_info = conn.conn[dbname]['utxos'].index_information()
     assert set(index_info.keys()) == {'_id_', 'utxo'}
@@ -113,6 +134,44 @@ def test_create_secondary_indexes():
     assert indexes['pre_commit_id']['unique']
 
 
+def test_check_indexes():
+    import bigchaindb
+    from bigchaindb import backend
+    from bigchaindb.backend import schema
+
+    conn = backend.connect()
+    dbname = bigchaindb.config['database']['name']
+
+    # The db is set up by the fixtures so we need to remove it
+    conn.conn.drop_database(dbname)
+    schema.init_database(conn, dbname)
+    assert schema.check_indexes(conn, dbname) == []
+
+    conn.conn[dbname]['blocks'].drop_index('transactions')
+    assert schema.check_indexes(conn, dbname) == [
+        ('get_block_with_transaction', 'blocks')]
+    schema.create_indexes(conn, dbname)
+
+
+def test_indexed_queries_cover_the_queries():
+    import inspect
+    import re
+    from bigchaindb.backend.localmongodb import query, schema
+
+    # the calls of a query filtering the documents of a collection
+    filtering = re.compile(r'\.(find|find_one|aggregate|update|remove|'
+                           r'delete_one|delete_many)\(|DeleteOne\(')
+    checked = {name for name, *_ in schema.INDEXED_QUERIES}
+    checked.update(schema.UNINDEXED_QUERIES)
+
+    unchecked = [name for name, func in inspect.getmembers(query,
+                                                           inspect.isfunction)
+                 if func.__module__ == query.__name__ and
+                 filtering.search(inspect.getsource(func)) and
+                 name not in checked]
+    assert unchecked == []
+
+
 def test_drop(dummy_db):
     from bigchaindb import backend
     from bigchaindb.backend import schema
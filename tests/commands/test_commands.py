@@ -17,6 +17,7 @@ def test_make_sure_we_dont_remove_any_command():
     assert parser.parse_args(['show-config']).command
     assert parser.parse_args(['init']).command
     assert parser.parse_args(['drop']).command
+    assert parser.parse_args(['index-check']).command
     assert parser.parse_args(['start']).command
     assert parser.parse_args(['upsert-validator', 'TEMP_PUB_KEYPAIR', '10']).command
 
@@ -152,6 +153,26 @@ def test_drop_db_does_not_drop_when_interactive_no(mock_db_drop, monkeypatch):
     assert not mock_db_drop.called
 
 
+@pytest.mark.tendermint
+@patch('bigchaindb.backend.schema.check_indexes')
+def test_index_check_reports_collection_scans(mock_check_indexes, capsys):
+    from bigchaindb.commands.bigchaindb import run_index_check
+    args = Namespace(config=None)
+
+    mock_check_indexes.return_value = []
+    run_index_check(args)
+    assert capsys.readouterr()[0] == ''
+
+    mock_check_indexes.return_value = [('get_block_with_transaction',
+                                        'blocks')]
+    with pytest.raises(SystemExit) as exc:
+        run_index_check(args)
+    assert exc.value.code == 1
+    output, _ = capsys.readouterr()
+    assert output == ('get_block_with_transaction: collection scan on '
+                      '`blocks`\n')
+
+
 # TODO Beware if you are putting breakpoints in there, and using the '-s'
 # switch with pytest. It will just hang. Seems related to the monkeypatching of
 # input_on_stderr.
@@ -342,10 +363,31 @@ class MockResponse():
         return {'result': {'latest_block_height': self.height}}
 
 
+@patch('bigchaindb.commands.bigchaindb.signal_validator_update')
+@patch('bigchaindb.config_utils.autoconfigure')
+@patch('bigchaindb.backend.query.store_validator_update')
+@pytest.mark.tendermint
+def test_upsert_validator(mock_store_validator_update, mock_autoconfigure,
+                          mock_signal_validator_update):
+    from bigchaindb.commands.bigchaindb import run_upsert_validator
+
+    args = Namespace(public_key='CJxdItf4lz2PwEf4SmYNAu/c/VpmX39JEgC5YpH7fxg=',
+                     power='10', config={})
+    run_upsert_validator(args)
+
+    assert mock_store_validator_update.called
+    assert mock_signal_validator_update.called
+
+
+@patch('bigchaindb.commands.bigchaindb.signal_validator_update',
+       return_value=False)
 @patch('bigchaindb.config_utils.autoconfigure')
 @patch('bigchaindb.backend.query.store_validator_update')
 @pytest.mark.tendermint
-def test_upsert_validator(mock_autoconfigure, mock_store_validator_update):
+def test_upsert_validator_warns_if_not_signaled(mock_store_validator_update,
+                                                mock_autoconfigure,
+                                                mock_signal_validator_update,
+                                                capsys):
     from bigchaindb.commands.bigchaindb import run_upsert_validator
 
     args = Namespace(public_key='CJxdItf4lz2PwEf4SmYNAu/c/VpmX39JEgC5YpH7fxg=',
@@ -353,3 +395,5 @@ def test_upsert_validator(mock_autoconfigure, mock_store_validator_update):
     run_upsert_validator(args)
 
     assert mock_store_validator_update.called
+    _, err = capsys.readouterr()
+    assert 'Could not signal BigchainDB' in err
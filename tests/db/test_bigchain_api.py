@@ -1223,6 +1223,20 @@ def test_get_outputs_filtered_only_spent():
     assert out == [TransactionLink('b', 2)]
 
 
+def test_get_outputs_filtered_by_pages():
+    from bigchaindb.common.transaction import TransactionLink
+    from bigchaindb.core import Bigchain
+    with patch('bigchaindb.fastquery.FastQuery.get_outputs_by_public_key') as get_outputs:
+        get_outputs.return_value = [TransactionLink('b', 0),
+                                    TransactionLink('a', 1),
+                                    TransactionLink('a', 0)]
+        first = Bigchain().get_outputs_filtered('abc', limit=2)
+        second = Bigchain().get_outputs_filtered('abc', after=('a', 1),
+                                                 limit=2)
+    assert first == [TransactionLink('a', 0), TransactionLink('a', 1)]
+    assert second == [TransactionLink('b', 0)]
+
+
 @patch('bigchaindb.fastquery.FastQuery.filter_unspent_outputs')
 @patch('bigchaindb.fastquery.FastQuery.filter_spent_outputs')
 def test_get_outputs_filtered(filter_spent, filter_unspent):
@@ -0,0 +1,19 @@
+from uuid import uuid4
+
+import pytest
+
+
+pytestmark = pytest.mark.tendermint
+
+
+def test_scalable_bloom_filter():
+    from bigchaindb.tendermint.bloom import ScalableBloomFilter
+
+    items = [uuid4().hex for _ in range(1000)]
+    bloom_filter = ScalableBloomFilter(items, initial_capacity=100)
+    assert len(bloom_filter) == 1000
+    assert len(bloom_filter.filters) > 1
+    assert all(item in bloom_filter for item in items)
+
+    false_positives = sum(uuid4().hex in bloom_filter for _ in range(10000))
+    assert false_positives < 100
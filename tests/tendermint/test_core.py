@@ -198,3 +198,240 @@ def test_store_pre_commit_state_in_end_block(b, alice):
     assert resp['commit_id'] == PRE_COMMIT_ID
     assert resp['height'] == 100
     assert resp['transactions'] == [tx.id]
+
+
+def test_deliver_tx_reuses_check_tx_validation(b, alice, mocker):
+    from bigchaindb.tendermint import App
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+
+    app = App(b)
+    app.init_chain(['ignore'])
+    assert app.check_tx(encode_tx_to_bytes(tx)).is_ok()
+
+    inputs_valid = mocker.spy(Transaction, '_inputs_valid')
+    app.begin_block('ignore')
+    assert app.deliver_tx(encode_tx_to_bytes(tx)).is_ok()
+    assert not inputs_valid.called
+
+    # state dependent checks are still run on cached transactions
+    app.end_block(99)
+    app.commit()
+    app.begin_block('ignore')
+    assert app.deliver_tx(encode_tx_to_bytes(tx)).is_error()
+
+
+def test_validation_cache_is_keyed_by_payload(b, alice):
+    from bigchaindb.tendermint import App
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+    # same id as `tx`, but a different body
+    tampered = tx.to_dict()
+    tampered['metadata'] = {'tampered': True}
+
+    app = App(b)
+    app.init_chain(['ignore'])
+    assert app.check_tx(encode_tx_to_bytes(tx)).is_ok()
+    assert app.check_tx(json.dumps(tampered).encode('utf8')).is_error()
+
+
+def test_deliver_tx_verifies_signatures(b, alice, bob):
+    from bigchaindb.tendermint import App
+    from bigchaindb.backend import query
+    from bigchaindb.backend.query import PRE_COMMIT_ID
+    from bigchaindb.models import Transaction
+
+    valid = Transaction.create([alice.public_key],
+                               [([alice.public_key], 1)])\
+                       .sign([alice.private_key])
+    unsigned = Transaction.create([alice.public_key],
+                                  [([alice.public_key], 1)],
+                                  metadata={'signed': False})
+    unsigned._hash()
+    # spends an output of the unsigned transaction
+    transfer = Transaction.transfer(unsigned.to_inputs(),
+                                    [([bob.public_key], 1)],
+                                    asset_id=unsigned.id)\
+                          .sign([alice.private_key])
+
+    app = App(b)
+    app.init_chain(['ignore'])
+    app.begin_block('ignore')
+
+    # the result codes are what Tendermint records for the block
+    assert app.deliver_tx(encode_tx_to_bytes(valid)).is_ok()
+    assert app.deliver_tx(encode_tx_to_bytes(unsigned)).is_error()
+    assert app.deliver_tx(encode_tx_to_bytes(transfer)).is_error()
+
+    app.end_block(99)
+    assert app.block_txn_ids == [valid.id]
+    resp = query.get_pre_commit_state(b.connection, PRE_COMMIT_ID)
+    assert resp['transactions'] == [valid.id]
+
+    app.commit()
+    assert b.get_transaction(valid.id)
+    assert not b.get_transaction(unsigned.id)
+    assert not b.get_transaction(transfer.id)
+
+
+def test_transfer_inputs_are_resolved_from_utxo_index(b, alice, bob, mocker):
+    from bigchaindb.tendermint import App
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+
+    app = App(b)
+    app.init_chain(['ignore'])
+    app.begin_block('ignore')
+    app.deliver_tx(encode_tx_to_bytes(tx))
+    app.end_block(99)
+    app.commit()
+    assert b.get_unspent_output(tx.id, 0).amount == 1
+
+    transfer = Transaction.transfer(tx.to_inputs(),
+                                    [([bob.public_key], 1)],
+                                    asset_id=tx.id)\
+                          .sign([alice.private_key])
+    double_spend = Transaction.transfer(tx.to_inputs(),
+                                        [([alice.public_key], 1)],
+                                        asset_id=tx.id)\
+                              .sign([alice.private_key])
+
+    get_transaction = mocker.spy(b, 'get_transaction')
+    app.begin_block('ignore')
+    assert app.deliver_tx(encode_tx_to_bytes(transfer)).is_ok()
+    assert app.deliver_tx(encode_tx_to_bytes(double_spend)).is_error()
+    assert not get_transaction.called
+    app.end_block(100)
+    app.commit()
+
+    assert b.get_unspent_output(tx.id, 0) is None
+    assert b.get_unspent_output(transfer.id, 0).asset_id == tx.id
+    assert app.check_tx(encode_tx_to_bytes(double_spend)).is_error()
+
+
+def test_deliver_tx_chained_transfers_in_one_block(b, alice, bob):
+    from bigchaindb.tendermint import App
+    from bigchaindb.models import BlockTransactions, Transaction
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+    to_bob = Transaction.transfer(tx.to_inputs(),
+                                  [([bob.public_key], 1)],
+                                  asset_id=tx.id)\
+                        .sign([alice.private_key])
+    to_alice = Transaction.transfer(to_bob.to_inputs(),
+                                    [([alice.public_key], 1)],
+                                    asset_id=tx.id)\
+                          .sign([bob.private_key])
+    double_spend = Transaction.transfer(to_bob.to_inputs(),
+                                        [([bob.public_key], 1)],
+                                        asset_id=tx.id)\
+                              .sign([bob.private_key])
+
+    app = App(b)
+    app.init_chain(['ignore'])
+    app.begin_block('ignore')
+    for transaction in (tx, to_bob, to_alice):
+        assert app.deliver_tx(encode_tx_to_bytes(transaction)).is_ok()
+    assert app.deliver_tx(encode_tx_to_bytes(tx)).is_error()
+    assert app.deliver_tx(encode_tx_to_bytes(double_spend)).is_error()
+
+    assert isinstance(app.block_transactions, BlockTransactions)
+    assert app.block_transactions.get(to_bob.id) == to_bob
+    assert app.block_transactions.get_spenders(to_bob.id, 0) == [to_alice]
+
+    app.begin_block('ignore')
+    assert len(app.block_transactions) == 0
+
+
+def test_commit_publishes_block_event(b, alice, bob):
+    from queue import Queue
+    from bigchaindb.tendermint import App
+    from bigchaindb.events import EventTypes
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+    to_bob = Transaction.transfer(tx.to_inputs(),
+                                  [([bob.public_key], 1)],
+                                  asset_id=tx.id)\
+                        .sign([alice.private_key])
+
+    events_queue = Queue()
+    app = App(b, events_queue=events_queue)
+    app.init_chain(['ignore'])
+    app.begin_block('ignore')
+    for transaction in (tx, to_bob):
+        assert app.deliver_tx(encode_tx_to_bytes(transaction)).is_ok()
+    app.end_block(99)
+    app.commit()
+
+    event = events_queue.get_nowait()
+    assert event.type == EventTypes.BLOCK_VALID
+    assert event.data == {
+        'height': 99,
+        'transactions': [
+            {'id': tx.id, 'operation': 'CREATE',
+             'outputs': [{'public_keys': [alice.public_key]}]},
+            {'id': to_bob.id, 'operation': 'TRANSFER',
+             'asset': {'id': tx.id},
+             'outputs': [{'public_keys': [bob.public_key]}]},
+        ],
+    }
+
+    # empty blocks are not published
+    app.begin_block('ignore')
+    app.end_block(100)
+    app.commit()
+    assert events_queue.empty()
+
+
+def test_end_block_uses_cached_chain_tip(b, alice, mocker):
+    from bigchaindb.tendermint import App
+    from bigchaindb.backend import query
+    from bigchaindb.models import Transaction
+    from bigchaindb.backend.query import VALIDATOR_UPDATE_ID
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+
+    app = App(b)
+    app.init_chain(['ignore'])
+    app.begin_block('ignore')
+    app.end_block(1)
+    app.commit()
+
+    get_latest_block = mocker.spy(b, 'get_latest_block')
+    get_validator_update = mocker.spy(b, 'get_validator_update')
+    app.begin_block('ignore')
+    app.deliver_tx(encode_tx_to_bytes(tx))
+    app.end_block(2)
+    app.commit()
+    app.begin_block('ignore')
+    app.end_block(3)
+    app.commit()
+    assert not get_latest_block.called
+    assert not get_validator_update.called
+    assert app.info().last_block_height == 2
+
+    validator = {'pub_key': {'type': 'ed25519',
+                             'data': 'B0E42D2589A455EAD339A035D6CE1C8C3E25863F268120AA0162AD7D003A4014'},
+                 'power': 10}
+    query.store_validator_update(b.connection, {'validator': validator,
+                                                'update_id': VALIDATOR_UPDATE_ID})
+    app.refresh_validator_update()
+    app.begin_block('ignore')
+    assert len(app.end_block(4).validator_updates) == 1
+    assert get_validator_update.call_count == 1
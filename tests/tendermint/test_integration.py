@@ -99,40 +99,44 @@ def test_app(tb):
     assert block0['app_hash'] == new_block_hash
 
 
-@pytest.mark.abci
-def test_upsert_validator(b, alice):
+@pytest.mark.tendermint
+@pytest.mark.bdb
+def test_upsert_validator(b, tmpdir, monkeypatch):
+    import os
+    import signal
     from bigchaindb.backend.query import VALIDATOR_UPDATE_ID
-    from bigchaindb.backend import query, connect
-    from bigchaindb.models import Transaction
-    from bigchaindb.tendermint.utils import public_key_to_base64
-    import time
+    from bigchaindb.backend import query
+    from bigchaindb.tendermint import App, utils
+    from bigchaindb.tendermint.core import encode_validator
 
-    conn = connect()
-    public_key = '1718D2DBFF00158A0852A17A01C78F4DCF3BA8E4FB7B8586807FAC182A535034'
-    power = 1
+    app = App(b)
+    app.init_chain(['ignore'])
+    app.begin_block('ignore')
+    app.end_block(1)
+    app.commit()
 
-    validator = {'pub_key': {'type': 'AC26791624DE60',
+    public_key = '1718D2DBFF00158A0852A17A01C78F4DCF3BA8E4FB7B8586807FAC182A535034'
+    validator = {'pub_key': {'type': 'ed25519',
                              'data': public_key},
-                 'power': power}
+                 'power': 1}
     validator_update = {'validator': validator,
                         'update_id': VALIDATOR_UPDATE_ID}
-
-    query.store_validator_update(conn, deepcopy(validator_update))
-
-    tx = Transaction.create([alice.public_key],
-                            [([alice.public_key], 1)],
-                            asset=None)\
-                    .sign([alice.private_key])
-
-    code, message = b.write_transaction(tx, 'broadcast_tx_commit')
-    assert code == 202
-    time.sleep(5)
-
-    validators = b.get_validators()
-    validators = [(v['pub_key']['value'], v['voting_power']) for v in validators]
-
-    public_key64 = public_key_to_base64(public_key)
-    assert ((public_key64, power) in validators)
+    query.store_validator_update(b.connection, deepcopy(validator_update))
+
+    # signal this process, as `bigchaindb upsert-validator` signals the node
+    pid_file = tmpdir.join('bigchaindb.pid')
+    pid_file.write(str(os.getpid()))
+    monkeypatch.setattr(utils, 'PID_FILE', str(pid_file))
+    previous = signal.signal(signal.SIGUSR1,
+                             lambda signum, frame: app.refresh_validator_update())
+    try:
+        assert utils.signal_validator_update()
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+    app.begin_block('ignore')
+    resp = app.end_block(2)
+    assert list(resp.validator_updates) == [encode_validator(validator)]
 
 
 @pytest.mark.abci
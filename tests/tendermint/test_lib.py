@@ -75,7 +75,7 @@ def test_validation_error(b):
     assert not b.validate_transaction(tx)
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_write_and_post_transaction(mock_post, b):
     from bigchaindb.models import Transaction
     from bigchaindb.common.crypto import generate_key_pair
@@ -97,7 +97,7 @@ def test_write_and_post_transaction(mock_post, b):
     assert encoded_tx == kwargs['json']['params']
 
 
-@patch('requests.post')
+@patch('requests.Session.post')
 @pytest.mark.parametrize('mode', [
     'broadcast_tx_async',
     'broadcast_tx_sync',
@@ -168,6 +168,33 @@ def test_update_utxoset(tb, signed_create_tx, signed_transfer_tx, db_context):
     assert utxo['output_index'] == 0
 
 
+@pytest.mark.bdb
+def test_update_utxoset_with_a_block(tb, signed_create_tx,
+                                     signed_transfer_tx):
+    tb.load_utxo_index()
+    tb.update_utxoset(signed_create_tx, signed_transfer_tx)
+    utxos = list(tb.get_unspent_outputs())
+    assert len(utxos) == 1
+    assert utxos[0]['transaction_id'] == signed_transfer_tx.id
+    assert len(tb.utxo_index) == 1
+    assert tb.get_unspent_output(signed_create_tx.id, 0) is None
+    assert tb.get_unspent_output(signed_transfer_tx.id, 0)
+
+
+@pytest.mark.bdb
+def test_rollback_utxoset(tb, signed_create_tx, signed_transfer_tx):
+    tb.store_bulk_transactions([signed_create_tx])
+    tb.store_bulk_transactions([signed_transfer_tx])
+
+    tb.rollback_utxoset([signed_transfer_tx.id])
+    utxos = list(tb.get_unspent_outputs())
+    assert utxos == [next(signed_create_tx.unspent_outputs)._asdict()]
+
+    # rolling back again leaves the UTXO set unchanged
+    tb.rollback_utxoset([signed_transfer_tx.id])
+    assert list(tb.get_unspent_outputs()) == utxos
+
+
 @pytest.mark.bdb
 def test_store_transaction(mocker, tb, signed_create_tx,
                            signed_transfer_tx, db_context):
@@ -177,12 +204,12 @@ def test_store_transaction(mocker, tb, signed_create_tx,
     mocked_store_transaction = mocker.patch(
         'bigchaindb.backend.query.store_transaction')
     tb.store_transaction(signed_create_tx)
-    # mongo_client = MongoClient(host=db_context.host, port=db_context.port)
-    # utxoset = mongo_client[db_context.name]['utxos']
-    # assert utxoset.count() == 1
-    # utxo = utxoset.find_one()
-    # assert utxo['transaction_id'] == signed_create_tx.id
-    # assert utxo['output_index'] == 0
+    mongo_client = MongoClient(host=db_context.host, port=db_context.port)
+    utxoset = mongo_client[db_context.name]['utxos']
+    assert utxoset.count() == 1
+    utxo = utxoset.find_one()
+    assert utxo['transaction_id'] == signed_create_tx.id
+    assert utxo['output_index'] == 0
     mocked_store_asset.assert_called_once_with(
         tb.connection,
         {'id': signed_create_tx.id, 'data': signed_create_tx.asset['data']},
@@ -200,10 +227,10 @@ def test_store_transaction(mocker, tb, signed_create_tx,
     mocked_store_metadata.reset_mock()
     mocked_store_transaction.reset_mock()
     tb.store_transaction(signed_transfer_tx)
-    # assert utxoset.count() == 1
-    # utxo = utxoset.find_one()
-    # assert utxo['transaction_id'] == signed_transfer_tx.id
-    # assert utxo['output_index'] == 0
+    assert utxoset.count() == 1
+    utxo = utxoset.find_one()
+    assert utxo['transaction_id'] == signed_transfer_tx.id
+    assert utxo['output_index'] == 0
     assert not mocked_store_asset.called
     mocked_store_metadata.asser_called_once_with(
         tb.connection,
@@ -226,12 +253,12 @@ def test_store_bulk_transaction(mocker, tb, signed_create_tx,
     mocked_store_transactions = mocker.patch(
         'bigchaindb.backend.query.store_transactions')
     tb.store_bulk_transactions((signed_create_tx,))
-    # mongo_client = MongoClient(host=db_context.host, port=db_context.port)
-    # utxoset = mongo_client[db_context.name]['utxos']
-    # assert utxoset.count() == 1
-    # utxo = utxoset.find_one()
-    # assert utxo['transaction_id'] == signed_create_tx.id
-    # assert utxo['output_index'] == 0
+    mongo_client = MongoClient(host=db_context.host, port=db_context.port)
+    utxoset = mongo_client[db_context.name]['utxos']
+    assert utxoset.count() == 1
+    utxo = utxoset.find_one()
+    assert utxo['transaction_id'] == signed_create_tx.id
+    assert utxo['output_index'] == 0
     mocked_store_assets.assert_called_once_with(
         tb.connection,
         [{'id': signed_create_tx.id, 'data': signed_create_tx.asset['data']}],
@@ -249,10 +276,10 @@ def test_store_bulk_transaction(mocker, tb, signed_create_tx,
     mocked_store_metadata.reset_mock()
     mocked_store_transactions.reset_mock()
     tb.store_bulk_transactions((signed_transfer_tx,))
-    # assert utxoset.count() == 1
-    # utxo = utxoset.find_one()
-    # assert utxo['transaction_id'] == signed_transfer_tx.id
-    # assert utxo['output_index'] == 0
+    assert utxoset.count() == 1
+    utxo = utxoset.find_one()
+    assert utxo['transaction_id'] == signed_transfer_tx.id
+    assert utxo['output_index'] == 0
     assert not mocked_store_assets.called
     mocked_store_metadata.asser_called_once_with(
         tb.connection,
@@ -347,11 +374,210 @@ def test_get_utxoset_merkle_root_when_no_utxo(b):
 @pytest.mark.usefixture('utxoset')
 def test_get_utxoset_merkle_root(b, utxoset):
     expected_merkle_root = (
-        '86d311c03115bf4d287f8449ca5828505432d69b82762d47077b1c00fe426eac')
+        '8aeb0ea2a2e94355c672128e00513ddfc8a3e5b4b1ef7d0c9d7657735a28416f')
     merkle_root = b.get_utxoset_merkle_root()
     assert merkle_root == expected_merkle_root
 
 
+@pytest.mark.bdb
+def test_get_utxoset_merkle_root_from_utxo_index(b, signed_create_tx,
+                                                 signed_transfer_tx):
+    b.store_bulk_transactions([signed_create_tx])
+    b.load_utxo_index()
+    b.store_bulk_transactions([signed_transfer_tx])
+    merkle_root = b.get_utxoset_merkle_root()
+
+    b.utxo_index = None
+    assert b.get_utxoset_merkle_root() == merkle_root
+
+
+@pytest.mark.bdb
+def test_transaction_exists_with_known_ids(b, signed_create_tx,
+                                           signed_transfer_tx, mocker):
+    b.store_bulk_transactions([signed_create_tx])
+    b.load_known_transaction_ids()
+    get_transaction = mocker.spy(b, 'get_transaction')
+    query_transaction = mocker.patch(
+        'bigchaindb.backend.query.get_transaction', return_value=None)
+
+    assert not b.transaction_exists(signed_transfer_tx.id)
+    assert not query_transaction.called
+
+    query_transaction.return_value = signed_create_tx.to_dict()
+    assert b.transaction_exists(signed_create_tx.id)
+    assert query_transaction.call_count == 1
+    assert not get_transaction.called
+
+
+@pytest.mark.bdb
+def test_stored_transactions_are_not_validated_again(b, signed_create_tx,
+                                                     signed_transfer_tx,
+                                                     mocker):
+    from bigchaindb.common.transaction import Transaction
+
+    b.store_bulk_transactions([signed_create_tx, signed_transfer_tx])
+    validate_id = mocker.spy(Transaction, 'validate_id')
+
+    assert b.get_transaction(signed_create_tx.id) == signed_create_tx
+    assert b.get_spent(signed_create_tx.id, 0) == signed_transfer_tx
+    transactions = b.get_transactions_filtered(signed_create_tx.id)
+    assert sorted(tx.id for tx in transactions) == \
+        sorted([signed_create_tx.id, signed_transfer_tx.id])
+    assert not validate_id.called
+
+
+@pytest.mark.bdb
+def test_get_transactions_in_one_query(b, signed_create_tx,
+                                       signed_transfer_tx, mocker):
+    b.store_bulk_transactions([signed_create_tx, signed_transfer_tx])
+    get_full_transactions = mocker.spy(backend.query,
+                                       'get_full_transactions')
+
+    txids = [signed_transfer_tx.id, 'unknown', signed_create_tx.id]
+    assert b.get_transactions(txids) == [signed_transfer_tx,
+                                         signed_create_tx]
+    assert get_full_transactions.call_count == 1
+    assert b.get_raw_transaction(signed_create_tx.id) == \
+        signed_create_tx.to_dict()
+
+
+@pytest.mark.bdb
+def test_get_transactions_filtered_by_batches(b, alice, mocker,
+                                              monkeypatch):
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)],
+                            asset={'msg': 'batches'})\
+                    .sign([alice.private_key])
+    transfers = [tx]
+    for _ in range(4):
+        transfers.append(
+            Transaction.transfer(transfers[-1].to_inputs(),
+                                 [([alice.public_key], 1)],
+                                 asset_id=tx.id)
+                       .sign([alice.private_key]))
+    b.store_bulk_transactions(transfers)
+
+    monkeypatch.setattr('bigchaindb.tendermint.lib.FETCH_BATCH_SIZE', 2)
+    get_full_transactions = mocker.spy(backend.query,
+                                       'get_full_transactions')
+    get_transaction = mocker.spy(b, 'get_transaction')
+
+    txs = list(b.get_transactions_filtered(tx.id))
+    assert sorted(t.id for t in txs) == sorted(t.id for t in transfers)
+    assert get_full_transactions.call_count == 3
+    assert not get_transaction.called
+
+    assert [t.id for t in b.get_transactions_filtered(
+        tx.id, operation='CREATE')] == [tx.id]
+
+
+@pytest.mark.bdb
+def test_validate_transactions_rejects_spenders_of_invalid_ones(b, alice,
+                                                                bob):
+    from bigchaindb.common.exceptions import (InputDoesNotExist,
+                                              InvalidSignature)
+    from bigchaindb.models import Transaction
+
+    valid = Transaction.create([alice.public_key],
+                               [([alice.public_key], 1)])\
+                       .sign([alice.private_key])
+    unsigned = Transaction.create([alice.public_key],
+                                  [([alice.public_key], 1)],
+                                  metadata={'signed': False})
+    unsigned._hash()
+    transfer = Transaction.transfer(unsigned.to_inputs(),
+                                    [([bob.public_key], 1)],
+                                    asset_id=unsigned.id)\
+                          .sign([alice.private_key])
+    # spends the output of a rejected transfer
+    transfer_again = Transaction.transfer(transfer.to_inputs(),
+                                          [([alice.public_key], 1)],
+                                          asset_id=unsigned.id)\
+                                .sign([bob.private_key])
+
+    results = b.validate_transactions([tx.to_dict() for tx in
+                                       (valid, unsigned, transfer,
+                                        transfer_again)])
+
+    assert results[0] == (valid, None)
+    assert [transaction for transaction, _ in results[1:]] == [None] * 3
+    assert isinstance(results[1][1], InvalidSignature)
+    assert isinstance(results[2][1], InputDoesNotExist)
+    assert isinstance(results[3][1], InputDoesNotExist)
+
+
+@pytest.mark.bdb
+def test_get_outputs_filtered_by_pages(b, alice, bob):
+    from bigchaindb.models import Transaction
+
+    txs = [Transaction.create([alice.public_key],
+                              [([alice.public_key], 1)] * 2)
+                      .sign([alice.private_key])
+           for _ in range(2)]
+    spend = Transaction.transfer(txs[0].to_inputs()[:1],
+                                 [([bob.public_key], 1)],
+                                 asset_id=txs[0].id)\
+                       .sign([alice.private_key])
+    b.store_bulk_transactions(txs + [spend])
+    outputs = sorted((tx.id, index) for tx in txs for index in (0, 1))
+
+    def links(*args, **kwargs):
+        return [(link.txid, link.output) for link in
+                b.get_outputs_filtered(alice.public_key, *args, **kwargs)]
+
+    assert links() == outputs
+    assert links(limit=3) == outputs[:3]
+    assert links(after=outputs[0], limit=2) == outputs[1:3]
+    assert links(after=outputs[1]) == outputs[2:]
+    assert links(False) == [output for output in outputs
+                            if output != (txs[0].id, 0)]
+    assert links(True) == [(txs[0].id, 0)]
+
+
+@pytest.mark.bdb
+def test_resolve_inputs_in_one_query_each(b, alice, bob, mocker):
+    from bigchaindb.models import Transaction
+    from bigchaindb.common.exceptions import DoubleSpend, InputDoesNotExist
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)] * 3)\
+                    .sign([alice.private_key])
+    b.store_bulk_transactions([tx])
+    consolidate = Transaction.transfer(tx.to_inputs(),
+                                       [([bob.public_key], 3)],
+                                       asset_id=tx.id)\
+                             .sign([alice.private_key])
+
+    get_transaction = mocker.spy(b, 'get_transaction')
+    get_outputs = mocker.spy(backend.query, 'get_transaction_outputs')
+    get_spenders = mocker.spy(backend.query,
+                              'get_spending_transaction_inputs')
+    assert b.validate_transaction(consolidate) == consolidate
+    assert not get_transaction.called
+    assert get_outputs.call_count == get_spenders.call_count == 1
+
+    outputs = b.resolve_inputs([input_.fulfills
+                                for input_ in consolidate.inputs])
+    assert outputs[(tx.id, 2)].amount == 1
+    assert outputs[(tx.id, 2)].asset_id == tx.id
+    assert outputs[(tx.id, 2)].condition_uri == \
+        tx.outputs[2].fulfillment.condition_uri
+
+    b.store_bulk_transactions([consolidate])
+    with pytest.raises(DoubleSpend):
+        b.resolve_inputs([consolidate.inputs[0].fulfills])
+    # a stored transaction does not double spend its own inputs
+    assert b.resolve_inputs([consolidate.inputs[0].fulfills],
+                            spender_id=consolidate.id)
+
+    missing = consolidate.to_inputs()[0].fulfills
+    missing.output = 1
+    with pytest.raises(InputDoesNotExist):
+        b.resolve_inputs([missing])
+
+
 @pytest.mark.bdb
 def test_get_spent_transaction_critical_double_spend(b, alice, bob, carol):
     from bigchaindb.models import Transaction
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+try:
+    from hashlib import sha3_256
+except ImportError:
+    from sha3 import sha3_256
+
+
+pytestmark = pytest.mark.tendermint
+
+
+def test_merkle_tree_root_does_not_depend_on_history():
+    from bigchaindb.tendermint.merkle import MerkleTree
+
+    leaves = [sha3_256(str(i).encode()).digest() for i in range(100)]
+    tree = MerkleTree(leaves)
+    merkle_root = tree.merkle_root()
+
+    random.shuffle(leaves)
+    assert MerkleTree(leaves).merkle_root() == merkle_root
+
+    extra = [sha3_256('extra{}'.format(i).encode()).digest()
+             for i in range(10)]
+    for leaf in extra:
+        tree.add(leaf)
+    assert tree.merkle_root() == MerkleTree(leaves + extra).merkle_root()
+    for leaf in extra:
+        tree.remove(leaf)
+    assert tree.merkle_root() == merkle_root
+
+
+def test_merkle_tree_with_less_than_two_leaves():
+    from bigchaindb.tendermint.merkle import MerkleTree
+
+    leaf = sha3_256(b'a').digest()
+    tree = MerkleTree()
+    assert tree.merkle_root() == sha3_256(b'').hexdigest()
+    tree.add(leaf)
+    assert tree.merkle_root() == leaf.hex()
+    tree.remove(leaf)
+    assert tree.merkle_root() == sha3_256(b'').hexdigest()
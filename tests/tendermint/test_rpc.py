@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+import pytest
+
+
+pytestmark = pytest.mark.tendermint
+
+
+@patch('time.sleep')
+@patch('requests.Session.post')
+def test_call_retries_on_connection_error(mock_post, mock_sleep):
+    from requests.exceptions import ConnectionError
+    from bigchaindb.tendermint.rpc import TendermintRPC
+
+    response = object()
+    mock_post.side_effect = [ConnectionError, ConnectionError, response]
+    client = TendermintRPC(endpoint='http://tendermint:46657/',
+                           retries=3, backoff=0.5)
+
+    assert client.call('broadcast_tx_sync', 'tx') is response
+    assert mock_post.call_count == 3
+    assert [c[0][0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    args, kwargs = mock_post.call_args
+    assert args == ('http://tendermint:46657/',)
+    assert kwargs['json']['method'] == 'broadcast_tx_sync'
+    assert kwargs['json']['params'] == ['tx']
+
+
+@patch('time.sleep')
+@patch('requests.Session.get')
+def test_get_gives_up_after_retries(mock_get, mock_sleep):
+    from requests.exceptions import ConnectionError
+    from bigchaindb.tendermint.rpc import TendermintRPC
+
+    mock_get.side_effect = ConnectionError
+    client = TendermintRPC(retries=2)
+
+    with pytest.raises(ConnectionError):
+        client.get('status')
+    assert mock_get.call_count == 3
+
+
+def test_get_client_is_reused_within_a_process(monkeypatch):
+    from bigchaindb.tendermint import rpc
+
+    client = rpc.get_client()
+    assert rpc.get_client() is client
+
+    monkeypatch.setattr('os.getpid', lambda: -1)
+    assert rpc.get_client() is not client
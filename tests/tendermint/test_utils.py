@@ -68,3 +68,25 @@ def test_public_key_encoding_decoding():
     base64_public_key = public_key_to_base64(public_key)
 
     assert base64_public_key == SAMPLE_PUBLIC_KEY['pub_key']['value']
+
+
+def test_signal_validator_update(tmpdir, monkeypatch):
+    import os
+    import signal
+    from bigchaindb.tendermint import utils
+
+    monkeypatch.setattr(utils, 'PID_FILE', str(tmpdir.join('bigchaindb.pid')))
+    assert not utils.signal_validator_update()
+
+    signaled = []
+    previous = signal.signal(signal.SIGUSR1,
+                             lambda signum, frame: signaled.append(signum))
+    try:
+        utils.write_pid_file()
+        assert utils.signal_validator_update()
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+    assert signaled == [signal.SIGUSR1]
+
+    utils.remove_pid_file()
+    assert not os.path.exists(utils.PID_FILE)
@@ -0,0 +1,22 @@
+import pytest
+
+
+pytestmark = pytest.mark.tendermint
+
+
+def test_utxo_index(signed_create_tx):
+    from bigchaindb.tendermint.utxo import UTXOIndex
+
+    utxo = next(signed_create_tx.unspent_outputs)
+    index = UTXOIndex([utxo._asdict()])
+    assert len(index) == 1
+    assert (signed_create_tx.id, 0) in index
+    assert index.get(signed_create_tx.id, 0) == utxo
+    assert index.get(signed_create_tx.id, 1) is None
+
+    index.remove(signed_create_tx.id, 0)
+    index.remove(signed_create_tx.id, 0)
+    assert len(index) == 0
+
+    index.add(utxo)
+    assert index.get(signed_create_tx.id, 0) == utxo
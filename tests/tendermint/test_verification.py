@@ -0,0 +1,69 @@
+import pytest
+
+
+pytestmark = pytest.mark.tendermint
+
+
+def test_signature_batch(alice, bob):
+    from bigchaindb.common.transaction import Input
+    from bigchaindb.models import Transaction
+    from bigchaindb.tendermint.verification import SignatureBatch
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+    unsigned = Transaction.create([alice.public_key],
+                                  [([alice.public_key], 1)],
+                                  metadata={'signed': False})
+    unsigned._hash()
+    transfer = Transaction.transfer(tx.to_inputs(),
+                                    [([bob.public_key], 1)],
+                                    asset_id=tx.id)\
+                          .sign([alice.private_key])
+    # bob signs an output locked to alice's key
+    bob_input = Input(Input.generate([bob.public_key]).fulfillment,
+                      [bob.public_key], tx.to_inputs()[0].fulfills)
+    wrong_key = Transaction.transfer([bob_input],
+                                     [([bob.public_key], 1)],
+                                     asset_id=tx.id)\
+                           .sign([bob.private_key])
+
+    batch = SignatureBatch(processes=0)
+    condition_uri = tx.outputs[0].fulfillment.condition_uri
+    batch.add(tx, [None])
+    batch.add(unsigned, [None])
+    batch.add(transfer, [condition_uri])
+    batch.add(wrong_key, [condition_uri])
+    assert len(batch) == 4
+
+    assert batch.verify() == {unsigned.id, wrong_key.id}
+    assert len(batch) == 0
+    assert batch.verify() == set()
+
+
+def test_signature_batch_uses_a_process_pool(alice, monkeypatch):
+    from bigchaindb.models import Transaction
+    from bigchaindb.tendermint import verification
+    from bigchaindb.tendermint.verification import SignatureBatch
+
+    # do not leave a terminated pool to the other tests
+    monkeypatch.setattr(verification, '_shared_pool', None)
+
+    transactions = [Transaction.create([alice.public_key],
+                                       [([alice.public_key], 1)],
+                                       metadata={'i': i})
+                    .sign([alice.private_key])
+                    for i in range(8)]
+    unsigned = Transaction.create([alice.public_key],
+                                  [([alice.public_key], 1)])
+    unsigned._hash()
+
+    batch = SignatureBatch(processes=2, min_pool_size=2)
+    for tx in transactions + [unsigned]:
+        batch.add(tx, [None])
+
+    try:
+        assert batch.verify() == {unsigned.id}
+        assert batch.pool is not None
+    finally:
+        batch.pool.terminate()
@@ -69,3 +69,61 @@ def test_exchange_stops_with_poison_pill():
     exchange.run()
 
     assert publisher_queue.qsize() == 0
+
+
+def test_dispatch_serializes_the_event_once(monkeypatch):
+    import pickle
+    from bigchaindb.events import EventTypes, Event, Exchange
+
+    event = Event(EventTypes.BLOCK_VALID, {'msg': 'some data'})
+    exchange = Exchange()
+    subscribers = [exchange.get_subscriber_queue() for _ in range(3)]
+
+    dumps = []
+
+    def counting_dumps(obj, *args, **kwargs):
+        if isinstance(obj, Event):
+            dumps.append(obj)
+        return pickle_dumps(obj, *args, **kwargs)
+
+    pickle_dumps = pickle.dumps
+    monkeypatch.setattr('pickle.dumps', counting_dumps)
+    exchange.dispatch(event)
+
+    for queue in subscribers:
+        received = queue.get()
+        assert isinstance(received, Event)
+        assert received.data == event.data
+    assert len(dumps) == 1
+
+
+def test_exchange_delivers_batches():
+    from bigchaindb.events import EventTypes, Event, Exchange, POISON_PILL
+
+    exchange = Exchange()
+    batches = exchange.get_subscriber_queue(EventTypes.BLOCK_VALID,
+                                            batch_size=2, batch_latency=10)
+    events = exchange.get_subscriber_queue(EventTypes.BLOCK_VALID)
+
+    publisher_queue = exchange.get_publisher_queue()
+    for i in range(3):
+        publisher_queue.put(Event(EventTypes.BLOCK_VALID, i))
+    publisher_queue.put(POISON_PILL)
+    exchange.run()
+
+    # the last, incomplete, batch is delivered when the exchange stops
+    assert [event.data for event in batches.get()] == [0, 1]
+    assert [event.data for event in batches.get()] == [2]
+    assert [events.get().data for _ in range(3)] == [0, 1, 2]
+
+
+def test_subscription_drops_newest_events_when_full():
+    from bigchaindb.events import Subscription
+
+    subscription = Subscription(queue_size=1, overflow_policy='drop_newest')
+    subscription.put('first')
+    subscription.put('second')
+
+    assert subscription.queue.get() == 'first'
+    assert subscription.metrics()['delivered'] == 1
+    assert subscription.metrics()['dropped'] == 1
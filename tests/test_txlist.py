@@ -62,3 +62,13 @@ def test_get_txlist_by_asset(b, txlist):
 def test_get_txlist_by_operation(b, txlist):
     res = b.get_transactions_filtered(txlist.create1.id, operation='CREATE')
     assert set(tx.id for tx in res) == {txlist.create1.id}
+
+
+@pytest.mark.bdb
+def test_get_txlist_by_pages(b, txlist):
+    txids = sorted([txlist.create1.id, txlist.transfer1.id])
+
+    res = b.get_transactions_filtered(txlist.create1.id, limit=1)
+    assert [tx.id for tx in res] == txids[:1]
+    res = b.get_transactions_filtered(txlist.create1.id, after=txids[0])
+    assert [tx.id for tx in res] == txids[1:]
@@ -58,6 +58,8 @@ def flush_localmongo_db(connection, dbname):
     connection.conn[dbname].metadata.delete_many({})
     connection.conn[dbname].utxos.delete_many({})
     connection.conn[dbname].validators.delete_many({})
+    # NOTE: documents cannot be deleted from a capped collection
+    connection.conn[dbname].abci_traces.drop()
 
 
 @singledispatch
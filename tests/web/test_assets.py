@@ -17,6 +17,19 @@ def test_get_assets_with_missing_text_search(client):
     assert res.status_code == 400
 
 
+@pytest.mark.tendermint
+def test_get_assets_stream_reports_query_errors(client):
+    from unittest.mock import patch
+    from bigchaindb.backend.exceptions import OperationError
+
+    with patch('bigchaindb.tendermint.lib.BigchainDB.text_search',
+               side_effect=OperationError('no text index')):
+        res = client.get(ASSETS_ENDPOINT + '?search=abc',
+                         headers={'Accept': 'application/x-ndjson'})
+    assert res.status_code == 400
+    assert res.json['message'].startswith('(OperationError)')
+
+
 @pytest.mark.genesis
 def test_get_assets(client, b):
     from bigchaindb.models import Transaction
@@ -140,3 +153,31 @@ def test_get_assets_limit_tendermint(client, tb):
     res = client.get(ASSETS_ENDPOINT + '?search=abc&limit=1')
     assert res.status_code == 200
     assert len(res.json) == 1
+
+
+@pytest.mark.bdb
+@pytest.mark.tendermint
+@pytest.mark.localmongodb
+def test_get_assets_by_pages_tendermint(client, tb):
+    from bigchaindb.models import Transaction
+
+    b = tb
+    txs = [Transaction.create([b.me], [([b.me], 1)],
+                              asset={'msg': 'abc {}'.format(i)})
+                      .sign([b.me_private])
+           for i in range(3)]
+    b.store_bulk_transactions(txs)
+
+    url = ASSETS_ENDPOINT + '?search=abc&limit=2'
+    pages = []
+    while url:
+        res = client.get(url)
+        assert res.status_code == 200
+        pages.append(res.json)
+        link = res.headers.get('Link')
+        url = link[1:link.index('>')] if link else None
+
+    assert [len(page) for page in pages] == [2, 1]
+    assert sorted(asset['id'] for page in pages for asset in page) == \
+        sorted(tx.id for tx in txs)
+    assert 'score' not in pages[0][0]
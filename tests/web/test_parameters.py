@@ -73,3 +73,24 @@ def test_valid_operation():
         valid_operation('blah')
     with pytest.raises(ValueError):
         valid_operation('')
+
+
+def test_valid_cursors():
+    from bigchaindb.web.views.base import encode_cursor
+    from bigchaindb.web.views.parameters import (valid_output_cursor,
+                                                 valid_search_cursor,
+                                                 valid_transaction_cursor)
+
+    txid = '18ac3e7343f016890c510e93f935261169d9e3f565436429830faf0934f4f8e4'
+    assert valid_transaction_cursor(encode_cursor(txid)) == txid
+    assert valid_output_cursor(encode_cursor((txid, 1))) == (txid, 1)
+    assert valid_search_cursor(encode_cursor((1.5, txid))) == (1.5, txid)
+
+    for cursor in ('', 'not a cursor', encode_cursor(1),
+                   encode_cursor([txid, '1'])):
+        with pytest.raises(ValueError):
+            valid_output_cursor(cursor)
+    with pytest.raises(ValueError):
+        valid_transaction_cursor(encode_cursor([txid, 1]))
+    with pytest.raises(ValueError):
+        valid_search_cursor(encode_cursor(txid))
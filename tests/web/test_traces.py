@@ -0,0 +1,41 @@
+import pytest
+
+pytestmark = [pytest.mark.bdb, pytest.mark.tendermint]
+
+TRACES_ENDPOINT = '/api/v1/traces/'
+
+
+def test_get_traces_endpoint(b, client, alice, monkeypatch):
+    from pymongo import WriteConcern
+    from bigchaindb.tendermint import App
+    from bigchaindb.models import Transaction
+
+    # wait for the traces to be written, so that they can be read back
+    monkeypatch.setattr(
+        'bigchaindb.backend.localmongodb.query.ABCI_TRACE_WRITE_CONCERN',
+        WriteConcern())
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+    raw_tx = tx.serialized.encode()
+
+    app = App(b)
+    app.init_chain(['ignore'])
+    for height in (1, 2):
+        app.begin_block('ignore')
+        app.deliver_tx(raw_tx)
+        app.end_block(height)
+        app.commit()
+
+    res = client.get(TRACES_ENDPOINT)
+    assert res.status_code == 200
+    assert [trace['height'] for trace in res.json] == [2, 1]
+    assert res.json[1]['accepted'] == 1
+    assert res.json[1]['bytes_written'] == len(raw_tx)
+    assert res.json[0]['accepted'] == 0
+    assert res.json[0]['rejected'] == 1
+    assert res.json[0]['deliver_tx_max'] <= res.json[0]['deliver_tx']
+
+    res = client.get(TRACES_ENDPOINT + '?limit=1')
+    assert [trace['height'] for trace in res.json] == [2]
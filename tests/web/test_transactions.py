@@ -352,7 +352,7 @@ def test_post_wrong_asset_division_transfer_returns_400(b, client, user_pk):
     create_tx = Transaction.create([pub_key],
                                    [([pub_key], 10)],
                                    asset={'test': 'asset'}).sign([priv_key])
-    res = client.post(TX_ENDPOINT + '?mode=commit', data=json.dumps(create_tx.to_dict()))
+    res = client.post(TX_ENDPOINT + '?mode=sync', data=json.dumps(create_tx.to_dict()))
     assert res.status_code == 202
 
     transfer_tx = Transaction.transfer(create_tx.to_inputs(),
@@ -380,7 +380,7 @@ def test_transactions_get_list_good(client):
 
     asset_id = '1' * 64
 
-    with patch('bigchaindb.core.Bigchain.get_transactions_filtered', get_txs_patched):
+    with patch('bigchaindb.tendermint.lib.BigchainDB.get_transactions_filtered', get_txs_patched):
         url = TX_ENDPOINT + '?asset_id=' + asset_id
         assert client.get(url).json == [
             ['asset_id', asset_id],
@@ -397,7 +397,7 @@ def test_transactions_get_list_good(client):
 def test_transactions_get_list_bad(client):
     def should_not_be_called():
         assert False
-    with patch('bigchaindb.core.Bigchain.get_transactions_filtered',
+    with patch('bigchaindb.tendermint.lib.BigchainDB.get_transactions_filtered',
                lambda *_, **__: should_not_be_called()):
         # Test asset id validated
         url = TX_ENDPOINT + '?asset_id=' + '1' * 63
@@ -410,6 +410,43 @@ def test_transactions_get_list_bad(client):
         assert client.get(url).status_code == 400
 
 
+@pytest.mark.bdb
+@pytest.mark.tendermint
+def test_transactions_get_list_by_pages(b, client, alice):
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)])\
+                    .sign([alice.private_key])
+    txs = [tx]
+    for _ in range(4):
+        txs.append(Transaction.transfer(txs[-1].to_inputs(),
+                                        [([alice.public_key], 1)],
+                                        asset_id=tx.id)
+                              .sign([alice.private_key]))
+    b.store_bulk_transactions(txs)
+    txids = sorted(t.id for t in txs)
+
+    url = TX_ENDPOINT + '?asset_id={}&limit=2'.format(tx.id)
+    pages = []
+    while url:
+        res = client.get(url)
+        assert res.status_code == 200
+        pages.append([t['id'] for t in res.json])
+        link = res.headers.get('Link')
+        url = link[1:link.index('>')] if link else None
+    assert pages == [txids[:2], txids[2:4], txids[4:]]
+
+    res = client.get(TX_ENDPOINT + '?asset_id={}'.format(tx.id),
+                     headers={'Accept': 'application/x-ndjson'})
+    assert res.mimetype == 'application/x-ndjson'
+    lines = res.get_data(as_text=True).splitlines()
+    assert sorted(json.loads(line)['id'] for line in lines) == txids
+
+    res = client.get(TX_ENDPOINT + '?asset_id={}&after=abc'.format(tx.id))
+    assert res.status_code == 400
+
+
 def test_return_only_valid_transaction(client):
     from bigchaindb import Bigchain
 
@@ -434,12 +471,11 @@ def test_return_only_valid_transaction(client):
 
 
 @pytest.mark.tendermint
-@patch('requests.post')
+@patch('requests.Session.post')
 @pytest.mark.parametrize('mode', [
     ('', 'broadcast_tx_async'),
     ('?mode=async', 'broadcast_tx_async'),
     ('?mode=sync', 'broadcast_tx_sync'),
-    ('?mode=commit', 'broadcast_tx_commit'),
 ])
 def test_post_transaction_valid_modes(mock_post, client, mode):
     from bigchaindb.models import Transaction
@@ -455,6 +491,25 @@ def test_post_transaction_valid_modes(mock_post, client, mode):
     assert mode[1] == kwargs['json']['method']
 
 
+@pytest.mark.tendermint
+@patch('requests.Session.post')
+def test_post_transaction_commit_mode_redirects(mock_post, client,
+                                                wsserver_host, wsserver_port):
+    from bigchaindb.models import Transaction
+    from bigchaindb.common.crypto import generate_key_pair
+    from bigchaindb.web.websocket_server import COMMIT_ENDPOINT
+    alice = generate_key_pair()
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)],
+                            asset=None) \
+        .sign([alice.private_key])
+    res = client.post(TX_ENDPOINT + '?mode=commit', data=json.dumps(tx.to_dict()))
+    assert res.status_code == 307
+    assert res.headers['Location'] == 'http://{}:{}{}'.format(
+        wsserver_host, wsserver_port, COMMIT_ENDPOINT)
+    assert not mock_post.called
+
+
 @pytest.mark.tendermint
 def test_post_transaction_invalid_mode(client):
     from bigchaindb.models import Transaction
@@ -469,3 +524,61 @@ def test_post_transaction_invalid_mode(client):
     assert '400 BAD REQUEST' in response.status
     assert 'Mode must be "async", "sync" or "commit"' ==\
            json.loads(response.data.decode('utf8'))['message']['mode']
+
+
+@pytest.mark.bdb
+@pytest.mark.tendermint
+@patch('requests.Session.post')
+def test_post_transaction_batch(mock_post, client):
+    from unittest.mock import Mock
+    from bigchaindb.models import Transaction
+    from bigchaindb.common.crypto import generate_key_pair
+    from bigchaindb.tendermint.utils import encode_transaction
+
+    def post(url, json, **kwargs):
+        return Mock(json=lambda: [{'id': payload['id'], 'jsonrpc': '2.0',
+                                   'result': {}} for payload in json])
+    mock_post.side_effect = post
+
+    alice = generate_key_pair()
+    tx = Transaction.create([alice.public_key],
+                            [([alice.public_key], 1)],
+                            asset=None) \
+        .sign([alice.private_key]).to_dict()
+    # a well-formed fulfillment, signing another transaction
+    bad_tx = Transaction.create([alice.public_key],
+                                [([alice.public_key], 1)],
+                                asset={'msg': 'bad'}).to_dict()
+    bad_tx['inputs'][0]['fulfillment'] = tx['inputs'][0]['fulfillment']
+    bad_tx['id'] = None
+    bad_tx['id'] = sha3_256(
+        json.dumps(
+            bad_tx,
+            sort_keys=True,
+            separators=(',', ':'),
+            ensure_ascii=False,
+        ).encode(),
+    ).hexdigest()
+
+    res = client.post(TX_ENDPOINT + 'batch?mode=sync',
+                      data=json.dumps([tx, bad_tx, tx, 'nope']))
+
+    assert res.status_code == 200
+    assert [r['status'] for r in res.json] == [202, 400, 400, 400]
+    assert res.json[0]['id'] == tx['id']
+    assert res.json[1]['message'].startswith(
+        'Invalid transaction (InvalidSignature)')
+    assert res.json[2]['message'].startswith(
+        'Invalid transaction (DuplicateTransaction)')
+
+    # the valid transactions are sent in a single batch request
+    assert mock_post.call_count == 1
+    args, kwargs = mock_post.call_args
+    assert [(p['method'], p['params']) for p in kwargs['json']] == \
+        [('broadcast_tx_sync', [encode_transaction(tx)])]
+
+
+@pytest.mark.tendermint
+def test_post_transaction_batch_requires_a_list(client):
+    res = client.post(TX_ENDPOINT + 'batch', data=json.dumps({}))
+    assert res.status_code == 400
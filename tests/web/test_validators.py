@@ -9,9 +9,9 @@ VALIDATORS_ENDPOINT = '/api/v1/validators/'
 
 def test_get_validators_endpoint(b, client, monkeypatch):
 
-    def mock_get(uri):
+    def mock_get(self, uri, **kwargs):
         return MockResponse()
-    monkeypatch.setattr('requests.get', mock_get)
+    monkeypatch.setattr('requests.Session.get', mock_get)
 
     res = client.get(VALIDATORS_ENDPOINT)
 
@@ -21,9 +21,9 @@ def test_get_validators_endpoint(b, client, monkeypatch):
 
 def test_get_validators_500_endpoint(b, client, monkeypatch):
 
-    def mock_get(uri):
+    def mock_get(self, uri, **kwargs):
         raise RequestException
-    monkeypatch.setattr('requests.get', mock_get)
+    monkeypatch.setattr('requests.Session.get', mock_get)
 
     with pytest.raises(RequestException):
         client.get(VALIDATORS_ENDPOINT)
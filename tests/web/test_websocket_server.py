@@ -148,6 +148,229 @@ def test_websocket_block_event(b, _block, test_client, loop):
     yield from event_source.put(POISON_PILL)
 
 
+@asyncio.coroutine
+def test_websocket_filtered_subscriptions(loop):
+    from bigchaindb import events
+    from bigchaindb.web.websocket_server import Dispatcher, POISON_PILL
+    from bigchaindb.models import Transaction
+    from bigchaindb.common import crypto
+
+    alice_priv, alice_pub = crypto.generate_key_pair()
+    bob_priv, bob_pub = crypto.generate_key_pair()
+    tx_alice = Transaction.create([alice_pub], [([alice_pub], 1)]) \
+        .sign([alice_priv]).to_dict()
+    tx_bob = Transaction.create([bob_pub], [([bob_pub], 1)]) \
+        .sign([bob_priv]).to_dict()
+
+    event_source = asyncio.Queue(loop=loop)
+    dispatcher = Dispatcher(event_source, loop=loop)
+    everything, alice, bob_transfers = (MockWebSocket() for _ in range(3))
+    dispatcher.subscribe('everything', everything)
+    dispatcher.subscribe('alice', alice, {'public_key': {alice_pub}})
+    dispatcher.subscribe('bob_transfers', bob_transfers,
+                         {'public_key': {bob_pub},
+                          'operation': {'TRANSFER'}})
+
+    block = {'height': 1, 'transactions': [tx_alice, tx_bob]}
+    yield from event_source.put(
+        events.Event(events.EventTypes.BLOCK_VALID, block))
+    yield from event_source.put(POISON_PILL)
+    yield from dispatcher.publish()
+    for subscriber in dispatcher.subscribers.values():
+        yield from subscriber.queue.join()
+
+    def received(websocket):
+        return [json.loads(s)['transaction_id'] for s in websocket.received]
+
+    assert received(everything) == [tx_alice['id'], tx_bob['id']]
+    assert received(alice) == [tx_alice['id']]
+    assert received(bob_transfers) == []
+
+    dispatcher.unsubscribe('alice')
+    assert not dispatcher.index['public_key']
+
+
+@asyncio.coroutine
+@pytest.mark.parametrize('policy,received,dropped', [
+    ('drop_oldest', ['1', '3', '4'], 1),
+    ('coalesce', ['1', 'gap', '4'], 2),
+    ('disconnect', ['1'], 3),
+])
+def test_subscriber_overflow_policy(loop, policy, received, dropped):
+    from bigchaindb.web.websocket_server import Subscriber
+
+    class SlowWebSocket(MockWebSocket):
+        def __init__(self):
+            super().__init__()
+            self.drain = asyncio.Event(loop=loop)
+
+        def send_str(self, s):
+            super().send_str(s)
+            return self.drain.wait()
+
+        @asyncio.coroutine
+        def close(self):
+            pass
+
+    websocket = SlowWebSocket()
+    subscriber = Subscriber(websocket, queue_size=2, policy=policy,
+                            loop=loop)
+    subscriber.put('1', 1)
+    # let the sender take the first message and wait for the drain
+    yield from asyncio.sleep(0, loop=loop)
+    for height in (2, 3, 4):
+        subscriber.put(str(height), height)
+    websocket.drain.set()
+    if not subscriber.closed:
+        yield from subscriber.queue.join()
+
+    assert [json.loads(s)['type'] if s.startswith('{') else s
+            for s in websocket.received] == received
+    assert subscriber.dropped == dropped
+
+
+@asyncio.coroutine
+@pytest.mark.parametrize('policy', ['drop_oldest', 'coalesce', 'disconnect'])
+def test_subscriber_holds_back_more_events_than_queue_size(loop, policy):
+    from bigchaindb.web.websocket_server import Subscriber
+
+    websocket = MockWebSocket()
+    subscriber = Subscriber(websocket, queue_size=2, policy=policy,
+                            start=False, loop=loop)
+    # the live events of the blocks committed while replaying
+    for height in range(1, 6):
+        subscriber.put(str(height), height)
+    assert len(subscriber) == 5
+
+    subscriber.start(after_height=1)
+    subscriber.put('6', 6)
+    yield from subscriber.queue.join()
+
+    assert websocket.received == ['2', '3', '4', '5', '6']
+    assert subscriber.dropped == 0
+    assert not subscriber.closed
+
+
+@asyncio.coroutine
+def test_websocket_replay_from_height(test_client, loop):
+    from bigchaindb import events
+    from bigchaindb.web.websocket_server import init_app, POISON_PILL, EVENTS_ENDPOINT
+
+    def tx(txid):
+        return {'id': txid, 'operation': 'CREATE',
+                'outputs': [{'public_keys': ['pk']}]}
+
+    blocks = {1: [tx('a')], 2: [tx('b')], 3: [tx('c')]}
+    event_source = asyncio.Queue(loop=loop)
+
+    class MockBigchainDB:
+        def get_latest_block(self):
+            return {'height': max(blocks)}
+
+        def get_blocks(self, from_height, to_height):
+            # the block 4 is committed while replaying
+            blocks[4] = [tx('d')]
+            loop.call_soon_threadsafe(
+                event_source.put_nowait,
+                events.Event(events.EventTypes.BLOCK_VALID,
+                             {'height': 4, 'transactions': blocks[4]}))
+            return [{'height': height, 'transactions': blocks[height]}
+                    for height in sorted(blocks)
+                    if from_height <= height <= to_height]
+
+    app = init_app(event_source, bigchaindb_factory=MockBigchainDB,
+                   loop=loop)
+    client = yield from test_client(app)
+    ws = yield from client.ws_connect(EVENTS_ENDPOINT + '?from_height=2')
+
+    received = []
+    for _ in range(3):
+        result = yield from ws.receive()
+        received.append(json.loads(result.data)['transaction_id'])
+    assert received == ['b', 'c', 'd']
+
+    yield from event_source.put(events.Event(
+        events.EventTypes.BLOCK_VALID,
+        {'height': 5, 'transactions': [tx('e')]}))
+    result = yield from ws.receive()
+    assert json.loads(result.data)['transaction_id'] == 'e'
+
+    yield from event_source.put(POISON_PILL)
+
+
+def test_parse_filters():
+    from multidict import MultiDict
+    from bigchaindb.web.websocket_server import parse_filters
+
+    asset_id = 'a' * 64
+    query = MultiDict([('asset_id', asset_id), ('operation', 'create'),
+                       ('operation', 'transfer')])
+    assert parse_filters(query) == {
+        'asset_id': {asset_id},
+        'operation': {'CREATE', 'TRANSFER'},
+    }
+    with pytest.raises(ValueError):
+        parse_filters(MultiDict([('asset_id', 'nope')]))
+
+
+def test_commit_waiters_resolve(loop):
+    from bigchaindb.web.websocket_server import CommitWaiters
+
+    commit_waiters = CommitWaiters(loop)
+    first = commit_waiters.wait('a')
+    second = commit_waiters.wait('a')
+    other = commit_waiters.wait('b')
+    assert len(commit_waiters) == 3
+
+    commit_waiters.resolve({'height': 3, 'transactions': [{'id': 'a'}]})
+    assert first.result() == 3
+    assert second.result() == 3
+    assert not other.done()
+
+    commit_waiters.discard('b', other)
+    assert len(commit_waiters) == 0
+
+
+@asyncio.coroutine
+def test_commit_endpoint_waits_for_the_block(test_client, loop):
+    from bigchaindb import events
+    from bigchaindb.web.websocket_server import (init_app, POISON_PILL,
+                                                 COMMIT_ENDPOINT)
+    from bigchaindb.models import Transaction
+    from bigchaindb.common import crypto
+
+    user_priv, user_pub = crypto.generate_key_pair()
+    tx = Transaction.create([user_pub], [([user_pub], 1)])
+    tx = tx.sign([user_priv]).to_dict()
+
+    event_source = asyncio.Queue(loop=loop)
+    app = init_app(event_source, loop=loop)
+    calls = []
+
+    class MockTendermint:
+        @asyncio.coroutine
+        def call(self, method, *params):
+            calls.append(method)
+            block = {'height': 1, 'transactions': [tx]}
+            yield from event_source.put(
+                events.Event(events.EventTypes.BLOCK_VALID, block))
+            return {'result': {'code': 0}}
+
+        def close(self):
+            pass
+
+    app['tendermint'] = MockTendermint()
+    client = yield from test_client(app)
+
+    response = yield from client.post(COMMIT_ENDPOINT, data=json.dumps(tx))
+    assert response.status == 202
+    assert (yield from response.json()) == tx
+    assert calls == ['broadcast_tx_sync']
+    assert len(app['commit_waiters']) == 0
+
+    yield from event_source.put(POISON_PILL)
+
+
 @pytest.mark.skip('Processes are not stopping properly, and the whole test suite would hang')
 @pytest.mark.genesis
 def test_integration_from_webapi_to_websocket(monkeypatch, client, loop):